@@ -11,6 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-import importlib_metadata
+from typing import Any
 
-__version__ = importlib_metadata.version("sagemaker-mlflow")
+from sagemaker_mlflow.warmup import maybe_prewarm_from_env
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access: mlflow imports this package for its entry points, and
+    # reading the distribution metadata would slow down every mlflow import.
+    if name == "__version__":
+        import importlib_metadata
+
+        version = importlib_metadata.version("sagemaker-mlflow")
+        globals()["__version__"] = version
+        return version
+    if name in ("prewarm", "prewarm_in_background"):
+        from sagemaker_mlflow import warmup
+
+        return getattr(warmup, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# mlflow imports this package while registering its plugins, long before the first
+# tracking request, so an env-requested prewarm does not race that request.
+maybe_prewarm_from_env()
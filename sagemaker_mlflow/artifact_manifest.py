@@ -0,0 +1,210 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR_ENV_VAR = "SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR"
+
+_MANIFEST_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+_MAX_HASH_WORKERS = 16
+_MAX_SCAN_WORKERS = 32
+
+
+class ManifestEntry(NamedTuple):
+    """Local file state recorded when an artifact was last uploaded."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+def default_manifest_dir() -> str:
+    """Directory holding upload manifests, honouring XDG_CACHE_HOME."""
+    configured = os.environ.get(_SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR_ENV_VAR)
+    if configured:
+        return configured
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "sagemaker_mlflow", "manifests")
+
+
+def _scan_one(directory: str) -> Tuple[List[Tuple[str, os.stat_result]], List[str]]:
+    files = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk, symlinked directories are not descended into.
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                files.append((entry.path, entry.stat()))
+    return files, subdirs
+
+
+def scan_directory(local_dir: str, max_workers: Optional[int] = None) -> List[Tuple[str, os.stat_result]]:
+    """List every file under ``local_dir`` with its stat, scanning directories in parallel.
+
+    On network filesystems, where each directory listing and stat is a round trip,
+    scanning sibling directories concurrently hides most of that latency.
+
+    Returns:
+        (local_file, stat_result) pairs sorted by path.
+    """
+    workers = max_workers or min(_MAX_SCAN_WORKERS, (os.cpu_count() or 1) * 2)
+    results: List[Tuple[str, os.stat_result]] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SageMakerArtifactScan") as executor:
+        pending = {executor.submit(_scan_one, local_dir)}
+        while pending:
+            done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+            pending = set(not_done)
+            for future in done:
+                files, subdirs = future.result()
+                results.extend(files)
+                pending.update(executor.submit(_scan_one, subdir) for subdir in subdirs)
+    return sorted(results, key=lambda result: result[0])
+
+
+def hash_file(local_file: str) -> str:
+    """Return the hex SHA-256 of a file, read in 1 MiB chunks."""
+    checksum = hashlib.sha256()
+    with open(local_file, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+class ArtifactManifest:
+    """Thread-safe record of uploaded files for one artifact URI, persisted as JSON.
+
+    The manifest maps each artifact path (relative to the artifact URI) to the size,
+    modification time and SHA-256 of the local file that was uploaded there. A file
+    whose size and mtime match its entry is assumed unchanged without being read; a
+    file whose mtime moved but whose hash matches is also skipped. The manifest only
+    reflects uploads made from this machine, so objects changed remotely by other
+    writers are not detected.
+    """
+
+    def __init__(self, artifact_uri: str, manifest_dir: Optional[str] = None) -> None:
+        key = hashlib.sha256(artifact_uri.encode("utf-8")).hexdigest()
+        self.artifact_uri = artifact_uri
+        self.path = os.path.join(manifest_dir or default_manifest_dir(), f"{key}.json")
+        self._entries: Optional[Dict[str, ManifestEntry]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        if self._entries is not None:
+            return self._entries
+        entries: Dict[str, ManifestEntry] = {}
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == _MANIFEST_VERSION and data.get("artifact_uri") == self.artifact_uri:
+                entries = {path: ManifestEntry(*entry) for path, entry in data["entries"].items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable artifact manifest %s", self.path, exc_info=True)
+        self._entries = entries
+        return entries
+
+    def get(self, artifact_path: str) -> Optional[ManifestEntry]:
+        with self._lock:
+            return self._load().get(artifact_path)
+
+    def record(self, artifact_path: str, entry: ManifestEntry) -> None:
+        with self._lock:
+            self._load()[artifact_path] = entry
+
+    def remove(self, artifact_path: str) -> None:
+        with self._lock:
+            self._load().pop(artifact_path, None)
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return list(self._load())
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk."""
+        with self._lock:
+            data = {
+                "version": _MANIFEST_VERSION,
+                "artifact_uri": self.artifact_uri,
+                "entries": {path: list(entry) for path, entry in self._load().items()},
+            }
+            manifest_dir = os.path.dirname(self.path)
+            os.makedirs(manifest_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def find_changed(
+        self,
+        files: Sequence[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        hash_new: bool = True,
+        stats: Optional[Sequence[os.stat_result]] = None,
+    ) -> List[Tuple[int, ManifestEntry]]:
+        """Return the files that differ from the manifest, hashing candidates in parallel.
+
+        Args:
+            files: Sequence of (local_file, artifact_path) pairs.
+            max_workers: Number of hashing threads. Defaults to the CPU count, capped at 16.
+            hash_new: Whether to hash files without a manifest entry. When False their
+                entries carry an empty ``sha256``, for the caller to fill in, e.g. from a
+                checksum computed during the upload.
+            stats: Stat results for ``files``, if already known, e.g. from scan_directory.
+
+        Returns:
+            A list of (index into ``files``, new ManifestEntry) for every new or changed
+            file. Unchanged files whose mtime moved have their entry refreshed in place.
+        """
+        candidates = []
+        changed = []
+        for index, (local_file, artifact_path) in enumerate(files):
+            stat = stats[index] if stats is not None else os.stat(local_file)
+            entry = self.get(artifact_path)
+            if entry is None and not hash_new:
+                changed.append((index, ManifestEntry(stat.st_size, stat.st_mtime_ns, "")))
+                continue
+            if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+                continue
+            candidates.append((index, stat, entry))
+
+        if not candidates:
+            return changed
+        workers = max_workers or min(_MAX_HASH_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SageMakerArtifactHash") as executor:
+            digests = list(executor.map(lambda candidate: hash_file(files[candidate[0]][0]), candidates))
+
+        for (index, stat, entry), digest in zip(candidates, digests):
+            new_entry = ManifestEntry(stat.st_size, stat.st_mtime_ns, digest)
+            if entry is not None and entry.size == new_entry.size and entry.sha256 == digest:
+                self.record(files[index][1], new_entry)
+            else:
+                changed.append((index, new_entry))
+        return sorted(changed, key=lambda change: change[0])
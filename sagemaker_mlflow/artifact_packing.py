@@ -0,0 +1,218 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Packing of many small artifacts into a few tar archives plus a JSON index.
+
+Layout, relative to the artifact directory the files were logged into::
+
+    .sagemaker-mlflow-packs/pack-<pack_id>-00000.tar
+    .sagemaker-mlflow-packs/pack-<pack_id>-00001.tar
+    .sagemaker-mlflow-packs/index-<pack_id>.json
+
+The archives are plain (uncompressed) tar files, so they can also be unpacked with
+standard tools. The index maps each packed file's path to its archive and the byte
+range of its data within it, which allows a single file to be read with one ranged
+GET. Pack ids sort by creation time; when several indexes list the same path, the
+most recent one wins.
+
+A new pack's index also carries over the entries of earlier packs in the same
+directory for files it does not replace, pointing into their archives. The newest
+index alone then describes the directory, and the writer deletes the indexes and
+archives it superseded.
+"""
+
+import json
+import logging
+import os
+import posixpath
+import shutil
+import tarfile
+import time
+import uuid
+from typing import Container, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PACK_DIR_NAME = ".sagemaker-mlflow-packs"
+
+_INDEX_VERSION = 1
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class PackedFile(NamedTuple):
+    """Location of a packed file's data within its archive."""
+
+    archive: str
+    offset: int
+    size: int
+
+
+def new_pack_id() -> str:
+    """Return a pack id that sorts by creation time."""
+    return f"{int(time.time() * 1000):013d}-{uuid.uuid4().hex[:8]}"
+
+
+def is_index_name(name: str) -> bool:
+    return name.startswith("index-") and name.endswith(".json")
+
+
+def pack_files(
+    files: Sequence[Tuple[str, str]],
+    out_dir: str,
+    max_archive_bytes: int,
+    pack_id: Optional[str] = None,
+    carried: Optional[Mapping[str, PackedFile]] = None,
+) -> Tuple[List[str], str]:
+    """Stream files into size-bounded tar archives and write their index.
+
+    Args:
+        files: Sequence of (local_file, relative_path) pairs. ``relative_path`` is the
+            POSIX path of the file relative to the artifact directory.
+        out_dir: Local directory in which archives and the index are written.
+        max_archive_bytes: Archives are closed once adding the next file would take them
+            past this size. A single file larger than the limit gets its own archive.
+        pack_id: Identifier shared by the archives and index. Generated if omitted.
+        carried: Entries of earlier packs to keep in the index, by relative path. Paths
+            also in ``files`` are replaced; the others keep pointing into their own
+            archives, which must stay in place.
+
+    Returns:
+        A tuple of (archive paths, index path), all inside ``out_dir``.
+    """
+    pack_id = pack_id or new_pack_id()
+    archive_paths: List[str] = []
+    entries: Dict[str, List] = {}
+    tar: Optional[tarfile.TarFile] = None
+    try:
+        for local_file, relative_path in files:
+            size = os.path.getsize(local_file)
+            if tar is None or (tar.offset > 0 and tar.offset + size > max_archive_bytes):
+                if tar is not None:
+                    tar.close()
+                archive_paths.append(os.path.join(out_dir, f"pack-{pack_id}-{len(archive_paths):05d}.tar"))
+                tar = tarfile.open(archive_paths[-1], mode="w")
+            tarinfo = tar.gettarinfo(local_file, arcname=relative_path)
+            header_size = len(tarinfo.tobuf(tar.format, tar.encoding, tar.errors))
+            data_offset = tar.offset + header_size
+            with open(local_file, "rb") as f:
+                tar.addfile(tarinfo, f)
+            entries[relative_path] = [len(archive_paths) - 1, data_offset, tarinfo.size]
+    finally:
+        if tar is not None:
+            tar.close()
+
+    archives = [os.path.basename(path) for path in archive_paths]
+    positions = {archive: i for i, archive in enumerate(archives)}
+    for relative_path, packed in (carried or {}).items():
+        if relative_path in entries:
+            continue
+        if packed.archive not in positions:
+            positions[packed.archive] = len(archives)
+            archives.append(packed.archive)
+        entries[relative_path] = [positions[packed.archive], packed.offset, packed.size]
+
+    index_path = os.path.join(out_dir, f"index-{pack_id}.json")
+    with open(index_path, "w") as f:
+        json.dump(
+            {
+                "version": _INDEX_VERSION,
+                "archives": archives,
+                "files": entries,
+            },
+            f,
+        )
+    return archive_paths, index_path
+
+
+def parse_index(data: bytes) -> Dict[str, PackedFile]:
+    """Parse an index document into a mapping of relative path to PackedFile."""
+    index = json.loads(data)
+    if index.get("version") != _INDEX_VERSION:
+        raise ValueError(f"Unsupported artifact pack index version: {index.get('version')}")
+    archives = index["archives"]
+    for archive in archives:
+        if posixpath.basename(archive) != archive or archive in ("", ".", ".."):
+            raise ValueError(f"Invalid archive name in artifact pack index: {archive}")
+    return {path: PackedFile(archives[entry[0]], entry[1], entry[2]) for path, entry in index["files"].items()}
+
+
+def _copy_range(src_path: str, offset: int, size: int, dst_path: str) -> None:
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        src.seek(offset)
+        remaining = size
+        while remaining:
+            chunk = src.read(min(_COPY_BUFFER_SIZE, remaining))
+            if not chunk:
+                raise IOError(f"Artifact pack {src_path} is truncated")
+            dst.write(chunk)
+            remaining -= len(chunk)
+
+
+def unpack_pack_dir(pack_dir: str) -> int:
+    """Extract the files listed by the indexes in a downloaded pack directory.
+
+    Files are written next to the pack directory, at their original relative paths.
+    Files that already exist are left untouched, so objects that were uploaded
+    individually take precedence over packed copies of the same path. The pack
+    directory is removed afterwards.
+
+    Returns:
+        The number of files extracted.
+    """
+    return len(extract_pack_dir(pack_dir))
+
+
+def extract_pack_dir(pack_dir: str, skip: Container[str] = ()) -> List[str]:
+    """Like unpack_pack_dir, but return the local paths of the extracted files.
+
+    Local paths in ``skip`` are not extracted either, e.g. because an individually
+    uploaded object of the same path is still being downloaded.
+    """
+    target_dir = os.path.dirname(os.path.abspath(pack_dir))
+    merged: Dict[str, PackedFile] = {}
+    for name in sorted(os.listdir(pack_dir)):
+        if is_index_name(name):
+            with open(os.path.join(pack_dir, name), "rb") as f:
+                merged.update(parse_index(f.read()))
+
+    extracted = []
+    for relative_path, packed in merged.items():
+        local_path = os.path.abspath(os.path.join(target_dir, os.path.normpath(relative_path)))
+        if os.path.commonpath([target_dir, local_path]) != target_dir:
+            raise ValueError(f"Packed artifact path escapes the download directory: {relative_path}")
+        if local_path in skip or os.path.exists(local_path):
+            continue
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        _copy_range(os.path.join(pack_dir, packed.archive), packed.offset, packed.size, local_path)
+        extracted.append(local_path)
+    shutil.rmtree(pack_dir)
+    return extracted
+
+
+def unpack_directory(root: str) -> int:
+    """Extract every pack directory found under ``root``. Returns the number of files."""
+    pack_dirs = [
+        os.path.join(dirpath, PACK_DIR_NAME) for dirpath, dirnames, _ in os.walk(root) if PACK_DIR_NAME in dirnames
+    ]
+    extracted = 0
+    # Deepest first, so nested packs are extracted before their parent directory is.
+    for pack_dir in sorted(pack_dirs, key=len, reverse=True):
+        extracted += unpack_pack_dir(pack_dir)
+    if extracted:
+        logger.debug("Extracted %d packed artifacts under %s", extracted, root)
+    return extracted
+
+
+def pack_dir_path(artifact_dir: Optional[str]) -> str:
+    """Artifact path of the pack directory for files logged under ``artifact_dir``."""
+    return posixpath.join(artifact_dir, PACK_DIR_NAME) if artifact_dir else PACK_DIR_NAME
@@ -11,17 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
-from typing import Optional
-import boto3
+from typing import Any, Optional
 from requests.auth import AuthBase
-from requests.models import PreparedRequest
+from requests.models import PreparedRequest, Response
+import datetime
+import logging
 import os
 
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
 from hashlib import sha256
 import functools
+from sagemaker_mlflow.auth_retry import (
+    AUTH_FAILURE_CLOCK_SKEW,
+    AUTH_FAILURE_STATUS_CODES,
+    classify_auth_failure,
+    get_auth_retry_state,
+)
 from sagemaker_mlflow.credential_cache import CredentialCache
+from sagemaker_mlflow.credential_provider import get_credential_provider
+from sagemaker_mlflow.request_compression import load_request_compression
+from sagemaker_mlflow.request_rate_limiter import get_request_rate_limiter
+
+logger = logging.getLogger(__name__)
 
 PAYLOAD_BUFFER = 1024 * 1024
 # Hardcode SHA256 hash for empty string to reduce latency for requests without a body
@@ -31,6 +41,32 @@ EMPTY_SHA256_HASH = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b785
 DEFAULT_CREDENTIAL_TTL_SECONDS = 3300
 
 
+@functools.lru_cache(maxsize=None)
+def _clock_corrected_sigv4_auth() -> type:
+    # Defined on first use, like the other botocore imports in this module.
+    from botocore.auth import SIGV4_TIMESTAMP, SigV4Auth
+
+    class ClockCorrectedSigV4Auth(SigV4Auth):
+        """SigV4Auth that signs with the clock offset learned from clock skew rejections."""
+
+        def _modify_request_before_signing(self, request: Any) -> None:
+            offset = get_auth_retry_state().clock_offset
+            if offset:
+                signed_at = datetime.datetime.strptime(request.context["timestamp"], SIGV4_TIMESTAMP)
+                signed_at += datetime.timedelta(seconds=offset)
+                request.context["timestamp"] = signed_at.strftime(SIGV4_TIMESTAMP)
+            super()._modify_request_before_signing(request)
+
+    return ClockCorrectedSigV4Auth
+
+
+def _classify_auth_failure(response: Response) -> Optional[str]:
+    # Other responses, such as streamed downloads, must be left unread for the caller.
+    if response.status_code not in AUTH_FAILURE_STATUS_CODES:
+        return None
+    return classify_auth_failure(response.status_code, response.headers.get("x-amzn-ErrorType"), response.text)
+
+
 class AuthBoto(AuthBase):
     # Class-level credential cache shared across instances
     _credential_cache = CredentialCache()
@@ -43,22 +79,38 @@ class AuthBoto(AuthBase):
         :param assume_role_arn: ARN of the role to assume (optional)
         """
         self._assume_role_arn = assume_role_arn
+        self._service_name = service_name
         self.region = region
+        self._compression = load_request_compression()
+        self._rate_limiter = get_request_rate_limiter()
+        self._load_credentials()
+
+    def _load_credentials(self) -> None:
+        # boto3 and botocore are imported on first use: this module is loaded with the auth
+        # provider entry point, by every process that imports mlflow.
+        import boto3
 
-        if assume_role_arn is not None:
+        if self._assume_role_arn is not None:
             # Use cached or fresh assumed role credentials
-            credentials = self._get_cached_credentials(assume_role_arn)
+            self._assumed_credentials = self._get_cached_credentials(self._assume_role_arn)
             self.creds = boto3.Session(
-                aws_access_key_id=credentials["AccessKeyId"],
-                aws_secret_access_key=credentials["SecretAccessKey"],
-                aws_session_token=credentials["SessionToken"],
+                aws_access_key_id=self._assumed_credentials["AccessKeyId"],
+                aws_secret_access_key=self._assumed_credentials["SecretAccessKey"],
+                aws_session_token=self._assumed_credentials["SessionToken"],
             ).get_credentials()
         else:
-            # Use current session credentials
-            session = boto3.Session()
-            self.creds = session.get_credentials()
+            # Process-wide credentials, resolved once rather than per signer
+            self.creds = get_credential_provider().get_credentials()
 
-        self.sigv4 = SigV4Auth(self.creds, service_name, self.region)
+        self.sigv4 = _clock_corrected_sigv4_auth()(self.creds, self._service_name, self.region)
+
+    def _refresh_credentials(self) -> None:
+        """Drop the credentials this signer used, wherever they are cached, and load new ones."""
+        if self._assume_role_arn is not None:
+            self._credential_cache.invalidate(self._assume_role_arn, self._assumed_credentials)
+        else:
+            get_credential_provider().invalidate(self.creds)
+        self._load_credentials()
 
     def _get_cached_credentials(self, assume_role_arn: str) -> dict:
         """
@@ -73,6 +125,8 @@ class AuthBoto(AuthBase):
             return cached_credentials
 
         # Cache miss - fetch new credentials via STS
+        import boto3
+
         session = boto3.Session()
         sts_client = session.client("sts")
         assumed_role_object = sts_client.assume_role(RoleArn=assume_role_arn, RoleSessionName="AuthBotoSagemakerMlFlow")
@@ -94,6 +148,15 @@ class AuthBoto(AuthBase):
         :param r: PreparedRequest Base mlflow request
         :return: PreparedRequest Request with SigV4 signed headers
         """
+        from botocore.awsrequest import AWSRequest
+
+        if not getattr(r, "_sagemaker_mlflow_auth_retry", False):
+            r.register_hook("response", self._retry_auth_failure)
+            if self._rate_limiter is not None:
+                r.register_hook("response", self._rate_limiter.record_response)
+        if self._rate_limiter is not None:
+            # Waits before signing, so the signature is not aged by the wait.
+            self._rate_limiter.acquire(r)
 
         url = r.url
         method = r.method
@@ -104,6 +167,14 @@ class AuthBoto(AuthBase):
         body_bytes = request_body or b""
         if isinstance(body_bytes, str):
             body_bytes = body_bytes.encode("utf-8")
+        # Compressed before signing, so the payload hash covers the bytes on the wire. A
+        # retried request is already encoded.
+        if self._compression is not None and isinstance(body_bytes, bytes) and "Content-Encoding" not in headers:
+            compressed = self._compression.compress(body_bytes)
+            if compressed is not None:
+                body_bytes = request_body = compressed
+                headers["Content-Encoding"] = self._compression.encoding
+                headers["Content-Length"] = str(len(compressed))
         headers["X-Amz-Content-SHA256"] = self.get_request_body_header(body_bytes)
 
         # SageMaker Mlflow strips out this header before auth.
@@ -117,16 +188,51 @@ class AuthBoto(AuthBase):
             url = (url or "").replace("+", "%20")
 
         # Creating a new request with the SigV4 signed headers.
-        aws_request = AWSRequest(method=method, url=url, data=r.body, headers=headers)
+        aws_request = AWSRequest(method=method, url=url, data=request_body, headers=headers)
         self.sigv4.add_auth(aws_request)
 
         # Adding back in the connection header.
         final_headers = aws_request.headers
         final_headers["Connection"] = connection_header
-        final_request = AWSRequest(method=method, url=url, data=r.body, headers=final_headers)
+        final_request = AWSRequest(method=method, url=url, data=request_body, headers=final_headers)
 
         return final_request.prepare()
 
+    def _retry_auth_failure(self, response: Response, **kwargs: Any) -> Response:
+        """Response hook re-sending a request once if it was rejected for expired
+        credentials or clock skew, after refreshing the credentials or correcting the
+        signing clock from the response's Date header.
+        :param response: Response to the signed request
+        :param kwargs: Transport arguments the request was sent with
+        :return: Response to the retried request, or the original response
+        """
+        kind = _classify_auth_failure(response)
+        if kind is None:
+            return response
+        state = get_auth_retry_state()
+        state.record_failure(kind)
+        request = response.request
+        if hasattr(request.body, "read"):
+            # A streamed body has been consumed and cannot be sent again.
+            return response
+        if kind == AUTH_FAILURE_CLOCK_SKEW:
+            if not state.correct_clock(response.headers.get("Date")):
+                return response
+        else:
+            logger.info("Credentials for %s expired, refreshing them and retrying", request.url)
+            self._refresh_credentials()
+
+        # Release the connection back to the pool before sending the retry.
+        response.close()
+        retry = request.copy()
+        retry._sagemaker_mlflow_auth_retry = True  # type: ignore[attr-defined]
+        retry.__dict__.update(self(retry).__dict__)
+        retried = response.connection.send(retry, **kwargs)
+        retried.history.append(response)
+        retried.request = retry
+        state.record_retry(_classify_auth_failure(retried) is None)
+        return retried
+
     def get_request_body_header(self, request_body: bytes):
         """Stripped down version of the botocore method.
         :param request_body: request body
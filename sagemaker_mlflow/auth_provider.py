@@ -42,7 +42,11 @@ class AuthProvider:
             AuthBoto: Callback Object which will calculate the header just before request submission.
         """
 
-        self.host_metadata_provider.set_arn(get_tracking_uri())
+        return self._get_auth_for_arn(get_tracking_uri())
+
+    def _get_auth_for_arn(self, arn: str) -> AuthBoto:
+        """Returns the SigV4 callback for requests to the given SageMaker MLflow ARN."""
+        self.host_metadata_provider.set_arn(arn)
         assume_role_arn = os.environ.get("SAGEMAKER_MLFLOW_ASSUME_ROLE_ARN")
         return AuthBoto(self.host_metadata_provider.region, self._get_auth_service_name(), assume_role_arn)
 
@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+AUTH_FAILURE_EXPIRED_CREDENTIALS = "expired_credentials"
+AUTH_FAILURE_CLOCK_SKEW = "clock_skew"
+
+# Statuses of a SigV4 rejection. Only responses with one of them have their body read.
+AUTH_FAILURE_STATUS_CODES = frozenset([400, 401, 403])
+
+# Markers in the error type header or message of a SigV4 rejection, lowercased. Other
+# signature errors, such as a signature mismatch, would fail again when re-signed.
+_EXPIRED_CREDENTIALS_MARKERS = (
+    "expiredtoken",
+    "security token included in the request is expired",
+    "token has expired",
+)
+_CLOCK_SKEW_MARKERS = (
+    "signature expired",
+    "signature not yet current",
+    "requesttimetooskewed",
+    "requestexpired",
+)
+
+
+def classify_auth_failure(status_code: int, error_type: Optional[str], message: str) -> Optional[str]:
+    """Tell whether a rejected request may succeed once re-signed.
+
+    Args:
+        status_code: HTTP status of the response.
+        error_type: The x-amzn-ErrorType header, if any.
+        message: The response body.
+
+    Returns:
+        AUTH_FAILURE_EXPIRED_CREDENTIALS if the credentials expired,
+        AUTH_FAILURE_CLOCK_SKEW if the signing time was outside the server's window,
+        or None for any other response.
+    """
+    if status_code not in AUTH_FAILURE_STATUS_CODES:
+        return None
+    text = f"{error_type or ''} {message}".lower()
+    if any(marker in text for marker in _EXPIRED_CREDENTIALS_MARKERS):
+        return AUTH_FAILURE_EXPIRED_CREDENTIALS
+    if any(marker in text for marker in _CLOCK_SKEW_MARKERS):
+        return AUTH_FAILURE_CLOCK_SKEW
+    return None
+
+
+class AuthRetryState:
+    """Process-wide clock offset used for signing, and counters of auth retries.
+
+    The offset is the server's clock minus the local one, measured from the Date header
+    of a response that rejected a request for clock skew. Every signer adds it to the
+    signing time from then on.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clock_offset = 0.0
+        self._failures: Dict[str, int] = {AUTH_FAILURE_EXPIRED_CREDENTIALS: 0, AUTH_FAILURE_CLOCK_SKEW: 0}
+        self._retries = 0
+        self._retry_failures = 0
+
+    @property
+    def clock_offset(self) -> float:
+        """Seconds to add to the local clock when signing."""
+        return self._clock_offset
+
+    def record_failure(self, kind: str) -> None:
+        with self._lock:
+            self._failures[kind] += 1
+
+    def correct_clock(self, date_header: Optional[str]) -> bool:
+        """Adopt the offset between the server's Date header and the local clock.
+
+        Returns:
+            False if the header is missing or unparseable.
+        """
+        try:
+            server_time = parsedate_to_datetime(date_header).timestamp() if date_header else None
+        except (TypeError, ValueError):
+            server_time = None
+        if server_time is None:
+            return False
+        offset = server_time - time.time()
+        with self._lock:
+            self._clock_offset = offset
+        logger.warning("Request signing time rejected by the server, correcting for a clock offset of %.0fs", offset)
+        return True
+
+    def record_retry(self, succeeded: bool) -> None:
+        with self._lock:
+            self._retries += 1
+            if not succeeded:
+                self._retry_failures += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return counters of auth failures and retries, and the current clock offset."""
+        with self._lock:
+            return {
+                "expired_credentials": self._failures[AUTH_FAILURE_EXPIRED_CREDENTIALS],
+                "clock_skew": self._failures[AUTH_FAILURE_CLOCK_SKEW],
+                "retries": self._retries,
+                "retry_failures": self._retry_failures,
+                "clock_offset_seconds": self._clock_offset,
+            }
+
+    def _reset_after_fork(self) -> None:
+        # The clock offset and counters carry over; only the lock is new.
+        self._lock = threading.Lock()
+
+
+_state: Optional[AuthRetryState] = None
+_state_lock = threading.Lock()
+
+
+def get_auth_retry_state() -> AuthRetryState:
+    """Return the process-wide auth retry state shared by AuthBoto signers."""
+    global _state
+    with _state_lock:
+        if _state is None:
+            _state = AuthRetryState()
+        return _state
+
+
+def _after_fork_in_child() -> None:
+    global _state_lock
+    _state_lock = threading.Lock()
+    if _state is not None:
+        _state._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
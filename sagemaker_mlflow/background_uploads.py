@@ -0,0 +1,235 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional
+
+from sagemaker_mlflow.bandwidth_limiter import PRIORITY_BULK, current_priority, default_upload_priority, upload_priority
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_STAGED_BYTES_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_STAGED_BYTES"
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_STAGING_DIR_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_STAGING_DIR"
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_BACKGROUND_WORKERS_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_BACKGROUND_WORKERS"
+
+DEFAULT_MAX_STAGED_BYTES = 4 * 1024 * 1024 * 1024
+DEFAULT_BACKGROUND_WORKERS = 2
+
+
+class BackgroundUploadError(MlflowSageMakerException):
+    def __init__(self, failures: Dict[str, BaseException]):
+        details = "\n".join(f"{path}: {error}" for path, error in failures.items())
+        super().__init__(f"{len(failures)} background artifact uploads failed:\n{details}")
+        self.failures = failures
+
+
+def _path_size(local_path: str) -> int:
+    if os.path.isdir(local_path):
+        return sum(
+            os.path.getsize(os.path.join(root, filename))
+            for root, _, filenames in os.walk(local_path)
+            for filename in filenames
+        )
+    return os.path.getsize(local_path)
+
+
+class BackgroundUploader:
+    """Bounded queue that uploads staged copies of artifacts on worker threads.
+
+    Each submission copies the file or directory to a private staging directory
+    before returning, so callers may delete, replace or rewrite the original in place
+    (mlflow removes its temporary files as soon as log_artifact returns, and training
+    loops overwrite checkpoints under the same path). The upload sends the bytes the
+    file held at submission. The total size of staged,
+    not yet uploaded data is capped at ``max_staged_bytes``: submissions block until
+    enough earlier uploads have finished. An item larger than the cap is admitted
+    once nothing else is staged.
+    """
+
+    def __init__(
+        self,
+        max_staged_bytes: int = DEFAULT_MAX_STAGED_BYTES,
+        max_workers: int = DEFAULT_BACKGROUND_WORKERS,
+        staging_dir: Optional[str] = None,
+    ) -> None:
+        self.max_staged_bytes = max_staged_bytes
+        self._max_workers = max_workers
+        self._staging_dir = staging_dir
+        self._staged_bytes = 0
+        self._cond = threading.Condition()
+        self._pending: Dict[Future, Optional[str]] = {}
+        self._labels: Dict[Future, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SageMakerBackgroundUpload")
+
+    @property
+    def staged_bytes(self) -> int:
+        return self._staged_bytes
+
+    def _reserve(self, size: int) -> None:
+        with self._cond:
+            while self._staged_bytes > 0 and self._staged_bytes + size > self.max_staged_bytes:
+                self._cond.wait()
+            self._staged_bytes += size
+
+    def _release(self, size: int) -> None:
+        with self._cond:
+            self._staged_bytes -= size
+            self._cond.notify_all()
+
+    def _run(
+        self,
+        upload: Callable[[str], None],
+        staged_path: str,
+        staged_root: str,
+        size: int,
+        priority: Optional[int],
+    ) -> None:
+        try:
+            # Background uploads yield bandwidth to foreground ones unless the submitter
+            # chose a priority.
+            if priority is None:
+                with default_upload_priority(PRIORITY_BULK):
+                    upload(staged_path)
+            else:
+                with upload_priority(priority):
+                    upload(staged_path)
+        finally:
+            shutil.rmtree(staged_root, ignore_errors=True)
+            self._release(size)
+
+    def _on_done(self, future: Future) -> None:
+        # Successful uploads are forgotten right away; failures are kept for wait_all.
+        if not future.cancelled() and future.exception() is None:
+            with self._cond:
+                self._pending.pop(future, None)
+                self._labels.pop(future, None)
+
+    def submit(self, local_path: str, upload: Callable[[str], None], run_id: Optional[str] = None) -> Future:
+        """Stage ``local_path`` and schedule ``upload(staged_path)`` in the background.
+
+        The staged copy keeps the base name of ``local_path``, so uploads that derive
+        artifact paths from it behave as they would for the original.
+
+        Args:
+            local_path: File or directory to upload.
+            upload: Callable performing the upload from the staged path.
+            run_id: Run the upload belongs to, used to scope ``wait_all``.
+
+        Returns:
+            A Future that resolves once the upload finished.
+        """
+        size = _path_size(local_path)
+        self._reserve(size)
+        staged_root = None
+        try:
+            staged_root = tempfile.mkdtemp(prefix="sagemaker-mlflow-upload-", dir=self._staging_dir)
+            staged_path = os.path.join(staged_root, os.path.basename(os.path.normpath(local_path)))
+            if os.path.isdir(local_path):
+                shutil.copytree(local_path, staged_path)
+            else:
+                shutil.copy2(local_path, staged_path)
+            future = self._executor.submit(self._run, upload, staged_path, staged_root, size, current_priority())
+        except BaseException:
+            if staged_root is not None:
+                shutil.rmtree(staged_root, ignore_errors=True)
+            self._release(size)
+            raise
+        with self._cond:
+            self._pending[future] = run_id
+            self._labels[future] = local_path
+        future.add_done_callback(self._on_done)
+        return future
+
+    def wait_all(self, run_id: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        """Block until queued uploads (optionally only those of ``run_id``) finish.
+
+        Raises:
+            BackgroundUploadError: If any of the awaited uploads failed. Failed uploads
+                are reported once and then forgotten.
+        """
+        with self._cond:
+            futures = [future for future, owner in self._pending.items() if run_id is None or owner == run_id]
+        _, not_done = wait(futures, timeout=timeout)
+        failures = {}
+        with self._cond:
+            for future in futures:
+                if future in not_done:
+                    continue
+                error = None if future.cancelled() else future.exception()
+                if error is not None:
+                    failures[self._labels.get(future, "<unknown>")] = error
+                self._pending.pop(future, None)
+                self._labels.pop(future, None)
+        if failures:
+            raise BackgroundUploadError(failures)
+        if not_done:
+            raise MlflowSageMakerException(f"{len(not_done)} background artifact uploads did not finish in time")
+
+
+_uploader: Optional[BackgroundUploader] = None
+_uploader_lock = threading.Lock()
+
+
+def get_background_uploader() -> BackgroundUploader:
+    """Return the process-wide background uploader, creating it on first use."""
+    global _uploader
+    with _uploader_lock:
+        if _uploader is None:
+            max_staged_bytes = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_STAGED_BYTES_ENV_VAR, parse_size)
+            max_workers = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_BACKGROUND_WORKERS_ENV_VAR, int)
+            _uploader = BackgroundUploader(
+                max_staged_bytes=DEFAULT_MAX_STAGED_BYTES if max_staged_bytes is None else max_staged_bytes,
+                max_workers=DEFAULT_BACKGROUND_WORKERS if max_workers is None else max_workers,
+                staging_dir=os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_STAGING_DIR_ENV_VAR),
+            )
+            atexit.register(_flush_at_exit)
+        return _uploader
+
+
+def flush_background_uploads(run_id: Optional[str] = None) -> None:
+    """Wait for background uploads without raising; failures are logged.
+
+    Used where an upload failure must not abort the caller, such as ending a run or
+    interpreter shutdown. A no-op if no background upload was ever submitted.
+    """
+    uploader = _uploader
+    if uploader is None:
+        return
+    try:
+        uploader.wait_all(run_id)
+    except MlflowSageMakerException as e:
+        logger.error("%s", e)
+
+
+def _flush_at_exit() -> None:
+    flush_background_uploads()
+
+
+def _after_fork_in_child() -> None:
+    # Pending uploads, their staged files and the worker threads belong to the parent,
+    # which still completes them; the child starts a new uploader on first use.
+    global _uploader, _uploader_lock
+    _uploader = None
+    _uploader_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,215 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_BYTES_PER_SECOND_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_BYTES_PER_SECOND"
+
+# Priority classes, most urgent first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BULK = 2
+
+# Uploads up to this size default to PRIORITY_HIGH: parameters, metrics files, tags.
+SMALL_UPLOAD_BYTES = 1024 * 1024
+
+_MIN_BURST_BYTES = 1024 * 1024
+
+_local = threading.local()
+
+
+@contextmanager
+def upload_priority(priority: int) -> Iterator[None]:
+    """Give presigned uploads started by this thread within the block a priority class.
+
+    Background uploads submitted within the block keep the priority.
+    """
+    previous = getattr(_local, "priority", None)
+    _local.priority = priority
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+
+@contextmanager
+def default_upload_priority(priority: int) -> Iterator[None]:
+    """Like upload_priority, but small uploads still default to PRIORITY_HIGH."""
+    previous = getattr(_local, "default_priority", None)
+    _local.default_priority = priority
+    try:
+        yield
+    finally:
+        _local.default_priority = previous
+
+
+def current_priority() -> Optional[int]:
+    """The priority set with upload_priority on this thread, if any."""
+    return getattr(_local, "priority", None)
+
+
+def resolve_priority(size: int) -> int:
+    """Priority class of an upload of ``size`` bytes started by this thread."""
+    explicit = current_priority()
+    if explicit is not None:
+        return explicit
+    if size <= SMALL_UPLOAD_BYTES:
+        return PRIORITY_HIGH
+    default = getattr(_local, "default_priority", None)
+    return PRIORITY_NORMAL if default is None else default
+
+
+class BandwidthLimiter:
+    """Token bucket shared by all upload streams, with strict priority between classes.
+
+    Tokens (bytes) accrue at ``rate`` per second up to ``burst``. A stream may take a
+    block as long as the bucket is not in debt, even if the block is larger than what
+    is left, so blocks bigger than the burst size never stall; the debt is repaid before
+    the next block goes out. While a stream of a more urgent class is waiting, less
+    urgent ones do not take tokens. A rate of None disables limiting.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None) -> None:
+        self._cond = threading.Condition()
+        self._rate: Optional[float] = None
+        self._burst = 0.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self._waiting: Dict[int, int] = {}
+        self._bytes = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self.set_rate(rate, burst)
+
+    def _reset_after_fork(self) -> None:
+        # Waiting streams belonged to the parent's threads; the rate and any debt are kept.
+        self._cond = threading.Condition()
+        self._waiting = {}
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    def set_rate(self, rate: Optional[float], burst: Optional[float] = None) -> None:
+        """Change the limit in bytes per second; takes effect for blocks not yet sent.
+
+        ``burst`` defaults to a quarter second of traffic, and at least 1 MiB.
+        """
+        with self._cond:
+            self._refill()
+            self._rate = rate if rate else None
+            if self._rate is not None:
+                self._burst = float(burst) if burst else max(self._rate / 4, float(_MIN_BURST_BYTES))
+                self._tokens = min(self._tokens, self._burst) if self._tokens else self._burst
+            self._cond.notify_all()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _blocked(self, priority: int) -> bool:
+        if self._tokens <= 0:
+            return True
+        return any(count for waiting_priority, count in self._waiting.items() if waiting_priority < priority)
+
+    def acquire(self, nbytes: int, priority: int = PRIORITY_NORMAL) -> None:
+        """Block until ``nbytes`` may be sent by a stream of the given priority class."""
+        with self._cond:
+            self._refill()
+            if self._rate is not None and self._blocked(priority):
+                self._waits += 1
+                started = time.monotonic()
+                self._waiting[priority] = self._waiting.get(priority, 0) + 1
+                try:
+                    while self._rate is not None and self._blocked(priority):
+                        # Wake up when the debt is repaid. When only blocked behind a more
+                        # urgent stream, wait for it to notify us once it has gone ahead.
+                        self._cond.wait(-self._tokens / self._rate if self._tokens <= 0 else None)
+                        self._refill()
+                finally:
+                    self._waiting[priority] -= 1
+                    self._wait_seconds += time.monotonic() - started
+                    self._cond.notify_all()
+            if self._rate is not None:
+                self._tokens -= nbytes
+            self._bytes += nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "rate_bytes_per_second": self._rate,
+                "bytes_sent": self._bytes,
+                "throttled_blocks": self._waits,
+                "throttled_seconds": self._wait_seconds,
+            }
+
+
+class ThrottledReader:
+    """File-like wrapper that draws every block it returns from a BandwidthLimiter.
+
+    Like HashingReader, it exposes ``__len__`` so the body keeps its Content-Length.
+    """
+
+    def __init__(self, fileobj: Any, size: int, limiter: BandwidthLimiter, priority: int) -> None:
+        self._fileobj = fileobj
+        self._remaining = size
+        self._limiter = limiter
+        self._priority = priority
+
+    def read(self, size: int = -1) -> Any:
+        chunk = self._fileobj.read(size)
+        if chunk:
+            self._limiter.acquire(len(chunk), self._priority)
+            self._remaining -= len(chunk)
+        return chunk
+
+    def __len__(self) -> int:
+        return max(0, self._remaining)
+
+
+_limiter: Optional[BandwidthLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_bandwidth_limiter() -> BandwidthLimiter:
+    """Return the process-wide limiter shared by presigned uploads.
+
+    Its initial rate comes from SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_BYTES_PER_SECOND
+    (unlimited if unset); call set_rate on it to change the limit at runtime.
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = BandwidthLimiter(
+                env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_BYTES_PER_SECOND_ENV_VAR, parse_size)
+            )
+        return _limiter
+
+
+def _after_fork_in_child() -> None:
+    global _limiter_lock
+    _limiter_lock = threading.Lock()
+    if _limiter is not None:
+        _limiter._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
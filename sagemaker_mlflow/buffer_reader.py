@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import mmap
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Union
+
+logger = logging.getLogger(__name__)
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Below this size mapping a file costs more than it saves over buffered reads.
+MMAP_MIN_FILE_SIZE = 8 * 1024 * 1024
+
+
+class BufferReader:
+    """File-like reader over a bytes-like object that does not copy the data.
+
+    ``read`` returns memoryview slices of the underlying buffer, which the HTTP client
+    passes straight to the socket. ``__len__`` is the number of bytes left, so requests
+    sends the body with a Content-Length header.
+    """
+
+    def __init__(self, data: BytesLike) -> None:
+        view = memoryview(data)
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        self._view = view.cast("B")
+        self._position = 0
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._position + size)
+        chunk = self._view[self._position : end]
+        self._position = end
+        return chunk
+
+    def __len__(self) -> int:
+        return len(self._view) - self._position
+
+    def release(self) -> None:
+        """Release the view of the underlying buffer, e.g. before closing a mapping."""
+        self._position = len(self._view)
+        self._view.release()
+
+
+@contextmanager
+def map_file(fileobj: IO[bytes], size: int) -> Iterator[Any]:
+    """Yield a zero-copy reader over an open file, for use as a request body.
+
+    Files of at least MMAP_MIN_FILE_SIZE bytes are memory-mapped read-only and read
+    through a BufferReader, with the kernel told to expect sequential access so that
+    it reads ahead aggressively. Smaller files, and files that cannot be mapped (e.g.
+    on some network or FUSE filesystems), are yielded unchanged; the latter get the
+    same hint through posix_fadvise.
+    """
+    if size < MMAP_MIN_FILE_SIZE:
+        yield fileobj
+        return
+    try:
+        mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        logger.debug("Could not memory-map %s, reading it instead", getattr(fileobj, "name", fileobj), exc_info=True)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        yield fileobj
+        return
+    reader = None
+    try:
+        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        reader = BufferReader(memoryview(mapped))
+        yield reader
+    finally:
+        try:
+            if reader is not None:
+                reader.release()
+            mapped.close()
+        except BufferError:
+            # A slice is still referenced somewhere; the mapping is released with it.
+            pass
@@ -11,10 +11,14 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import os
 import threading
 import time
+import weakref
 from typing import Optional, Dict, Any
 
+_caches: "weakref.WeakSet[CredentialCache]" = weakref.WeakSet()
+
 
 class CredentialCache:
     """Thread-safe TTL cache for AWS STS assumed role credentials."""
@@ -22,6 +26,7 @@ class CredentialCache:
     def __init__(self) -> None:
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
+        _caches.add(self)
 
     def get_credentials(self, role_arn: str) -> Optional[Dict[str, Any]]:
         """
@@ -63,6 +68,20 @@ class CredentialCache:
             # Clean up expired entries periodically
             self._cleanup_expired()
 
+    def invalidate(self, role_arn: str, credentials: Dict[str, Any]) -> None:
+        """
+        Remove the cached credentials for the role if they are the given ones, e.g. after
+        the server rejected them as expired. Credentials cached since are kept.
+
+        Args:
+            role_arn (str): The ARN of the role the credentials were assumed for
+            credentials (Dict[str, Any]): The rejected credentials
+        """
+        with self._lock:
+            cached_entry = self._cache.get(role_arn)
+            if cached_entry is not None and cached_entry["credentials"] is credentials:
+                del self._cache[role_arn]
+
     def _cleanup_expired(self) -> None:
         """Remove expired entries from the cache to prevent memory leaks."""
         current_time = time.time()
@@ -75,3 +94,20 @@ class CredentialCache:
         """Clear all cached credentials. Useful for testing."""
         with self._lock:
             self._cache.clear()
+
+    def _reset_after_fork(self) -> None:
+        """Replace the lock, which another thread may have held at fork time.
+
+        Credentials that have not expired carry over to the child process.
+        """
+        self._lock = threading.Lock()
+        self._cleanup_expired()
+
+
+def _after_fork_in_child() -> None:
+    for cache in list(_caches):
+        cache._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,72 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import hashlib
+import os
+from typing import Any, Optional, Tuple
+
+# Environment that decides which credentials and region a client without explicit
+# credentials resolves.
+_AMBIENT_CREDENTIAL_ENV_VARS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_PROFILE",
+    "AWS_ROLE_ARN",
+    "AWS_WEB_IDENTITY_TOKEN_FILE",
+    "AWS_CONTAINER_CREDENTIALS_RELATIVE_URI",
+    "AWS_CONTAINER_CREDENTIALS_FULL_URI",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+)
+
+
+def _fingerprint(*values: Optional[str]) -> str:
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(b"\0" if value is None else value.encode("utf-8") + b"\1")
+    return digest.hexdigest()
+
+
+def _file_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.expanduser(path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+def credentials_identity(
+    access_key_id: Optional[str] = None,
+    secret_access_key: Optional[str] = None,
+    session_token: Optional[str] = None,
+) -> Tuple[Any, ...]:
+    """Identify the credentials a client will sign with, without resolving them.
+
+    Explicit credentials are identified by a hash of their values. Otherwise the client
+    resolves credentials itself from the environment and the shared config files, so
+    the relevant variables and the files' modification times stand in for them: a
+    rewritten credentials file or a new set of keys in the environment yields a new
+    client. Credentials that botocore refreshes on its own (instance and container
+    roles, web identity, SSO) keep the same identity.
+
+    Shared by the S3 client cache and the credential provider, so both pick up the
+    same changes.
+    """
+    if access_key_id or secret_access_key or session_token:
+        return ("explicit", _fingerprint(access_key_id, secret_access_key, session_token))
+    return (
+        "ambient",
+        _fingerprint(*(os.environ.get(name) for name in _AMBIENT_CREDENTIAL_ENV_VARS)),
+        _file_mtime(os.environ.get("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials")),
+        _file_mtime(os.environ.get("AWS_CONFIG_FILE", "~/.aws/config")),
+    )
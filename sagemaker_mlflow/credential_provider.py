@@ -0,0 +1,139 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sagemaker_mlflow.credential_identity import credentials_identity
+
+# Credentials carried over into a forked child are used until they are this close to
+# expiry (botocore's advisory refresh window), then resolved again in the child.
+_FORK_REFRESH_MARGIN_SECONDS = 15 * 60
+
+
+class SharedCredentialProvider:
+    """Process-wide AWS credentials for SigV4 signers, resolved once.
+
+    ``boto3.Session().get_credentials()`` walks the whole provider chain: environment,
+    shared config files, then the container and instance metadata endpoints, which are
+    network calls. This resolves the chain once and hands every signer the same
+    credentials object. Credentials from a metadata endpoint, web identity or SSO are
+    botocore RefreshableCredentials, which refresh themselves ahead of expiry; sharing
+    one object means one refresh for the whole process instead of one per signer.
+
+    The credentials are resolved again when the environment variables or shared config
+    files that select them change, as identified by credentials_identity. A lookup that
+    finds no credentials is not cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._credentials: Any = None
+        self._identity: Optional[Tuple[Any, ...]] = None
+        self._forked_from: Any = None
+        self._resolutions = 0
+        self._hits = 0
+
+    def get_credentials(self) -> Any:
+        """Return the shared botocore credentials, resolving them on first use.
+
+        Returns:
+            botocore Credentials, or None if the chain found none.
+        """
+        identity = credentials_identity()
+        with self._lock:
+            if (
+                self._credentials is not None
+                and self._identity == identity
+                and (
+                    self._forked_from is None
+                    or not self._forked_from.refresh_needed(_FORK_REFRESH_MARGIN_SECONDS)
+                )
+            ):
+                self._hits += 1
+                return self._credentials
+            # Resolved under the lock so concurrent first signers walk the chain once.
+            import boto3
+
+            self._resolutions += 1
+            self._credentials = boto3.Session().get_credentials()
+            self._identity = identity
+            self._forked_from = None
+            return self._credentials
+
+    def invalidate(self, credentials: Any) -> None:
+        """Forget the given credentials if they are still the shared ones.
+
+        Used when a server rejects them as expired. Concurrent signers hitting the same
+        rejection resolve the chain once, since later calls find newer credentials.
+        """
+        with self._lock:
+            if credentials is not None and self._credentials is credentials:
+                self._credentials = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"resolutions": self._resolutions, "hits": self._hits}
+
+    def clear(self) -> None:
+        """Forget the shared credentials so the next signer resolves them again."""
+        with self._lock:
+            self._credentials = None
+            self._identity = None
+            self._forked_from = None
+
+    def _reset_after_fork(self) -> None:
+        # Refreshable credentials hold a refresh lock another thread may have held at
+        # fork time, and fetch from metadata endpoints over a connection pool shared
+        # with the parent. The child keeps their current values as static credentials
+        # while they are valid, then resolves the chain with its own connections.
+        self._lock = threading.Lock()
+        credentials = self._credentials
+        if credentials is None or not hasattr(credentials, "refresh_needed"):
+            return
+        if credentials.refresh_needed() or credentials.refresh_needed(_FORK_REFRESH_MARGIN_SECONDS):
+            self._credentials = None
+            return
+        from botocore.credentials import Credentials
+
+        # Outside botocore's refresh window, so this neither takes the refresh lock nor
+        # calls out.
+        frozen = credentials.get_frozen_credentials()
+        self._credentials = Credentials(frozen.access_key, frozen.secret_key, frozen.token, credentials.method)
+        # Still consulted for the expiry: refresh_needed only reads it.
+        self._forked_from = credentials
+
+
+_provider: Optional[SharedCredentialProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_credential_provider() -> SharedCredentialProvider:
+    """Return the process-wide credential provider shared by AuthBoto signers."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = SharedCredentialProvider()
+        return _provider
+
+
+def _after_fork_in_child() -> None:
+    global _provider_lock
+    _provider_lock = threading.Lock()
+    if _provider is not None:
+        _provider._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
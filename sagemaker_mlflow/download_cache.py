@@ -0,0 +1,290 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: entries are still published atomically, only not locked.
+    fcntl = None  # type: ignore[assignment]
+
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_ENABLED_ENV_VAR = "SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_ENABLED"
+_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR_ENV_VAR = "SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR"
+_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES_ENV_VAR = "SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES"
+_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_LINK_ENV_VAR = "SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_LINK"
+
+_DEFAULT_MAX_BYTES = 20 * 1024 * 1024 * 1024
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def default_download_cache_dir() -> str:
+    """Directory holding the download cache, honouring XDG_CACHE_HOME."""
+    configured = os.environ.get(_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR_ENV_VAR)
+    if configured:
+        return configured
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "sagemaker_mlflow", "downloads")
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class DownloadCache:
+    """On-disk cache of downloaded artifact files, shared by processes on the host.
+
+    Entries are keyed by artifact URI plus the object's ETag (or version), so a changed
+    object is a new entry and stale content is never served. Each entry is stored once
+    under ``<root>/objects`` by the hash of its key, and handed out as a hard link,
+    or a copy where linking is not possible or ``link`` is False.
+
+    A miss downloads into ``<root>/tmp`` and renames the file into place, so readers
+    only ever see complete entries. A per-entry lock file makes concurrent misses for
+    the same entry, across threads and processes, download it once; the others wait
+    and link the result. The lock file's mtime also records the entry's last use, so
+    that the entry itself, which may be linked into a caller's directory, is never
+    touched. Once the cache may have grown beyond ``max_bytes``, least recently used
+    entries are evicted under a cache-wide lock. The size is tracked as entries are
+    added, so the cache directory is only scanned when that estimate exceeds the limit.
+
+    Cached files are read-only. With ``link`` True, hits are hard links to them and
+    share that mode: a caller that needs to modify such a file should copy it first.
+    Otherwise hits are writable copies.
+    """
+
+    def __init__(self, root: str, max_bytes: int = _DEFAULT_MAX_BYTES, link: bool = False) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.link = link
+        self._objects_dir = os.path.join(root, "objects")
+        self._tmp_dir = os.path.join(root, "tmp")
+        self._locks_dir = os.path.join(root, "locks")
+        for directory in (self._objects_dir, self._tmp_dir, self._locks_dir):
+            os.makedirs(directory, exist_ok=True)
+        self._stats_lock = threading.Lock()
+        # Bytes in the cache as of the last scan plus entries added since, or None
+        # before the first scan.
+        self._estimated_bytes: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _reset_after_fork(self) -> None:
+        # Entries on disk are shared with the parent as before; only the lock is new.
+        self._stats_lock = threading.Lock()
+
+    def _entry_name(self, uri: str, version: str) -> str:
+        return hashlib.sha256(f"{uri}\0{version}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, name: str) -> str:
+        return os.path.join(self._objects_dir, name[:2], name)
+
+    def fetch(self, uri: str, version: str, local_path: str, download: Callable[[str], None]) -> bool:
+        """Place the file for ``uri`` at ``version`` at local_path.
+
+        Args:
+            uri: Artifact URI of the file.
+            version: ETag or version ID identifying the content.
+            local_path: Destination; replaced atomically if it exists.
+            download: Called with a path to write the file to on a miss.
+
+        Returns:
+            True on a cache hit, False if the file was downloaded.
+        """
+        name = self._entry_name(uri, version)
+        entry_path = self._entry_path(name)
+        hit = self._ensure(name, entry_path, download)
+        try:
+            self._materialize(entry_path, local_path)
+        except FileNotFoundError:
+            # Evicted by another process in between; fetch it again.
+            hit = self._ensure(name, entry_path, download) and hit
+            self._materialize(entry_path, local_path)
+        with self._stats_lock:
+            if hit:
+                self._hits += 1
+                return True
+            self._misses += 1
+            if self._estimated_bytes is not None:
+                try:
+                    self._estimated_bytes += os.path.getsize(entry_path)
+                except FileNotFoundError:
+                    pass
+            over_limit = self._estimated_bytes is None or self._estimated_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+        return False
+
+    def _ensure(self, name: str, entry_path: str, download: Callable[[str], None]) -> bool:
+        """Make sure the entry exists, downloading it if needed; True if it already did."""
+        lock_path = os.path.join(self._locks_dir, name)
+        if os.path.exists(entry_path):
+            self._record_use(lock_path)
+            return True
+        with _file_lock(lock_path):
+            if os.path.exists(entry_path):
+                self._record_use(lock_path)
+                return True
+            self._populate(entry_path, download)
+            return False
+
+    @staticmethod
+    def _record_use(lock_path: str) -> None:
+        try:
+            os.utime(lock_path)
+        except FileNotFoundError:
+            try:
+                open(lock_path, "a").close()
+            except OSError:
+                pass
+        except PermissionError:
+            # Created by another user sharing the cache; still usable, just not touched.
+            pass
+
+    def _populate(self, entry_path: str, download: Callable[[str], None]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        os.close(fd)
+        try:
+            download(tmp_path)
+            os.chmod(tmp_path, _READ_ONLY)
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _materialize(self, entry_path: str, local_path: str) -> None:
+        # Linked or copied next to the destination first, so local_path appears complete.
+        tmp_path = f"{local_path}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            if self.link:
+                try:
+                    os.link(entry_path, tmp_path)
+                except OSError:
+                    # Different filesystem, or one without hard links.
+                    shutil.copyfile(entry_path, tmp_path)
+            else:
+                shutil.copyfile(entry_path, tmp_path)
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.lexists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            The number of entries removed.
+        """
+        with _file_lock(os.path.join(self.root, ".evict.lock")):
+            entries = []
+            total = 0
+            for shard in os.scandir(self._objects_dir):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    lock_path = os.path.join(self._locks_dir, entry.name)
+                    try:
+                        last_used = max(entry_stat.st_mtime, os.stat(lock_path).st_mtime)
+                    except FileNotFoundError:
+                        last_used = entry_stat.st_mtime
+                    entries.append((last_used, entry_stat.st_size, entry.path, lock_path))
+                    total += entry_stat.st_size
+            removed = 0
+            for _, size, path, lock_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for stale_path in (path, lock_path):
+                    try:
+                        os.unlink(stale_path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                removed += 1
+        with self._stats_lock:
+            self._estimated_bytes = total
+            self._evictions += removed
+        if removed:
+            logger.debug("Evicted %d entries from the download cache at %s", removed, self.root)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {"hits": self._hits, "misses": self._misses, "evictions": self._evictions}
+
+
+_cache: Optional[DownloadCache] = None
+_cache_lock = threading.Lock()
+
+
+def download_cache_enabled() -> bool:
+    return os.environ.get(_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_ENABLED_ENV_VAR, "").lower() == "true"
+
+
+def get_download_cache() -> DownloadCache:
+    """Return the process-wide download cache.
+
+    It lives in SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR (default
+    ~/.cache/sagemaker_mlflow/downloads), holds up to
+    SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES (default 20GiB, e.g. ``500GB``), and
+    hands out copies, or read-only hard links if SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_LINK is
+    "true".
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            max_bytes = env_setting(_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES_ENV_VAR, parse_size)
+            _cache = DownloadCache(
+                default_download_cache_dir(),
+                max_bytes=_DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+                link=os.environ.get(_SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_LINK_ENV_VAR, "").lower() == "true",
+            )
+        return _cache
+
+
+def _after_fork_in_child() -> None:
+    global _cache_lock
+    _cache_lock = threading.Lock()
+    if _cache is not None:
+        _cache._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,44 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import os
+import re
+from typing import Any, Callable, Optional
+
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+)\s*(|B|KB|KIB|MB|MIB|GB|GIB)\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+def parse_size(value: str) -> int:
+    """Parse a byte size such as ``8388608``, ``8MB`` or ``8MiB``."""
+    match = _SIZE_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f"invalid size {value!r}")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).upper().replace("IB", "B")]
+
+
+def env_setting(env_var: str, parse: Callable[[str], Any]) -> Optional[Any]:
+    """Return the value of an environment variable parsed by ``parse``, or None if unset.
+
+    Raises:
+        MlflowSageMakerException: If ``parse`` rejects the value with a ValueError.
+    """
+    value = os.environ.get(env_var)
+    if not value:
+        return None
+    try:
+        return parse(value)
+    except ValueError as e:
+        raise MlflowSageMakerException(f"Invalid {env_var}: {e}")
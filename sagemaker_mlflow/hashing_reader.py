@@ -0,0 +1,83 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import hashlib
+from typing import IO, Any, Dict, Iterable, Optional
+
+# With these encryption modes the ETag of an object is not the MD5 of its content.
+_OPAQUE_ETAG_ENCRYPTION = frozenset(["aws:kms", "aws:kms:dsse"])
+
+
+def _new_hash(name: str) -> Any:
+    if name == "md5":
+        try:
+            # Not used for security; allowed on FIPS-enabled hosts.
+            return hashlib.new("md5", usedforsecurity=False)  # type: ignore[call-arg]
+        except TypeError:
+            return hashlib.new("md5")
+    return hashlib.new(name)
+
+
+class HashingReader:
+    """File-like wrapper that hashes a request body while it is being sent.
+
+    Exposes ``read`` and ``__len__`` (the number of bytes left), which is all requests
+    needs to stream the body with a Content-Length header, so the data is read from
+    disk once for both the upload and its checksums. With no algorithms it merely gives
+    a stream of known size a ``__len__``.
+    """
+
+    def __init__(self, fileobj: IO[bytes], size: int, algorithms: Iterable[str] = ("md5",)) -> None:
+        self._fileobj = fileobj
+        self._size = size
+        self._hashes = {name: _new_hash(name) for name in algorithms}
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fileobj.read(size)
+        if chunk:
+            for checksum in self._hashes.values():
+                checksum.update(chunk)
+            self.bytes_read += len(chunk)
+        return chunk
+
+    def __len__(self) -> int:
+        return max(0, self._size - self.bytes_read)
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole file passed through the reader."""
+        return self.bytes_read == self._size
+
+    def hexdigest(self, algorithm: str) -> str:
+        return self._hashes[algorithm].hexdigest()
+
+
+def etag_matches(response_headers: Dict[str, str], md5_hex: str) -> Optional[bool]:
+    """Compare the ETag of a single-part S3 PUT response to the MD5 of the body sent.
+
+    Returns:
+        True or False, or None when the ETag cannot be compared: it is missing, or the
+        object is encrypted with SSE-KMS or SSE-C, in which case the ETag is not an MD5.
+    """
+    etag = response_headers.get("ETag")
+    if not etag:
+        return None
+    if response_headers.get("x-amz-server-side-encryption") in _OPAQUE_ETAG_ENCRYPTION:
+        return None
+    if response_headers.get("x-amz-server-side-encryption-customer-algorithm"):
+        return None
+    etag = etag.strip('"')
+    if "-" in etag:
+        return None
+    return etag.lower() == md5_hex
@@ -32,6 +32,9 @@ _TRACKING_SERVER_CERT_PATH_ENV_VAR = "MLFLOW_TRACKING_SERVER_CERT_PATH"
 # see https://requests.readthedocs.io/en/master/api/
 _TRACKING_CLIENT_CERT_PATH_ENV_VAR = "MLFLOW_TRACKING_CLIENT_CERT_PATH"
 
+# "true" to send requests to the tracking server over HTTP/2, with the http2 extra.
+_SAGEMAKER_MLFLOW_HTTP2_ENV_VAR = "SAGEMAKER_MLFLOW_HTTP2"
+
 host_metadata_provider = SageMakerMLflowHostMetadataProvider()
 
 
@@ -40,12 +43,19 @@ def get_host_creds(store_uri) -> rest_utils.MlflowHostCreds:
 
     Resolves the store URI (ARN) into a URL via SageMakerMLflowHostMetadataProvider,
     then returns MlflowHostCreds with auth="arn" to trigger SigV4 signing
-    via the AuthProvider entry point.
+    via the AuthProvider entry point. With SAGEMAKER_MLFLOW_HTTP2=true and the http2
+    extra installed, requests to the endpoint are sent over HTTP/2.
     """
     host_metadata_provider.set_arn(store_uri)
+    host = host_metadata_provider.construct_tracking_server_url()
+    if os.environ.get(_SAGEMAKER_MLFLOW_HTTP2_ENV_VAR, "").lower() == "true":
+        # Imported only when enabled, so the transport stays out of the default path.
+        from sagemaker_mlflow.http2_transport import mount_tracking_http2_adapter
+
+        mount_tracking_http2_adapter(host)
 
     return rest_utils.MlflowHostCreds(
-        host=host_metadata_provider.construct_tracking_server_url(),
+        host=host,
         username=os.environ.get(_TRACKING_USERNAME_ENV_VAR),
         password=os.environ.get(_TRACKING_PASSWORD_ENV_VAR),
         token=os.environ.get(_TRACKING_TOKEN_ENV_VAR),
@@ -0,0 +1,676 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import inspect
+import io
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+from sagemaker_mlflow.env_settings import env_setting
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_MLFLOW_HTTP2_ENV_VAR = "SAGEMAKER_MLFLOW_HTTP2"
+_SAGEMAKER_MLFLOW_HTTP2_MAX_CONNECTIONS_ENV_VAR = "SAGEMAKER_MLFLOW_HTTP2_MAX_CONNECTIONS"
+
+# Each HTTP/2 connection carries up to the server's stream limit (typically 100 or
+# more) of concurrent requests; further connections open only beyond that.
+DEFAULT_MAX_CONNECTIONS = 4
+
+# Connection-specific headers are not allowed in HTTP/2, and Host becomes :authority.
+# AuthBoto leaves Connection out of the signature, so dropping it keeps the signature
+# valid; SigV4 signs the host, not the header.
+_DROPPED_HEADERS = frozenset(["connection", "host", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"])
+
+_READ_SIZE = 65536
+
+_http2_unavailable_logged = False
+_session_unavailable_logged = False
+
+
+class _Http2NotNegotiated(Exception):
+    """The server did not select HTTP/2 during the TLS handshake."""
+
+
+class _StreamError(Exception):
+    """A request failed on its HTTP/2 stream.
+
+    ``unprocessed`` is True when the server is known not to have acted on it, after a
+    GOAWAY or a refused stream, so it can be sent again whatever its method.
+    """
+
+    def __init__(self, message: str, unprocessed: bool = False, timed_out: bool = False) -> None:
+        super().__init__(message)
+        self.unprocessed = unprocessed
+        self.timed_out = timed_out
+
+
+class _Stream:
+    def __init__(self) -> None:
+        self.status = 0
+        self.headers: List[Tuple[str, str]] = []
+        self.data: List[bytes] = []
+        self.error: Optional[_StreamError] = None
+        self.done = threading.Event()
+
+    def fail(self, error: _StreamError) -> None:
+        self.error = error
+        self.done.set()
+
+
+def _http2_available() -> bool:
+    global _http2_unavailable_logged
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        if not _http2_unavailable_logged:
+            _http2_unavailable_logged = True
+            logger.warning(
+                "%s is set but the h2 package is not installed (pip install 'sagemaker-mlflow[http2]'); using HTTP/1.1",
+                _SAGEMAKER_MLFLOW_HTTP2_ENV_VAR,
+            )
+        return False
+    return True
+
+
+def _ssl_context(verify: Any, cert: Any) -> ssl.SSLContext:
+    """SSL context matching requests' verify and cert arguments, offering only HTTP/2."""
+    if isinstance(verify, str):
+        if os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            context = ssl.create_default_context(cafile=verify)
+    else:
+        import certifi
+
+        context = ssl.create_default_context(cafile=certifi.where())
+        if verify is False:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+    if cert:
+        if isinstance(cert, str):
+            context.load_cert_chain(cert)
+        else:
+            context.load_cert_chain(cert[0], cert[1])
+    context.set_alpn_protocols(["h2"])
+    return context
+
+
+def _method_retryable(retry: Any, method: str) -> bool:
+    """Whether urllib3's Retry retries a failed request of this method, as it decides."""
+    # allowed_methods replaced method_whitelist in urllib3 1.26; empty allows every method.
+    allowed = retry.allowed_methods if hasattr(retry, "allowed_methods") else retry.method_whitelist
+    return not allowed or method.upper() in allowed
+
+
+def _split_timeout(timeout: Any) -> Tuple[Optional[float], Optional[float]]:
+    if isinstance(timeout, tuple):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+
+class _Http2Connection:
+    """One TLS connection carrying concurrent requests as HTTP/2 streams.
+
+    Calling threads open their stream and send the request themselves; a reader thread
+    receives frames and hands each response to the thread waiting for it. TLS runs over
+    memory buffers so that the TLS and h2 state are only touched under ``_lock``, while
+    the socket is read without it.
+    """
+
+    def __init__(self, host: str, port: int, context: ssl.SSLContext, timeout: Optional[float]) -> None:
+        import h2.config
+        import h2.connection
+
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        try:
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._incoming = ssl.MemoryBIO()
+            self._outgoing = ssl.MemoryBIO()
+            self._tls = context.wrap_bio(self._incoming, self._outgoing, server_hostname=host)
+            self._handshake()
+            if self._tls.selected_alpn_protocol() != "h2":
+                raise _Http2NotNegotiated(f"{host}:{port} does not support HTTP/2")
+            self._sock.settimeout(None)
+        except BaseException:
+            self._sock.close()
+            raise
+
+        self._h2 = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True, header_encoding=None))
+        self._lock = threading.Lock()
+        # Notified when stream capacity or flow control windows may have grown.
+        self._changed = threading.Condition(self._lock)
+        self._streams: Dict[int, _Stream] = {}
+        self._closed = False
+        with self._lock:
+            self._h2.initiate_connection()
+            self._flush()
+        threading.Thread(target=self._read_loop, name="sagemaker-mlflow-http2", daemon=True).start()
+
+    def _handshake(self) -> None:
+        while True:
+            try:
+                self._tls.do_handshake()
+                break
+            except ssl.SSLWantReadError:
+                self._send_tls_output()
+                data = self._sock.recv(_READ_SIZE)
+                if not data:
+                    raise ConnectionError("Connection closed during the TLS handshake")
+                self._incoming.write(data)
+        self._send_tls_output()
+
+    def _send_tls_output(self) -> None:
+        data = self._outgoing.read()
+        if data:
+            self._sock.sendall(data)
+
+    def _flush(self) -> None:
+        # Called with _lock held. Data frames never exceed the server's flow control
+        # window, so a server reading its socket does not leave this blocked for long.
+        data = self._h2.data_to_send()
+        if data:
+            self._tls.write(data)
+            self._send_tls_output()
+
+    @property
+    def usable(self) -> bool:
+        return not self._closed
+
+    @property
+    def active_streams(self) -> int:
+        return len(self._streams)
+
+    def has_capacity(self) -> bool:
+        return not self._closed and len(self._streams) < self._h2.remote_settings.max_concurrent_streams
+
+    def request(
+        self,
+        method: str,
+        authority: str,
+        path: str,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        timeout: Optional[float],
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        """Send a request and wait for its response.
+
+        Returns:
+            The status, headers and body of the response.
+
+        Raises:
+            _StreamError: If the request failed or timed out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        request_headers = [(":method", method), (":authority", authority), (":scheme", "https"), (":path", path)]
+        stream = _Stream()
+        with self._lock:
+            while not self._closed and len(self._streams) >= self._h2.remote_settings.max_concurrent_streams:
+                self._wait(deadline)
+            if self._closed:
+                raise _StreamError("Connection closed", unprocessed=True)
+            stream_id = self._h2.get_next_available_stream_id()
+            self._streams[stream_id] = stream
+            try:
+                self._h2.send_headers(stream_id, request_headers + headers, end_stream=not body)
+                self._send_body(stream_id, stream, body, deadline)
+                self._flush()
+            except _StreamError:
+                self._cancel(stream_id)
+                raise
+            except (OSError, ssl.SSLError) as e:
+                self._fail_all(e)
+                raise _StreamError(f"Failed to send the request: {e}")
+            except Exception as e:
+                # An h2 protocol error leaves the connection state unusable.
+                self._fail_all(e)
+                raise
+
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        if not stream.done.wait(remaining):
+            with self._lock:
+                self._cancel(stream_id)
+            raise _StreamError("Timed out waiting for the response", timed_out=True)
+        if stream.error is not None:
+            raise stream.error
+        return stream.status, stream.headers, b"".join(stream.data)
+
+    def _send_body(self, stream_id: int, stream: _Stream, body: bytes, deadline: Optional[float]) -> None:
+        offset = 0
+        while offset < len(body):
+            window = min(self._h2.local_flow_control_window(stream_id), self._h2.max_outbound_frame_size)
+            if window <= 0:
+                # Send what is queued, so the server can read it and grant more window.
+                self._flush()
+                self._wait(deadline)
+                if stream.error is not None:
+                    raise stream.error
+                continue
+            chunk = body[offset : offset + window]
+            offset += len(chunk)
+            self._h2.send_data(stream_id, chunk, end_stream=offset >= len(body))
+
+    def _wait(self, deadline: Optional[float]) -> None:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if (remaining is not None and remaining <= 0) or not self._changed.wait(remaining):
+            raise _StreamError("Timed out sending the request", timed_out=True)
+        if self._closed:
+            raise _StreamError("Connection closed")
+
+    def _cancel(self, stream_id: int) -> None:
+        import h2.errors
+
+        if self._streams.pop(stream_id, None) is not None and not self._closed:
+            try:
+                self._h2.reset_stream(stream_id, h2.errors.ErrorCodes.CANCEL)
+                self._flush()
+            except Exception:
+                logger.debug("Failed to cancel HTTP/2 stream %s", stream_id, exc_info=True)
+        self._changed.notify_all()
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                data = self._sock.recv(_READ_SIZE)
+                if not data:
+                    raise ConnectionError("Connection closed by the server")
+                with self._lock:
+                    self._incoming.write(data)
+                    plaintext = self._read_tls()
+                    if plaintext:
+                        for event in self._h2.receive_data(plaintext):
+                            self._handle(event)
+                    self._flush()
+                    self._changed.notify_all()
+        except Exception as e:
+            with self._lock:
+                self._fail_all(e)
+
+    def _read_tls(self) -> bytes:
+        chunks = []
+        while True:
+            try:
+                chunk = self._tls.read(_READ_SIZE)
+            except ssl.SSLWantReadError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _handle(self, event: Any) -> None:
+        import h2.errors
+        import h2.events
+
+        stream = self._streams.get(getattr(event, "stream_id", None) or 0)
+        if isinstance(event, h2.events.ResponseReceived) and stream is not None:
+            for name, value in event.headers:
+                if name == b":status":
+                    stream.status = int(value)
+                elif not name.startswith(b":"):
+                    stream.headers.append((name.decode("latin-1"), value.decode("latin-1")))
+        elif isinstance(event, h2.events.DataReceived):
+            self._h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            if stream is not None:
+                stream.data.append(event.data)
+        elif isinstance(event, h2.events.StreamEnded) and stream is not None:
+            del self._streams[event.stream_id]
+            stream.done.set()
+        elif isinstance(event, h2.events.StreamReset) and stream is not None:
+            del self._streams[event.stream_id]
+            refused = event.error_code == h2.errors.ErrorCodes.REFUSED_STREAM
+            stream.fail(_StreamError(f"Stream reset by the server: {event.error_code!r}", unprocessed=refused))
+        elif isinstance(event, h2.events.ConnectionTerminated):
+            # GOAWAY: no new streams; those above last_stream_id were not processed.
+            self._closed = True
+            last_stream_id = event.last_stream_id or 0
+            for stream_id in [i for i in self._streams if i > last_stream_id]:
+                self._streams.pop(stream_id).fail(_StreamError("Connection closed by the server", unprocessed=True))
+
+    def _fail_all(self, error: Exception) -> None:
+        # Called with _lock held.
+        self._closed = True
+        streams, self._streams = self._streams, {}
+        for stream in streams.values():
+            stream.fail(_StreamError(f"Connection lost: {error}"))
+        self._changed.notify_all()
+        try:
+            # Wakes the reader thread, which close alone would leave blocked in recv.
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._closed:
+                try:
+                    self._h2.close_connection()
+                    self._flush()
+                except (OSError, ssl.SSLError):
+                    pass
+            self._fail_all(ConnectionError("Connection closed"))
+
+
+class Http2Adapter(BaseAdapter):
+    """requests transport adapter sending HTTPS requests over HTTP/2.
+
+    Concurrent requests to a host are multiplexed as streams over a few connections
+    (``max_connections``) instead of taking one pooled HTTP/1.1 connection each.
+    Responses are read fully and decoded like requests' own.
+
+    ``fallback`` is the adapter the session used before, normally mlflow's with its
+    retry policy. It takes every request this adapter cannot send over HTTP/2: plain
+    ``http://`` or proxied requests, streamed bodies, hosts that do not negotiate HTTP/2
+    and, after a protocol error, every request. A request also goes to it if it would
+    otherwise need a retry: the connection could not be opened, the server did not
+    process the stream, or the attempt failed or got a status that the fallback retries.
+    """
+
+    def __init__(self, fallback: BaseAdapter, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> None:
+        super().__init__()
+        self._fallback = fallback
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._connections: Dict[Tuple[Any, ...], List[_Http2Connection]] = {}
+        self._opening: Dict[Tuple[Any, ...], threading.Lock] = {}
+        self._contexts: Dict[Tuple[Any, Any], ssl.SSLContext] = {}
+        self._http1_only: Set[Tuple[str, int]] = set()
+        self._disabled = False
+        self._http2_responses = 0
+        self._connections_opened = 0
+        self._fallbacks = 0
+        _adapters.add(self)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        import h2.exceptions
+
+        send_kwargs = dict(stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        url = urlsplit(request.url or "")
+        host, port = url.hostname or "", url.port or 443
+        if (
+            self._disabled
+            or url.scheme != "https"
+            or (host, port) in self._http1_only
+            or select_proxy(request.url or "", proxies)
+            or hasattr(request.body, "read")
+        ):
+            return self._send_fallback(request, send_kwargs)
+
+        method = request.method or "GET"
+        headers = [(k.lower(), v) for k, v in request.headers.items() if k.lower() not in _DROPPED_HEADERS]
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        path = (url.path or "/") + ("?" + url.query if url.query else "")
+        connect_timeout, read_timeout = _split_timeout(timeout)
+        retry = getattr(self._fallback, "max_retries", None)
+        try:
+            connection = self._connection(host, port, verify, cert, connect_timeout)
+            status, response_headers, content = connection.request(
+                method, url.netloc.rpartition("@")[2], path, headers, body, read_timeout
+            )
+        except _Http2NotNegotiated:
+            logger.info("%s:%s does not support HTTP/2, using HTTP/1.1", host, port)
+            with self._lock:
+                self._http1_only.add((host, port))
+            return self._send_fallback(request, send_kwargs)
+        except h2.exceptions.ProtocolError as e:
+            logger.warning("HTTP/2 request to %s failed (%s), using HTTP/1.1 from now on", request.url, e)
+            self._disabled = True
+            return self._send_fallback(request, send_kwargs)
+        except (OSError, ssl.SSLError) as e:
+            # The connection could not be opened, so nothing reached the server.
+            logger.debug("HTTP/2 connection to %s:%s failed, using HTTP/1.1", host, port, exc_info=e)
+            return self._send_fallback(request, send_kwargs)
+        except _StreamError as e:
+            if retry is not None and retry.total != 0 and (e.unprocessed or _method_retryable(retry, method)):
+                logger.debug("HTTP/2 request to %s failed, sending it over HTTP/1.1", request.url, exc_info=e)
+                return self._send_fallback(request, send_kwargs)
+            if e.timed_out:
+                raise requests.exceptions.ReadTimeout(e, request=request)
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        response = self._build_response(request, status, response_headers, content)
+        has_retry_after = "Retry-After" in response.headers
+        if retry is not None and retry.total != 0 and retry.is_retry(method, status, has_retry_after):
+            if has_retry_after and retry.respect_retry_after_header:
+                time.sleep(retry.parse_retry_after(response.headers["Retry-After"]))
+            return self._send_fallback(request, send_kwargs)
+        with self._lock:
+            self._http2_responses += 1
+        return response
+
+    def _connection(self, host: str, port: int, verify: Any, cert: Any, timeout: Optional[float]) -> _Http2Connection:
+        cert_key = tuple(cert) if isinstance(cert, list) else cert
+        key = (host, port, verify, cert_key)
+        while True:
+            with self._lock:
+                connections = [c for c in self._connections.get(key, []) if c.usable]
+                self._connections[key] = connections
+                available = [c for c in connections if c.has_capacity()]
+                if available or len(connections) >= self._max_connections:
+                    # At the connection limit, the request waits for a stream on the
+                    # least busy connection.
+                    return min(available or connections, key=lambda c: c.active_streams)
+                opening = self._opening.setdefault(key, threading.Lock())
+                context = self._contexts.get((verify, cert_key))
+                if context is None:
+                    context = self._contexts[(verify, cert_key)] = _ssl_context(verify, cert)
+            # One connection opens at a time per host: concurrent requests wait for it and
+            # share it rather than each opening their own.
+            with opening:
+                with self._lock:
+                    if any(c.has_capacity() for c in self._connections.get(key, [])):
+                        continue
+                connection = _Http2Connection(host, port, context, timeout)
+                with self._lock:
+                    self._connections.setdefault(key, []).append(connection)
+                    self._connections_opened += 1
+                return connection
+
+    def _send_fallback(self, request: requests.PreparedRequest, send_kwargs: Dict[str, Any]) -> requests.Response:
+        with self._lock:
+            self._fallbacks += 1
+        return self._fallback.send(request, **send_kwargs)
+
+    def _build_response(
+        self, request: requests.PreparedRequest, status: int, headers: List[Tuple[str, str]], content: bytes
+    ) -> requests.Response:
+        from urllib3 import HTTPResponse
+
+        raw_headers: Any = headers
+        try:
+            from urllib3 import HTTPHeaderDict
+        except ImportError:
+            # urllib3 1.x does not export it; its HTTPResponse builds one from the pairs.
+            pass
+        else:
+            raw_headers = HTTPHeaderDict(headers)
+        # urllib3 decodes the body by its Content-Encoding, as for HTTP/1.1 responses.
+        raw = HTTPResponse(
+            body=io.BytesIO(content), headers=raw_headers, status=status, preload_content=False, decode_content=True
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = raw
+        try:
+            response.reason = HTTPStatus(status).phrase
+        except ValueError:
+            response.reason = ""
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self  # type: ignore[assignment]
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the responses received over HTTP/2, the connections opened for them,
+        the requests sent through the fallback, and whether HTTP/2 was turned off after
+        a protocol error."""
+        with self._lock:
+            return {
+                "http2_responses": self._http2_responses,
+                "connections": self._connections_opened,
+                "fallbacks": self._fallbacks,
+                "disabled": self._disabled,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            connections = [c for group in self._connections.values() for c in group]
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+        self._fallback.close()
+
+    def _reset_after_fork(self) -> None:
+        # The connections and their reader threads belong to the parent; the child opens
+        # its own. Closing the sockets here would not end them for the parent anyway.
+        self._lock = threading.Lock()
+        self._connections = {}
+        self._opening = {}
+
+
+_adapters: "weakref.WeakSet[Http2Adapter]" = weakref.WeakSet()
+_mount_lock = threading.Lock()
+
+
+def mount_http2_adapter(session: requests.Session, host: str) -> Optional[Http2Adapter]:
+    """Send the session's requests to host over HTTP/2, if the h2 package is installed.
+
+    The session's current adapter for the host becomes the fallback. Mounting again for
+    the same host returns the adapter already mounted.
+
+    Returns:
+        The mounted adapter, or None if HTTP/2 support is not installed.
+    """
+    prefix = host.rstrip("/").lower() + "/"
+    # get_host_creds runs for every tracking request; once mounted, skip the lock.
+    adapter = session.adapters.get(prefix)
+    if isinstance(adapter, Http2Adapter):
+        return adapter
+    with _mount_lock:
+        adapter = session.adapters.get(prefix)
+        if isinstance(adapter, Http2Adapter):
+            return adapter
+        if not _http2_available():
+            return None
+        fallback = session.get_adapter(prefix)
+        max_connections = env_setting(_SAGEMAKER_MLFLOW_HTTP2_MAX_CONNECTIONS_ENV_VAR, int)
+        adapter = Http2Adapter(fallback, DEFAULT_MAX_CONNECTIONS if max_connections is None else max_connections)
+        # Session.mount reorders the adapters in place, which other threads may be
+        # iterating to pick an adapter; swap in a reordered copy instead. Longer prefixes
+        # come first, as Session.mount keeps them.
+        items = [(key, value) for key, value in session.adapters.items() if key != prefix]
+        session.adapters = OrderedDict(
+            [item for item in items if len(item[0]) >= len(prefix)]
+            + [(prefix, adapter)]
+            + [item for item in items if len(item[0]) < len(prefix)]
+        )
+        return adapter
+
+
+def _tracking_session() -> Optional[requests.Session]:
+    """The pooled session mlflow's REST stores use with the default retry configuration.
+
+    mlflow offers no public way to give its REST client a session, so this relies on
+    private parts of mlflow.utils.request_utils: _get_request_session, which caches one
+    session per retry configuration, and _TRANSIENT_FAILURE_RESPONSE_CODES, the retry
+    codes rest_utils.http_request passes it by default. The unit tests check, for every
+    mlflow version in the tox matrix, that this finds the session http_request uses.
+
+    The arguments of _get_request_session have changed across versions; they are built
+    the way http_request passes them, by parameter name, so the same cached session is
+    returned. None if this mlflow version takes an unknown argument.
+    """
+    from mlflow import environment_variables
+    from mlflow.utils import request_utils
+
+    def setting(name: str) -> Any:
+        variable = getattr(environment_variables, name, None)
+        return None if variable is None else variable.get()
+
+    arguments = {
+        "max_retries": setting("MLFLOW_HTTP_REQUEST_MAX_RETRIES"),
+        "backoff_factor": setting("MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"),
+        "backoff_jitter": setting("MLFLOW_HTTP_REQUEST_BACKOFF_JITTER"),
+        "retry_codes": getattr(request_utils, "_TRANSIENT_FAILURE_RESPONSE_CODES", None),
+        "raise_on_status": True,
+        "respect_retry_after_header": setting("MLFLOW_HTTP_RESPECT_RETRY_AFTER_HEADER"),
+    }
+    get_request_session = getattr(request_utils, "_get_request_session", None)
+    if get_request_session is None:
+        return None
+    parameters = list(inspect.signature(get_request_session).parameters)
+    if any(arguments.get(name) is None for name in parameters):
+        return None
+    # Positionally, as mlflow calls it: the cache tells positional and keyword arguments apart.
+    return get_request_session(*(arguments[name] for name in parameters))
+
+
+def mount_tracking_http2_adapter(host: str) -> Optional[Http2Adapter]:
+    """Mount the HTTP/2 adapter for host on the session mlflow's REST stores use.
+
+    This covers requests sent through rest_utils.http_request with mlflow's default
+    retry settings, which are most calls of the tracking and model registry stores.
+    Requests that override them, such as mlflow's server version check, get another
+    session from mlflow and go over HTTP/1.1, as do artifact transfers, which do not
+    use rest_utils.
+
+    Returns:
+        The mounted adapter, or None if HTTP/2 support is not installed or this mlflow
+        version's session cannot be found.
+    """
+    session = _tracking_session()
+    if session is None:
+        global _session_unavailable_logged
+        if not _session_unavailable_logged:
+            _session_unavailable_logged = True
+            logger.warning("mlflow's request session could not be found in this version; using HTTP/1.1")
+        return None
+    return mount_http2_adapter(session, host)
+
+
+def _after_fork_in_child() -> None:
+    global _mount_lock
+    _mount_lock = threading.Lock()
+    for adapter in list(_adapters):
+        adapter._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -16,6 +16,7 @@ from functools import partial
 from mlflow.store.model_registry.rest_store import RestStore
 
 from sagemaker_mlflow.host_creds import get_host_creds
+from sagemaker_mlflow.request_hedging import call_hedged
 
 
 class MlflowSageMakerRegistryStore(RestStore):
@@ -25,3 +26,7 @@ class MlflowSageMakerRegistryStore(RestStore):
     def __init__(self, store_uri):
         self.store_uri = store_uri
         super().__init__(partial(get_host_creds, store_uri))
+
+    def _call_endpoint(self, api, *args, **kwargs):
+        # Read-only calls may be hedged, see request_hedging.
+        return call_hedged(super()._call_endpoint, api, *args, **kwargs)
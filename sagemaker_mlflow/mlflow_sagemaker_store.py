@@ -13,9 +13,12 @@
 
 from functools import partial
 
+from mlflow.entities import RunStatus
 from mlflow.store.tracking.rest_store import RestStore
 
+from sagemaker_mlflow.background_uploads import flush_background_uploads
 from sagemaker_mlflow.host_creds import get_host_creds
+from sagemaker_mlflow.request_hedging import call_hedged
 
 
 class MlflowSageMakerStore(RestStore):
@@ -24,3 +27,13 @@ class MlflowSageMakerStore(RestStore):
     def __init__(self, store_uri, artifact_uri):
         self.store_uri = store_uri
         super().__init__(partial(get_host_creds, store_uri))
+
+    def update_run_info(self, run_id, run_status, end_time, run_name):
+        # Let background artifact uploads of the run finish before it is marked terminated.
+        if RunStatus.is_terminated(run_status):
+            flush_background_uploads(run_id)
+        return super().update_run_info(run_id, run_status, end_time, run_name)
+
+    def _call_endpoint(self, api, *args, **kwargs):
+        # Read-only calls may be hedged, see request_hedging.
+        return call_hedged(super()._call_endpoint, api, *args, **kwargs)
@@ -13,7 +13,6 @@
 
 import os
 
-import boto3
 import mlflow
 
 from sagemaker_mlflow.exceptions import ResourceTypeUnsupportedException
@@ -31,6 +30,8 @@ def get_presigned_url(url_expiration_duration=300, session_duration=5000) -> str
     :returns: Authorized Url
 
     """
+    import boto3
+
     host_metadata_provider.set_arn(mlflow.get_tracking_uri())
 
     custom_endpoint = os.environ.get("SAGEMAKER_ENDPOINT_URL", "")
@@ -0,0 +1,168 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime requested for presigned upload URLs, in seconds.
+DEFAULT_URL_EXPIRATION_SECONDS = 900
+
+# URLs with less than this many seconds left are treated as expired and refreshed
+# before use, so an upload never starts on a URL that lapses mid-transfer.
+DEFAULT_REFRESH_MARGIN_SECONDS = 60
+
+# Prefetch threads shared by all brokers in the process.
+DEFAULT_PREFETCH_WORKERS = 4
+
+
+class PresignedUrl(NamedTuple):
+    """A presigned upload URL together with the headers the PUT must carry."""
+
+    url: str
+    headers: Dict[str, str]
+    expires_at: float
+
+
+_brokers: "weakref.WeakSet[PresignedUrlBroker]" = weakref.WeakSet()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Return the process-wide prefetch executor, creating it on first use.
+
+    Repositories, and so brokers, are created freely; sharing one executor keeps their
+    prefetch threads from piling up.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_PREFETCH_WORKERS, thread_name_prefix="SageMakerPresignedUrlPrefetch"
+            )
+        return _executor
+
+
+class PresignedUrlBroker:
+    """Thread-safe holder for presigned upload URLs keyed by artifact path.
+
+    URLs are fetched ahead of use through ``prefetch`` and handed out by ``get``. A URL
+    stays valid for reuse (for example, when the upload of the same path is retried)
+    until it gets within ``refresh_margin`` seconds of its expiry, at which point ``get``
+    fetches a fresh one just in time.
+    """
+
+    def __init__(
+        self,
+        fetch_url: Callable[[str, int], Tuple[str, Dict[str, str]]],
+        expiration: int = DEFAULT_URL_EXPIRATION_SECONDS,
+        refresh_margin: int = DEFAULT_REFRESH_MARGIN_SECONDS,
+    ) -> None:
+        """
+        Args:
+            fetch_url: Callable taking (path, expiration) and returning (url, headers).
+            expiration: Lifetime in seconds requested for each URL.
+            refresh_margin: Minimum remaining lifetime in seconds for a URL to be reused.
+        """
+        self._fetch_url = fetch_url
+        self._expiration = expiration
+        self._refresh_margin = min(refresh_margin, expiration // 2)
+        self._urls: Dict[str, PresignedUrl] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        _brokers.add(self)
+
+    def _reset_after_fork(self) -> None:
+        # Prefetches in flight would never complete in a forked child, which has none of
+        # the parent's threads; URLs already fetched stay valid and are kept.
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def _is_fresh(self, presigned_url: PresignedUrl) -> bool:
+        return presigned_url.expires_at - self._refresh_margin > time.monotonic()
+
+    def _fetch(self, path: str) -> PresignedUrl:
+        # Expiry is measured from before the request so clock time spent waiting on
+        # the server only ever makes the estimate more conservative.
+        requested_at = time.monotonic()
+        url, headers = self._fetch_url(path, self._expiration)
+        presigned_url = PresignedUrl(url, headers, requested_at + self._expiration)
+        with self._lock:
+            self._urls[path] = presigned_url
+        return presigned_url
+
+    def _fetch_pending(self, path: str) -> PresignedUrl:
+        try:
+            return self._fetch(path)
+        finally:
+            with self._lock:
+                self._pending.pop(path, None)
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """Start fetching URLs for the given paths in the background.
+
+        Paths that already hold a fresh URL, or have a fetch in flight, are skipped.
+        Failures are not raised here; they surface from ``get`` for the same path.
+        """
+        with self._lock:
+            for path in paths:
+                if path in self._pending:
+                    continue
+                cached = self._urls.get(path)
+                if cached is not None and self._is_fresh(cached):
+                    continue
+                self._pending[path] = _get_prefetch_executor().submit(self._fetch_pending, path)
+
+    def get(self, path: str) -> PresignedUrl:
+        """Return a fresh presigned URL for ``path``, fetching one if needed."""
+        with self._lock:
+            cached = self._urls.get(path)
+            pending = self._pending.get(path)
+        if cached is not None and self._is_fresh(cached):
+            return cached
+        if pending is not None:
+            presigned_url = pending.result()
+            if self._is_fresh(presigned_url):
+                return presigned_url
+            logger.debug("Prefetched presigned URL for %s is about to expire, refreshing", path)
+        return self._fetch(path)
+
+    def discard(self, path: str) -> None:
+        """Forget the URL held for ``path``, typically after a successful upload."""
+        with self._lock:
+            self._urls.pop(path, None)
+
+    def clear(self) -> None:
+        """Forget all held URLs. In-flight prefetches still complete."""
+        with self._lock:
+            self._urls.clear()
+
+
+def _after_fork_in_child() -> None:
+    # The prefetch threads belong to the parent; the child starts its own on first use.
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+    for broker in list(_brokers):
+        broker._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import gzip
+import os
+from typing import Callable, Optional
+
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+
+_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_ENV_VAR = "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION"
+_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES_ENV_VAR = "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES"
+
+# Below this, the saved transfer time does not pay for compressing and decompressing.
+DEFAULT_MIN_BYTES = 64 * 1024
+
+# Fast levels: tracking payloads are JSON, which compresses well even at these.
+_GZIP_LEVEL = 1
+_ZSTD_LEVEL = 3
+
+
+class RequestCompression:
+    """Compresses request bodies of at least ``min_bytes`` with one content encoding."""
+
+    def __init__(self, encoding: str, compress: Callable[[bytes], bytes], min_bytes: int = DEFAULT_MIN_BYTES) -> None:
+        self.encoding = encoding
+        self.min_bytes = min_bytes
+        self._compress = compress
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Return the compressed body, or None if it is too small or would not shrink."""
+        if len(body) < self.min_bytes:
+            return None
+        compressed = self._compress(body)
+        if len(compressed) >= len(body):
+            return None
+        return compressed
+
+
+def _gzip_compress(body: bytes) -> bytes:
+    # mtime=0 keeps the output, and so its payload hash, a function of the body alone.
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def _zstd_compressor() -> Callable[[bytes], bytes]:
+    try:
+        import zstandard
+    except ImportError:
+        raise MlflowSageMakerException(
+            f"{_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_ENV_VAR}=zstd requires the zstandard package: "
+            "pip install zstandard"
+        )
+    return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress
+
+
+def load_request_compression() -> Optional[RequestCompression]:
+    """Build the request compression for tracking requests from the environment.
+
+    * SAGEMAKER_MLFLOW_REQUEST_COMPRESSION: ``gzip`` or ``zstd`` (``pip install
+      zstandard``). Unset or ``none`` sends bodies uncompressed.
+    * SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES: smallest body that is compressed,
+      e.g. ``64KB`` (the default).
+
+    The tracking server must accept the chosen Content-Encoding.
+
+    Returns:
+        None unless compression is enabled.
+    """
+    encoding = os.environ.get(_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_ENV_VAR, "").strip().lower()
+    if encoding in ("", "none"):
+        return None
+    compress: Callable[[bytes], bytes]
+    if encoding == "gzip":
+        compress = _gzip_compress
+    elif encoding == "zstd":
+        compress = _zstd_compressor()
+    else:
+        raise MlflowSageMakerException(
+            f"Invalid {_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_ENV_VAR}: {encoding!r}, expected gzip, zstd or none"
+        )
+    min_bytes = env_setting(_SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES_ENV_VAR, parse_size)
+    return RequestCompression(encoding, compress, DEFAULT_MIN_BYTES if min_bytes is None else min_bytes)
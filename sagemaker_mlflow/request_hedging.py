@@ -0,0 +1,255 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Optional
+
+from sagemaker_mlflow.env_settings import env_setting
+
+_SAGEMAKER_MLFLOW_HEDGED_READS_ENV_VAR = "SAGEMAKER_MLFLOW_HEDGED_READS"
+_SAGEMAKER_MLFLOW_HEDGE_PERCENTILE_ENV_VAR = "SAGEMAKER_MLFLOW_HEDGE_PERCENTILE"
+_SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO_ENV_VAR = "SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO"
+
+DEFAULT_PERCENTILE = 95.0
+DEFAULT_MAX_RATIO = 0.05
+
+# Read-only tracking and registry APIs, by request message name. Both attempts of a
+# hedged call reach the server, so only calls without side effects qualify.
+HEDGED_APIS = frozenset(
+    [
+        "GetExperiment",
+        "GetExperimentByName",
+        "GetLoggedModel",
+        "GetMetricHistory",
+        "GetRun",
+        "GetTraceInfo",
+        "GetTraceInfoV3",
+        "SearchExperiments",
+        "SearchLoggedModels",
+        "SearchRuns",
+        "SearchTraces",
+        "SearchTracesV3",
+        "GetLatestVersions",
+        "GetModelVersion",
+        "GetModelVersionByAlias",
+        "GetModelVersionDownloadUri",
+        "GetRegisteredModel",
+        "SearchModelVersions",
+        "SearchRegisteredModels",
+    ]
+)
+
+# Latencies kept per API, and how many are needed before its percentile is trusted.
+_WINDOW = 500
+_MIN_SAMPLES = 20
+# The percentile is recomputed after this many new samples rather than on every call.
+_RECOMPUTE_EVERY = 10
+# Unused hedge budget is kept up to this many hedges, for bursts of slow calls.
+_MAX_BUDGET = 10.0
+_MAX_WORKERS = 64
+
+
+class _LatencyWindow:
+    """Recent latencies of one API, and their percentile."""
+
+    def __init__(self, percentile: float) -> None:
+        self._percentile = percentile
+        self._latencies: Deque[float] = deque(maxlen=_WINDOW)
+        self._stale = 0
+        self.threshold: Optional[float] = None
+
+    def add(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._stale += 1
+        if len(self._latencies) >= _MIN_SAMPLES and (self.threshold is None or self._stale >= _RECOMPUTE_EVERY):
+            ordered = sorted(self._latencies)
+            self.threshold = ordered[min(len(ordered) - 1, int(len(ordered) * self._percentile / 100))]
+            self._stale = 0
+
+
+class RequestHedger:
+    """Sends a second attempt of a slow read call, and returns whichever succeeds first.
+
+    A call is hedged once it has run longer than ``percentile`` of the recent latencies
+    of the same API, measured from single attempts. Hedges are capped at ``max_ratio``
+    of calls: every call adds that fraction of a hedge to a budget, and a hedge spends
+    one. The attempt that completes first, with a result or an error, wins; the other
+    is left to finish in the background.
+    """
+
+    def __init__(self, percentile: float = DEFAULT_PERCENTILE, max_ratio: float = DEFAULT_MAX_RATIO) -> None:
+        self._percentile = percentile
+        self._max_ratio = max_ratio
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _LatencyWindow] = {}
+        self._budget = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._calls = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    def _reset_after_fork(self) -> None:
+        # The worker threads belong to the parent; latencies and counters carry over.
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _submit(self, call: Callable[[], Any]) -> "Future[Any]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="SageMakerHedge")
+            executor = self._executor
+        # Each attempt runs in a copy of the caller's context, as if the caller made it.
+        return executor.submit(contextvars.copy_context().run, call)
+
+    def _window(self, api: str) -> _LatencyWindow:
+        window = self._windows.get(api)
+        if window is None:
+            window = self._windows[api] = _LatencyWindow(self._percentile)
+        return window
+
+    def _record_latency(self, api: str, started: float) -> None:
+        latency = time.monotonic() - started
+        with self._lock:
+            self._window(api).add(latency)
+
+    def call(self, api: str, call: Callable[[], Any]) -> Any:
+        """Run ``call``, a read of ``api`` that is safe to send twice, hedging it if slow.
+
+        Returns the first successful attempt's result; raises only once every attempt failed.
+        """
+        with self._lock:
+            self._calls += 1
+            self._budget = min(_MAX_BUDGET, self._budget + self._max_ratio)
+            threshold = self._window(api).threshold
+        started = time.monotonic()
+        if threshold is None:
+            # Nothing to hedge against yet: the call runs in the caller's thread.
+            try:
+                return call()
+            finally:
+                self._record_latency(api, started)
+        primary = self._submit(call)
+        primary.add_done_callback(lambda _: self._record_latency(api, started))
+        done, _ = wait([primary], timeout=max(0.0, threshold - (time.monotonic() - started)))
+        if done:
+            return primary.result()
+        with self._lock:
+            hedged = self._budget >= 1
+            if hedged:
+                self._budget -= 1
+                self._hedges += 1
+            else:
+                self._budget_exhausted += 1
+        if not hedged:
+            return primary.result()
+        hedge = self._submit(call)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # An attempt that failed first does not decide the call while the other may still succeed.
+            for attempt in (primary, hedge):
+                if attempt in done and attempt.exception() is None:
+                    if attempt is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return attempt.result()
+        # Both attempts failed: raise the primary's error, as an unhedged call would.
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counts of calls, hedges sent and hedges that answered first, and the
+        current hedging threshold per API in milliseconds."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins,
+                "hedge_win_rate": self._hedge_wins / self._hedges if self._hedges else 0.0,
+                "budget_exhausted": self._budget_exhausted,
+                "thresholds_ms": {
+                    api: window.threshold * 1000
+                    for api, window in self._windows.items()
+                    if window.threshold is not None
+                },
+            }
+
+
+def _parse_percentile(value: str) -> float:
+    percentile = float(value)
+    if not 0 < percentile < 100:
+        raise ValueError(f"{value!r} is not between 0 and 100")
+    return percentile
+
+
+def _parse_ratio(value: str) -> float:
+    ratio = float(value)
+    if not 0 < ratio <= 1:
+        raise ValueError(f"{value!r} is not in (0, 1]")
+    return ratio
+
+
+_hedger: Optional[RequestHedger] = None
+_hedger_loaded = False
+_hedger_lock = threading.Lock()
+
+
+def get_request_hedger() -> Optional[RequestHedger]:
+    """Return the process-wide hedger of read calls, or None unless hedging is enabled.
+
+    * SAGEMAKER_MLFLOW_HEDGED_READS: ``true`` to hedge read-only tracking and registry calls.
+    * SAGEMAKER_MLFLOW_HEDGE_PERCENTILE: latency percentile after which a call is
+      hedged, 95 by default.
+    * SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO: largest fraction of calls hedged, 0.05 by default.
+    """
+    global _hedger, _hedger_loaded
+    with _hedger_lock:
+        if not _hedger_loaded:
+            if os.environ.get(_SAGEMAKER_MLFLOW_HEDGED_READS_ENV_VAR, "false").lower() == "true":
+                percentile = env_setting(_SAGEMAKER_MLFLOW_HEDGE_PERCENTILE_ENV_VAR, _parse_percentile)
+                max_ratio = env_setting(_SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO_ENV_VAR, _parse_ratio)
+                _hedger = RequestHedger(
+                    DEFAULT_PERCENTILE if percentile is None else percentile,
+                    DEFAULT_MAX_RATIO if max_ratio is None else max_ratio,
+                )
+            _hedger_loaded = True
+        return _hedger
+
+
+def call_hedged(call_endpoint: Callable[..., Any], api: Any, *args: Any, **kwargs: Any) -> Any:
+    """Return ``call_endpoint(api, *args, **kwargs)``, hedged if enabled and ``api`` is read-only.
+
+    A response_proto passed in would be filled by both attempts at once, so such calls
+    are not hedged.
+    """
+    hedger = get_request_hedger()
+    if hedger is None or api.__name__ not in HEDGED_APIS or kwargs.get("response_proto") is not None:
+        return call_endpoint(api, *args, **kwargs)
+    return hedger.call(api.__name__, partial(call_endpoint, api, *args, **kwargs))
+
+
+def _after_fork_in_child() -> None:
+    global _hedger_lock
+    _hedger_lock = threading.Lock()
+    if _hedger is not None:
+        _hedger._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
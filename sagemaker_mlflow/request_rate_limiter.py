@@ -0,0 +1,293 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests.models import PreparedRequest, Response
+
+from sagemaker_mlflow.env_settings import env_setting
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS_ENV_VAR = "SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS"
+
+# Operation classes, each limited on its own.
+OPERATION_READ = "read"
+OPERATION_SEARCH = "search"
+OPERATION_WRITE = "write"
+_OPERATIONS = (OPERATION_READ, OPERATION_SEARCH, OPERATION_WRITE)
+_ANY = "*"
+
+_THROTTLING_STATUS_CODES = frozenset([429])
+_THROTTLING_ERROR_TYPES = ("throttlingexception", "toomanyrequestsexception", "requestlimitexceeded")
+
+# Multiplicative decrease on throttling, additive increase back to the configured rate
+# over _RECOVERY_SECONDS without throttling.
+_DECREASE_FACTOR = 0.5
+_RECOVERY_SECONDS = 30.0
+_MIN_RATE = 0.5
+# Longest Retry-After honored, so a bad header cannot stall the process.
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+_REQUEST_ATTRIBUTE = "_sagemaker_mlflow_rate_limit"
+
+
+def operation_class(method: Optional[str], url: Optional[str]) -> str:
+    """Classify a tracking request as OPERATION_SEARCH, OPERATION_READ or OPERATION_WRITE."""
+    path = urlsplit(url or "").path.rstrip("/")
+    if path.rsplit("/", 1)[-1].startswith("search"):
+        return OPERATION_SEARCH
+    if (method or "GET").upper() in ("GET", "HEAD"):
+        return OPERATION_READ
+    return OPERATION_WRITE
+
+
+def is_throttled(response: Response) -> bool:
+    """Tell whether the server rejected a request for exceeding its request rate."""
+    if response.status_code in _THROTTLING_STATUS_CODES:
+        return True
+    error_type = (response.headers.get("x-amzn-ErrorType") or "").lower()
+    return error_type.startswith(_THROTTLING_ERROR_TYPES)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER_SECONDS)
+
+
+class AdaptiveTokenBucket:
+    """Token bucket of requests that slows down when the server throttles.
+
+    Tokens accrue at the current rate up to one second's worth. A throttled response
+    halves the rate, down to half a request per second, and a Retry-After header stops
+    handing out tokens until it has passed. The rate then grows back linearly to
+    ``max_rate`` over 30 seconds without throttling. Responses to requests sent before
+    the last decrease do not lower it again: they reflect the old rate.
+    """
+
+    def __init__(self, max_rate: float) -> None:
+        self._cond = threading.Condition()
+        self.max_rate = max_rate
+        self._rate = max_rate
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._decreased_at = 0.0
+        self._requests = 0
+        self._throttled = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+
+    def _reset_after_fork(self) -> None:
+        # The rate and any pause carry over; waiters belonged to the parent's threads.
+        self._cond = threading.Condition()
+
+    @property
+    def rate(self) -> float:
+        with self._cond:
+            self._refill()
+            return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if self._rate < self.max_rate:
+            self._rate = min(self.max_rate, self._rate + elapsed * self.max_rate / _RECOVERY_SECONDS)
+        self._tokens = min(max(1.0, self._rate), self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Block until a request may be sent.
+
+        Returns:
+            The time the request was let through, to pass to record_response.
+        """
+        with self._cond:
+            self._refill()
+            if self._tokens < 1 or self._updated < self._paused_until:
+                self._waits += 1
+                started = self._updated
+                while self._tokens < 1 or self._updated < self._paused_until:
+                    self._cond.wait(max((1 - self._tokens) / self._rate, self._paused_until - self._updated))
+                    self._refill()
+                self._wait_seconds += self._updated - started
+            self._tokens -= 1
+            self._requests += 1
+            return self._updated
+
+    def record_response(self, sent_at: float, throttled: bool, retry_after: Optional[float] = None) -> None:
+        """Adapt the rate to a response.
+
+        Args:
+            sent_at: What acquire returned for the request.
+            throttled: Whether the server throttled the request, or any attempt of it.
+            retry_after: Seconds the server asked to wait before sending again.
+        """
+        if not throttled:
+            return
+        with self._cond:
+            self._refill()
+            self._throttled += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, self._updated + retry_after)
+            if sent_at > self._decreased_at:
+                self._rate = max(min(_MIN_RATE, self.max_rate), self._rate * _DECREASE_FACTOR)
+                self._tokens = min(self._tokens, 1.0)
+                self._decreased_at = self._updated
+                logger.info("Requests throttled by the server, lowering the rate to %.1f/s", self._rate)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            self._refill()
+            return {
+                "rate_per_second": self._rate,
+                "max_rate_per_second": self.max_rate,
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "throttled_waits": self._waits,
+                "throttled_seconds": self._wait_seconds,
+            }
+
+
+def parse_rate_limits(value: str) -> Dict[Tuple[str, str], float]:
+    """Parse rules such as ``*=50,search=5,example.com/write=20``.
+
+    Each rule is ``[<host>/]<class>=<requests per second>``, where class is ``read``,
+    ``search``, ``write`` or ``*`` for all of them.
+
+    Returns:
+        Rates keyed by (host, class), with ``*`` for a rule without a host.
+    """
+    limits: Dict[Tuple[str, str], float] = {}
+    for rule in value.split(","):
+        if not rule.strip():
+            continue
+        target, separator, rate = rule.partition("=")
+        host, _, operation = target.strip().rpartition("/")
+        operation = operation.lower()
+        if not separator or operation not in _OPERATIONS + (_ANY,):
+            raise ValueError(f"invalid rule {rule.strip()!r}, expected [<host>/]<read|search|write|*>=<rate>")
+        try:
+            limit = float(rate)
+        except ValueError:
+            limit = 0
+        if limit <= 0:
+            raise ValueError(f"invalid rate in {rule.strip()!r}")
+        limits[(host.lower() or _ANY, operation)] = limit
+    return limits
+
+
+class RequestRateLimiter:
+    """Process-wide rate limits of signed requests, one bucket per endpoint and operation class.
+
+    A bucket's rate comes from the most specific rule: host and class, host, class,
+    then ``*``. Requests that no rule covers are not limited.
+    """
+
+    def __init__(self, limits: Dict[Tuple[str, str], float]) -> None:
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], Optional[AdaptiveTokenBucket]] = {}
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+        for bucket in self._buckets.values():
+            if bucket is not None:
+                bucket._reset_after_fork()
+
+    def _bucket(self, host: str, operation: str) -> Optional[AdaptiveTokenBucket]:
+        key = (host, operation)
+        with self._lock:
+            if key not in self._buckets:
+                rate = None
+                for candidate in (key, (host, _ANY), (_ANY, operation), (_ANY, _ANY)):
+                    rate = self._limits.get(candidate)
+                    if rate is not None:
+                        break
+                self._buckets[key] = AdaptiveTokenBucket(rate) if rate is not None else None
+            return self._buckets[key]
+
+    def acquire(self, request: PreparedRequest) -> None:
+        """Block until the request may be sent, and remember its bucket for record_response."""
+        url = urlsplit(request.url or "")
+        bucket = self._bucket(url.netloc.rpartition("@")[2].lower(), operation_class(request.method, request.url))
+        if bucket is not None:
+            setattr(request, _REQUEST_ATTRIBUTE, (bucket, bucket.acquire()))
+
+    def record_response(self, response: Response, **kwargs: Any) -> Response:
+        """Response hook adapting the request's bucket to throttling.
+
+        Throttled attempts retried by urllib3 count too, from the response's retry history.
+        """
+        limited: Optional[Tuple[AdaptiveTokenBucket, float]] = getattr(response.request, _REQUEST_ATTRIBUTE, None)
+        if limited is None:
+            return response
+        bucket, sent_at = limited
+        retries = getattr(response.raw, "retries", None)
+        history: List[Any] = list(getattr(retries, "history", None) or ())
+        throttled = is_throttled(response)
+        if throttled or any(attempt.status in _THROTTLING_STATUS_CODES for attempt in history):
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After")) if throttled else None
+            bucket.record_response(sent_at, True, retry_after)
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the stats of every bucket in use, keyed by ``<host>/<class>``."""
+        with self._lock:
+            buckets = [(key, bucket) for key, bucket in self._buckets.items() if bucket is not None]
+        return {f"{host}/{operation}": bucket.stats() for (host, operation), bucket in buckets}
+
+
+_limiter: Optional[RequestRateLimiter] = None
+_limiter_loaded = False
+_limiter_lock = threading.Lock()
+
+
+def get_request_rate_limiter() -> Optional[RequestRateLimiter]:
+    """Return the process-wide limiter of signed requests, or None if no limits are set.
+
+    Limits come from SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS, in requests per second, e.g.
+    ``*=50,search=5`` (see parse_rate_limits).
+    """
+    global _limiter, _limiter_loaded
+    with _limiter_lock:
+        if not _limiter_loaded:
+            limits = env_setting(_SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS_ENV_VAR, parse_rate_limits)
+            _limiter = RequestRateLimiter(limits) if limits else None
+            _limiter_loaded = True
+        return _limiter
+
+
+def _after_fork_in_child() -> None:
+    global _limiter_lock
+    _limiter_lock = threading.Lock()
+    if _limiter is not None:
+        _limiter._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
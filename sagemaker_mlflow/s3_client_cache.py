@@ -0,0 +1,115 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Shared S3 clients for the artifact repository, built by mlflow's own client cache.
+
+mlflow's ``_cached_get_s3_client`` already keeps up to 64 clients per signature version,
+addressing style, endpoint, TLS verification, explicit credentials and region, and
+rebuilds them every 300 seconds. It cannot tell when credentials resolved from the
+environment or the shared config files change, so this module adds only that: when
+their identity changes, mlflow's cache is cleared and clients are built again.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sagemaker_mlflow.credential_identity import credentials_identity
+
+
+def _mlflow_client_cache() -> Any:
+    from mlflow.store.artifact import s3_artifact_repo
+
+    return s3_artifact_repo._cached_get_s3_client
+
+
+class S3ClientCache:
+    """Thread-safe access to mlflow's cached boto3 S3 clients, shared by artifact repositories.
+
+    Creating a client resolves credentials, region and endpoints and loads the service
+    model, which takes tens of milliseconds and a few MB per client. A client is reused
+    by every repository that would have built an identical one, and replaced once the
+    credentials it resolved from the environment rotate.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ambient_identity: Optional[Tuple[Any, ...]] = None
+
+    def get_client(
+        self,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        session_token: Optional[str] = None,
+        region_name: Optional[str] = None,
+        s3_endpoint_url: Optional[str] = None,
+    ) -> Any:
+        """Return a cached S3 client, creating it on first use.
+
+        Arguments and the MLflow S3 environment variables are interpreted by mlflow's
+        ``_get_s3_client``, which also picks the addressing style.
+        """
+        from mlflow.store.artifact import s3_artifact_repo
+
+        if not (access_key_id or secret_access_key or session_token):
+            # Explicit credentials are part of mlflow's key; ambient ones are not.
+            identity = credentials_identity()
+            with self._lock:
+                if self._ambient_identity is not None and identity != self._ambient_identity:
+                    _mlflow_client_cache().cache_clear()
+                self._ambient_identity = identity
+        return s3_artifact_repo._get_s3_client(
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            session_token=session_token,
+            region_name=region_name,
+            s3_endpoint_url=s3_endpoint_url,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        info = _mlflow_client_cache().cache_info()
+        return {"clients": info.currsize, "hits": info.hits, "misses": info.misses}
+
+    def clear(self) -> None:
+        """Drop all cached clients, e.g. to force credentials to be resolved again."""
+        _mlflow_client_cache().cache_clear()
+
+    def _reset_after_fork(self) -> None:
+        # Clients hold pooled sockets shared with the parent, and refresh locks another
+        # thread may have held at fork time, so a forked child builds its own.
+        self._lock = threading.Lock()
+        self.clear()
+
+
+_cache: Optional[S3ClientCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_s3_client_cache() -> S3ClientCache:
+    """Return the process-wide S3 client cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = S3ClientCache()
+        return _cache
+
+
+def _after_fork_in_child() -> None:
+    global _cache_lock
+    _cache_lock = threading.Lock()
+    if _cache is not None:
+        _cache._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -11,26 +11,151 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import asyncio
+import fnmatch
+import io
 import logging
+import mimetypes
 import os
 import posixpath
-from typing import Optional
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, as_completed, wait
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    INTERNAL_ERROR,
+    PERMISSION_DENIED,
+    RESOURCE_DOES_NOT_EXIST,
+    UNAUTHENTICATED,
+)
+from mlflow.store.artifact import s3_artifact_repo
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
 from mlflow.utils import rest_utils
-from mlflow.utils.request_utils import cloud_storage_http_request
+from mlflow.utils.file_utils import create_tmp_dir
 
+from sagemaker_mlflow.artifact_manifest import ArtifactManifest, ManifestEntry, default_manifest_dir, scan_directory
+from sagemaker_mlflow.artifact_packing import (
+    PACK_DIR_NAME,
+    PackedFile,
+    extract_pack_dir,
+    is_index_name,
+    pack_dir_path,
+    pack_files,
+    parse_index,
+    unpack_directory,
+)
+from sagemaker_mlflow.background_uploads import get_background_uploader
+from sagemaker_mlflow.bandwidth_limiter import ThrottledReader, get_bandwidth_limiter, resolve_priority
+from sagemaker_mlflow.buffer_reader import BufferReader, BytesLike, map_file
+from sagemaker_mlflow.download_cache import DownloadCache, download_cache_enabled, get_download_cache
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+from sagemaker_mlflow.hashing_reader import HashingReader, etag_matches
 from sagemaker_mlflow.host_creds import get_host_creds as _get_host_creds
+from sagemaker_mlflow.presigned_url_broker import DEFAULT_URL_EXPIRATION_SECONDS, PresignedUrlBroker
+from sagemaker_mlflow.s3_client_cache import get_s3_client_cache
+from sagemaker_mlflow.s3_transfer_config import ConfiguredTransferClient, load_transfer_config
+from sagemaker_mlflow.upload_connection_pool import get_upload_connection_pool
+from sagemaker_mlflow.upload_scheduler import get_upload_scheduler
+
+try:
+    from mlflow.store.artifact.artifact_repo import StreamUploadMixin
+except ImportError:  # mlflow versions without streamed uploads
+
+    class StreamUploadMixin:  # type: ignore[no-redef]
+        pass
+
 
 logger = logging.getLogger(__name__)
 
 _SAGEMAKER_PRESIGNED_URL_UPLOAD_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_ENABLED"
 
+_SAGEMAKER_PRESIGNED_URL_PREFETCH_DEPTH_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_PREFETCH_DEPTH"
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL"
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_SMALL_FILES_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_SMALL_FILES"
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD"
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_ARCHIVE_BYTES_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_ARCHIVE_BYTES"
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_ASYNC_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_ASYNC"
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_VERIFY_CHECKSUM_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_VERIFY_CHECKSUM"
+
+_SAGEMAKER_MLFLOW_DOWNLOAD_MAX_WORKERS_ENV_VAR = "SAGEMAKER_MLFLOW_DOWNLOAD_MAX_WORKERS"
+
+_DEFAULT_PACK_FILE_THRESHOLD = 1024 * 1024
+_DEFAULT_PACK_ARCHIVE_BYTES = 64 * 1024 * 1024
+
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Async upload streams larger than this are buffered in a temporary file rather than memory.
+_STREAM_SPOOL_BYTES = 64 * 1024 * 1024
+
+_MAX_DELETE_BATCH = 1000
+
 _PRESIGNED_UPLOAD_ENDPOINT = "/api/2.0/mlflow/artifacts/presigned-upload-url"
 
+_DEFAULT_PREFETCH_DEPTH = 8
+
+# mlflow only defines its own map of S3 error codes to error codes from 3.4 on.
+_BOTO_TO_MLFLOW_ERROR: Dict[str, int] = getattr(
+    s3_artifact_repo,
+    "BOTO_TO_MLFLOW_ERROR",
+    {
+        "AccessDenied": PERMISSION_DENIED,
+        "NoSuchBucket": RESOURCE_DOES_NOT_EXIST,
+        "NoSuchKey": RESOURCE_DOES_NOT_EXIST,
+        "InvalidAccessKeyId": UNAUTHENTICATED,
+        "SignatureDoesNotMatch": UNAUTHENTICATED,
+        "403": PERMISSION_DENIED,
+        "404": RESOURCE_DOES_NOT_EXIST,
+    },
+)
+
+
+def _buffer_body_opener(data: BytesLike) -> Callable[[], ContextManager[Tuple[Any, int]]]:
+    @contextmanager
+    def open_buffer() -> Iterator[Tuple[Any, int]]:
+        reader = BufferReader(data)
+        yield reader, len(reader)
+
+    return open_buffer
+
 
-class S3PresignedArtifactRepository(S3ArtifactRepository):
+def _tracking_server_region(tracking_uri: Optional[str]) -> Optional[str]:
+    """Return the Region of a SageMaker tracking server ARN, where its artifact store normally is.
+
+    Other tracking URIs give None, leaving the Region to boto3's own resolution. botocore
+    follows S3's redirect for a bucket in another Region.
+    """
+    parts = tracking_uri.split(":") if tracking_uri else []
+    if len(parts) < 6 or parts[0] != "arn" or not parts[3]:
+        return None
+    return parts[3]
+
+
+class S3PresignedArtifactRepository(S3ArtifactRepository, StreamUploadMixin):
     """S3 artifact repository with optional presigned URL upload support.
 
     Extends S3ArtifactRepository to optionally upload artifacts via presigned URLs
@@ -43,8 +168,9 @@ class S3PresignedArtifactRepository(S3ArtifactRepository):
     failure), the exception propagates to the caller — there is no silent fallback
     to direct S3.
 
-    When the environment variable is not set (the default), all behavior is
-    identical to the parent S3ArtifactRepository.
+    When the environment variable is not set (the default), uploads behave like the
+    parent S3ArtifactRepository's. Downloads and direct transfers share cached S3
+    clients and can be tuned as well; the README lists every setting.
     """
 
     def __init__(self, *args, **kwargs):
@@ -53,6 +179,59 @@ class S3PresignedArtifactRepository(S3ArtifactRepository):
             os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_ENV_VAR, "").lower() == "true"
         )
         self._run_id_warning_logged: bool = False
+        prefetch_depth = env_setting(_SAGEMAKER_PRESIGNED_URL_PREFETCH_DEPTH_ENV_VAR, int)
+        self._prefetch_depth: int = max(0, _DEFAULT_PREFETCH_DEPTH if prefetch_depth is None else prefetch_depth)
+        self._url_broker = PresignedUrlBroker(self._fetch_presigned_url)
+        self._upload_scheduler = get_upload_scheduler()
+        self._connection_pool = get_upload_connection_pool()
+        self._bandwidth_limiter = get_bandwidth_limiter()
+        self._incremental: bool = (
+            os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL_ENV_VAR, "").lower() == "true"
+        )
+        self._manifest_dir: str = default_manifest_dir()
+        self._manifest: Optional[ArtifactManifest] = None
+        self._pack_small_files: bool = (
+            os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_SMALL_FILES_ENV_VAR, "").lower() == "true"
+        )
+        pack_file_threshold = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD_ENV_VAR, parse_size)
+        self._pack_file_threshold: int = (
+            _DEFAULT_PACK_FILE_THRESHOLD if pack_file_threshold is None else pack_file_threshold
+        )
+        pack_archive_bytes = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_ARCHIVE_BYTES_ENV_VAR, parse_size)
+        self._pack_archive_bytes: int = (
+            _DEFAULT_PACK_ARCHIVE_BYTES if pack_archive_bytes is None else pack_archive_bytes
+        )
+        self._verify_checksum: bool = (
+            os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_VERIFY_CHECKSUM_ENV_VAR, "").lower() == "true"
+        )
+        self._async_uploads: bool = (
+            os.environ.get(_SAGEMAKER_PRESIGNED_URL_UPLOAD_ASYNC_ENV_VAR, "").lower() == "true"
+        )
+        self._submitted_background_uploads = False
+        self._transfer_config = load_transfer_config()
+        self._download_cache: Optional[DownloadCache] = get_download_cache() if download_cache_enabled() else None
+        # ETags seen while listing a directory, so cached downloads need no HEAD request.
+        self._listed_etags: Dict[str, str] = {}
+
+    def _get_s3_client(self):
+        """Return the shared S3 client, applying the configured transfer settings if any."""
+        s3_client = get_s3_client_cache().get_client(
+            access_key_id=getattr(self, "_access_key_id", None),
+            secret_access_key=getattr(self, "_secret_access_key", None),
+            session_token=getattr(self, "_session_token", None),
+            region_name=_tracking_server_region(self.tracking_uri),
+        )
+        if self._transfer_config is None:
+            return s3_client
+        return ConfiguredTransferClient(s3_client, self._transfer_config)
+
+    @property
+    def max_workers(self) -> int:
+        """Number of files downloaded or uploaded at once by the repository's thread pool."""
+        configured = env_setting(_SAGEMAKER_MLFLOW_DOWNLOAD_MAX_WORKERS_ENV_VAR, int)
+        if configured is not None:
+            return max(1, configured)
+        return super().max_workers
 
     def _should_use_presigned(self) -> bool:
         """Check whether presigned upload should be attempted for this call."""
@@ -63,33 +242,788 @@ class S3PresignedArtifactRepository(S3ArtifactRepository):
         )
 
     def log_artifact(self, local_file: str, artifact_path: Optional[str] = None) -> None:
+        if self._async_uploads and self._should_use_presigned():
+            self.log_artifact_async(local_file, artifact_path)
+        else:
+            self._log_artifact_now(local_file, artifact_path)
+
+    def log_artifacts(self, local_dir: str, artifact_path: Optional[str] = None) -> None:
+        if self._async_uploads and self._should_use_presigned():
+            self.log_artifacts_async(local_dir, artifact_path)
+        else:
+            self._log_artifacts_now(local_dir, artifact_path)
+
+    def log_artifact_async(self, local_file: str, artifact_path: Optional[str] = None) -> "Future[None]":
+        """Stage local_file and upload it in the background, whatever the async setting.
+
+        Returns:
+            A Future that resolves once the upload finished. Failures are also raised
+            by wait_all().
+        """
+        self._submitted_background_uploads = True
+        return get_background_uploader().submit(
+            local_file,
+            lambda staged_file: self._log_artifact_now(staged_file, artifact_path),
+            run_id=self._extract_run_id(),
+        )
+
+    def log_artifacts_async(self, local_dir: str, artifact_path: Optional[str] = None) -> "Future[None]":
+        """Like log_artifact_async, for the contents of local_dir."""
+        self._submitted_background_uploads = True
+        return get_background_uploader().submit(
+            local_dir,
+            lambda staged_dir: self._log_artifacts_now(staged_dir, artifact_path),
+            run_id=self._extract_run_id(),
+        )
+
+    def _log_artifact_now(self, local_file: str, artifact_path: Optional[str]) -> None:
         if self._should_use_presigned():
-            self._upload_via_presigned_url(local_file, artifact_path)
+            self._upload_files([(local_file, artifact_path)])
         else:
             super().log_artifact(local_file, artifact_path)
 
-    def log_artifacts(self, local_dir: str, artifact_path: Optional[str] = None) -> None:
-        if not self._should_use_presigned():
+    def _log_artifacts_now(self, local_dir: str, artifact_path: Optional[str]) -> None:
+        if self._should_use_presigned():
+            self._upload_directory(local_dir, artifact_path)
+        else:
             super().log_artifacts(local_dir, artifact_path)
+
+    def log_artifact_from_stream(
+        self, stream: Union[BytesLike, IO[bytes]], artifact_file_name: str, artifact_path: Optional[str] = None
+    ) -> None:
+        """Upload in-memory data as the artifact ``artifact_file_name`` without a temp file.
+
+        Args:
+            stream: bytes, bytearray or memoryview, or a binary file-like object. Buffers
+                and io.BytesIO contents are sent without being copied. Other seekable
+                streams are read from their current position and rewound for retries;
+                non-seekable streams are read into memory first so they can be retried.
+            artifact_file_name: File name of the artifact. Directory components are ignored.
+            artifact_path: Directory within the run's artifact directory.
+
+        The upload is synchronous, also in async mode. Without presigned uploads the data
+        is sent with the S3 client's upload_fileobj.
+        """
+        path = self._build_upload_path(artifact_file_name, artifact_path)
+        if self._incremental:
+            # The manifest describes local files; the object at this path no longer matches it.
+            manifest = self._get_manifest()
+            manifest.remove(path)
+            manifest.save()
+        if self._should_use_presigned():
+            self._put_via_presigned_url(path, self._stream_body_opener(stream))
             return
 
+        bucket, prefix = self.parse_s3_compliant_uri(self.artifact_uri)
+        # The same object metadata the parent's _upload_file sets for a file of this name.
+        extra_args: Dict[str, Any] = {}
+        guessed_type, guessed_encoding = mimetypes.guess_type(path)
+        if guessed_type is not None:
+            extra_args["ContentType"] = guessed_type
+        if guessed_encoding is not None:
+            extra_args["ContentEncoding"] = guessed_encoding
+        extra_args.update(getattr(self, "_bucket_owner_params", None) or {})
+        extra_args.update(self.get_s3_file_upload_extra_args() or {})
+        fileobj = io.BytesIO(stream) if isinstance(stream, (bytes, bytearray, memoryview)) else stream
+        self._get_s3_client().upload_fileobj(fileobj, bucket, posixpath.join(prefix, path), ExtraArgs=extra_args)
+
+    async def log_artifact_from_async_stream(
+        self, chunks: AsyncIterable[bytes], artifact_file_name: str, artifact_path: Optional[str] = None
+    ) -> None:
+        """Upload the chunks of an async stream, as the mlflow server does for proxied uploads.
+
+        Chunks are buffered in memory up to 64 MiB, and in an anonymous temporary file
+        beyond that, so that the upload knows its size and can be retried.
+        """
+        buffer: IO[bytes] = io.BytesIO()
+        try:
+            async for chunk in chunks:
+                if isinstance(buffer, io.BytesIO) and buffer.tell() + len(chunk) > _STREAM_SPOOL_BYTES:
+                    spilled = tempfile.TemporaryFile()
+                    spilled.write(buffer.getbuffer())
+                    buffer = spilled
+                buffer.write(chunk)
+            buffer.seek(0)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.log_artifact_from_stream, buffer, artifact_file_name, artifact_path
+            )
+        finally:
+            # A BytesIO cannot be closed while views of it handed to the upload are alive;
+            # it is freed with its last reference.
+            if not isinstance(buffer, io.BytesIO):
+                buffer.close()
+
+    @staticmethod
+    def _stream_body_opener(stream: Union[BytesLike, IO[bytes]]) -> Callable[[], ContextManager[Tuple[Any, int]]]:
+        """Return an ``open_body`` callable for _put_via_presigned_url over in-memory data."""
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            return _buffer_body_opener(stream)
+        if hasattr(stream, "getbuffer"):
+            return _buffer_body_opener(stream.getbuffer()[stream.tell() :])
+        if not stream.seekable():
+            return _buffer_body_opener(stream.read())
+
+        start = stream.tell()
+        size = stream.seek(0, os.SEEK_END) - start
+
+        @contextmanager
+        def open_stream() -> Iterator[Tuple[Any, int]]:
+            stream.seek(start)
+            yield HashingReader(stream, size, ()), size
+
+        return open_stream
+
+    def wait_all(self, timeout: Optional[float] = None) -> None:
+        """Wait for this run's background uploads to finish.
+
+        Raises:
+            BackgroundUploadError: If any of the uploads failed.
+        """
+        get_background_uploader().wait_all(self._extract_run_id(), timeout)
+
+    def flush_async_logging(self):
+        flush = getattr(super(), "flush_async_logging", None)
+        if flush is not None:
+            flush()
+        if self._submitted_background_uploads:
+            self.wait_all()
+
+    def _upload_directory(self, local_dir: str, artifact_path: Optional[str]) -> None:
+        uploads = list(self._iter_local_files(local_dir, artifact_path))
+        if self._pack_small_files:
+            self._upload_packed(local_dir, artifact_path, uploads)
+        else:
+            self._upload_files(uploads)
+
+    def _upload_packed(
+        self, local_dir: str, artifact_path: Optional[str], uploads: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        """Upload small files as packed archives and the remaining files individually."""
+        is_small = [os.path.getsize(local_file) <= self._pack_file_threshold for local_file, _ in uploads]
+        small = [upload for upload, small_file in zip(uploads, is_small) if small_file]
+        logged_large = [upload for upload, small_file in zip(uploads, is_small) if not small_file]
+        # Large files are skipped when unchanged and hashed while they upload, as without packing.
+        large, large_paths, large_entries = self._select_changed(logged_large, hash_new=False)
+        small, small_paths, small_entries = self._select_changed(small)
+        try:
+            if len(small) < 2:
+                self._upload_selected(large + small, large_paths + small_paths, large_entries + small_entries)
+                return
+            self._upload_selected_packed(
+                local_dir, artifact_path, logged_large, large, large_paths, large_entries, small, small_paths
+            )
+            if self._incremental:
+                manifest = self._get_manifest()
+                for path, entry in zip(small_paths, small_entries):
+                    if entry is not None:
+                        manifest.record(path, entry)
+        finally:
+            if self._incremental:
+                self._get_manifest().save()
+
+    def _upload_selected_packed(
+        self,
+        local_dir: str,
+        artifact_path: Optional[str],
+        logged_large: List[Tuple[str, Optional[str]]],
+        large: List[Tuple[str, Optional[str]]],
+        large_paths: List[str],
+        large_entries: List[Optional[ManifestEntry]],
+        small: List[Tuple[str, Optional[str]]],
+        small_paths: List[str],
+    ) -> None:
+        """Pack the small files and upload the archives, the large files and then the
+        index, deleting what the new pack supersedes.
+
+        logged_large holds every large file of the call, changed or not; large, with its
+        paths and manifest entries, only those to upload.
+        """
         local_dir = os.path.abspath(local_dir)
-        for root, _, filenames in os.walk(local_dir):
-            if root == local_dir:
-                rel_dir = ""
+
+        def relative_path(local_file: str) -> str:
+            return os.path.relpath(local_file, local_dir).replace(os.sep, "/")
+
+        packed = [(local_file, relative_path(local_file)) for local_file, _ in small]
+        pack_path = pack_dir_path(artifact_path)
+        existing = self._list_artifact_paths(artifact_path)
+        # Entries of earlier packs for files not logged again are carried over, so the
+        # new index supersedes every earlier one.
+        earlier_indexes = sorted(
+            (
+                posixpath.basename(path)
+                for path in existing
+                if posixpath.dirname(path) == pack_path and is_index_name(posixpath.basename(path))
+            ),
+            reverse=True,
+        )
+        earlier: Dict[str, PackedFile] = {}
+        for index_name in reversed(earlier_indexes):
+            earlier.update(self._read_pack_index(pack_path, index_name))
+        relogged = {path for _, path in packed} | {relative_path(local_file) for local_file, _ in logged_large}
+        carried = {path: entry for path, entry in earlier.items() if path not in relogged}
+        with tempfile.TemporaryDirectory() as pack_dir:
+            archive_paths, index_path = pack_files(packed, pack_dir, self._pack_archive_bytes, carried=carried)
+            logger.debug("Packed %d small artifacts into %d archives", len(packed), len(archive_paths))
+            # Archives always upload: every pack has new names.
+            self._upload_selected(
+                large + [(archive, pack_path) for archive in archive_paths],
+                large_paths + [self._build_upload_path(archive, pack_path) for archive in archive_paths],
+                large_entries + [None] * len(archive_paths),
+            )
+            # The index goes last so that it never references an archive that is missing.
+            self._upload_selected([(index_path, pack_path)], [self._build_upload_path(index_path, pack_path)], [None])
+
+        superseded_archives = {entry.archive for entry in earlier.values()} - {
+            entry.archive for entry in carried.values()
+        }
+        self._delete_superseded(
+            [posixpath.join(pack_path, name) for name in earlier_indexes + sorted(superseded_archives)]
+            # Individually uploaded copies would otherwise win over the packed ones.
+            + [path for path in small_paths if path in existing]
+        )
+
+    def _get_manifest(self) -> ArtifactManifest:
+        if self._manifest is None:
+            self._manifest = ArtifactManifest(self.artifact_uri, self._manifest_dir)
+        return self._manifest
+
+    def _select_changed(
+        self, uploads: List[Tuple[str, Optional[str]]], hash_new: bool = True
+    ) -> Tuple[List[Tuple[str, Optional[str]]], List[str], List[Optional[ManifestEntry]]]:
+        """Drop files unchanged since their last upload when in incremental mode.
+
+        With hash_new False, files not in the manifest are not hashed up front; their
+        entries have an empty sha256 for the upload to fill in.
+
+        Returns:
+            The uploads still to perform, their upload paths, and for each the manifest
+            entry to record once it succeeds (None outside incremental mode).
+        """
+        upload_paths = [self._build_upload_path(local_file, file_path) for local_file, file_path in uploads]
+        if not self._incremental:
+            return uploads, upload_paths, [None] * len(uploads)
+        changed = self._get_manifest().find_changed(
+            [(upload[0], path) for upload, path in zip(uploads, upload_paths)], hash_new=hash_new
+        )
+        logger.debug("Skipping %d unchanged artifacts", len(uploads) - len(changed))
+        return (
+            [uploads[i] for i, _ in changed],
+            [upload_paths[i] for i, _ in changed],
+            [entry for _, entry in changed],
+        )
+
+    def _upload_files(self, uploads: List[Tuple[str, Optional[str]]], skip_unchanged: bool = True) -> None:
+        """Upload (local_file, artifact_path) pairs via presigned URLs.
+
+        Multiple files are uploaded concurrently; the first failure is re-raised after
+        in-flight uploads finish. In incremental mode unchanged files are skipped, unless
+        skip_unchanged is False, and the manifest is updated for every file that
+        uploaded successfully.
+        """
+        manifest_entries: List[Optional[ManifestEntry]]
+        if skip_unchanged:
+            # New files are hashed while they upload rather than in a separate read.
+            uploads, upload_paths, manifest_entries = self._select_changed(uploads, hash_new=False)
+        else:
+            upload_paths = [self._build_upload_path(local_file, file_path) for local_file, file_path in uploads]
+            manifest_entries = [None] * len(uploads)
+        try:
+            self._upload_selected(uploads, upload_paths, manifest_entries)
+        finally:
+            if self._incremental and skip_unchanged:
+                self._get_manifest().save()
+
+    def _upload_selected(
+        self,
+        uploads: List[Tuple[str, Optional[str]]],
+        upload_paths: List[str],
+        manifest_entries: List[Optional[ManifestEntry]],
+    ) -> None:
+        """Upload files via presigned URLs, recording manifest entries that are not None.
+
+        An entry with an empty sha256 gets the checksum computed during the upload. The
+        manifest is not saved here.
+        """
+        # Each file is prefetched at most once and never after its upload started: with
+        # concurrent workers a late prefetch could otherwise refetch a URL that was
+        # already used and discarded.
+        prefetch_lock = threading.Lock()
+        started = [False] * len(uploads)
+        prefetched_up_to = [0]
+
+        def upload(i: int) -> None:
+            with prefetch_lock:
+                started[i] = True
+                if self._prefetch_depth:
+                    end = min(len(uploads), i + 1 + self._prefetch_depth)
+                    start = max(prefetched_up_to[0], i + 1)
+                    self._url_broker.prefetch([upload_paths[j] for j in range(start, end) if not started[j]])
+                    prefetched_up_to[0] = max(prefetched_up_to[0], end)
+            local_file, file_artifact_path = uploads[i]
+            entry = manifest_entries[i]
+            needs_sha256 = entry is not None and not entry.sha256
+            sha256 = self._upload_via_presigned_url(local_file, file_artifact_path, compute_sha256=needs_sha256)
+            if entry is not None:
+                if needs_sha256:
+                    entry = entry._replace(sha256=sha256 or "")
+                self._get_manifest().record(upload_paths[i], entry)
+
+        if len(uploads) == 1:
+            upload(0)
+        elif uploads:
+            self._run_concurrently(upload, len(uploads))
+
+    def sync_artifacts(
+        self, local_dir: str, artifact_path: Optional[str] = None, delete: bool = False
+    ) -> Dict[str, int]:
+        """Mirror local_dir to artifact_path, uploading only new and modified files.
+
+        The local tree is compared against the artifact manifest (see ArtifactManifest)
+        rather than a remote listing: files whose size and mtime match the manifest are
+        skipped after a stat, and only files whose metadata changed are hashed. The scan
+        and the uploads both run in parallel. Uploads use presigned URLs when enabled
+        and the S3 client otherwise; files are always uploaded individually, without
+        small-file packing.
+
+        Args:
+            local_dir: Local directory to mirror.
+            artifact_path: Directory within the run's artifact directory to mirror into.
+            delete: Also delete artifacts under artifact_path that were uploaded from
+                this machine but no longer exist locally. Deletion goes through the S3
+                client, so it needs direct S3 permissions even in presigned mode.
+
+        Returns:
+            Counts of "uploaded", "unchanged" and "deleted" files.
+        """
+        local_dir = os.path.abspath(local_dir)
+        scanned = scan_directory(local_dir)
+        uploads = [
+            (local_file, self._artifact_dir(os.path.relpath(os.path.dirname(local_file), local_dir), artifact_path))
+            for local_file, _ in scanned
+        ]
+        upload_paths = [self._build_upload_path(local_file, file_path) for local_file, file_path in uploads]
+        use_presigned = self._should_use_presigned()
+        manifest = self._get_manifest()
+        changed = manifest.find_changed(
+            [(upload[0], path) for upload, path in zip(uploads, upload_paths)],
+            # Presigned uploads hash new files while sending them.
+            hash_new=not use_presigned,
+            stats=[stat for _, stat in scanned],
+        )
+        selected = [uploads[i] for i, _ in changed]
+        selected_paths = [upload_paths[i] for i, _ in changed]
+        entries: List[Optional[ManifestEntry]] = [entry for _, entry in changed]
+        deleted = 0
+        try:
+            if use_presigned:
+                self._upload_selected(selected, selected_paths, entries)
             else:
-                rel_dir = os.path.relpath(root, local_dir)
+                self._upload_selected_direct(selected, selected_paths, entries)
+            if delete:
+                deleted = self._delete_stale(artifact_path, set(upload_paths))
+        finally:
+            manifest.save()
+        logger.debug("Synced %s: %d uploaded, %d deleted", local_dir, len(changed), deleted)
+        return {"uploaded": len(changed), "unchanged": len(uploads) - len(changed), "deleted": deleted}
+
+    def _upload_selected_direct(
+        self,
+        uploads: List[Tuple[str, Optional[str]]],
+        upload_paths: List[str],
+        manifest_entries: List[Optional[ManifestEntry]],
+    ) -> None:
+        """Upload files with the S3 client, recording their manifest entries."""
+        if not uploads:
+            return
+        bucket, prefix = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_client = self._get_s3_client()
+
+        def upload(i: int) -> None:
+            self._upload_file(s3_client, uploads[i][0], bucket, posixpath.join(prefix, upload_paths[i]))
+            entry = manifest_entries[i]
+            if entry is not None:
+                self._get_manifest().record(upload_paths[i], entry)
+
+        self._run_concurrently(upload, len(uploads))
+
+    def _delete_stale(self, artifact_path: Optional[str], local_paths: Set[str]) -> int:
+        """Delete manifest-tracked artifacts under artifact_path that are not in local_paths."""
+        manifest = self._get_manifest()
+        prefix = artifact_path.strip("/") + "/" if artifact_path and artifact_path.strip("/") else ""
+        stale = sorted(path for path in manifest.paths() if path.startswith(prefix) and path not in local_paths)
+        if not stale:
+            return 0
+        bucket, key_prefix = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_client = self._get_s3_client()
+        for start in range(0, len(stale), _MAX_DELETE_BATCH):
+            batch = stale[start : start + _MAX_DELETE_BATCH]
+            s3_client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": posixpath.join(key_prefix, path)} for path in batch], "Quiet": True},
+                **getattr(self, "_bucket_owner_params", {}),
+            )
+            for path in batch:
+                manifest.remove(path)
+        return len(stale)
+
+    def _run_concurrently(self, task: Callable[[int], None], count: int) -> None:
+        """Run task(0..count-1) on a bounded pool and re-raise the first failure."""
+        max_workers = min(count, self._upload_scheduler.max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SageMakerPresignedUpload") as executor:
+            futures = [executor.submit(task, i) for i in range(count)]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        # Re-raise the first failure in submission order once in-flight uploads finish.
+        for future in futures:
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                raise error
+
+    def get_upload_stats(self) -> Dict[str, Any]:
+        """Return retry, throttling, concurrency, connection and bandwidth counters for presigned uploads.
+
+        The counters are process-wide, covering every repository in this process.
+        """
+        return {
+            **self._upload_scheduler.stats(),
+            **self._connection_pool.stats(),
+            **self._bandwidth_limiter.stats(),
+        }
+
+    @staticmethod
+    def _artifact_dir(rel_dir: str, artifact_path: Optional[str]) -> Optional[str]:
+        """Artifact directory of a file in rel_dir (relative to the logged directory)."""
+        rel_dir = "" if rel_dir == os.curdir else rel_dir.replace(os.sep, "/")
+        if artifact_path and rel_dir:
+            return posixpath.join(artifact_path, rel_dir)
+        return artifact_path or rel_dir or None
+
+    @staticmethod
+    def _iter_local_files(local_dir: str, artifact_path: Optional[str]) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (local_file, artifact_path) for every file under local_dir."""
+        local_dir = os.path.abspath(local_dir)
+        for root, _, filenames in os.walk(local_dir):
+            file_artifact_path = S3PresignedArtifactRepository._artifact_dir(
+                os.path.relpath(root, local_dir), artifact_path
+            )
             for filename in filenames:
-                local_file = os.path.join(root, filename)
-                if artifact_path and rel_dir:
-                    file_artifact_path = posixpath.join(artifact_path, rel_dir.replace(os.sep, "/"))
-                elif artifact_path:
-                    file_artifact_path = artifact_path
-                elif rel_dir:
-                    file_artifact_path = rel_dir.replace(os.sep, "/")
-                else:
-                    file_artifact_path = None
-                self.log_artifact(local_file, file_artifact_path)
+                yield os.path.join(root, filename), file_artifact_path
+
+    def download_artifacts(self, artifact_path, dst_path=None):
+        """Download artifacts, extracting any packed small files in place."""
+        local_path = super().download_artifacts(artifact_path, dst_path)
+        if os.path.isdir(local_path):
+            unpack_directory(local_path)
+        return local_path
+
+    def iter_download_artifacts(
+        self,
+        artifact_path: Optional[str] = None,
+        dst_path: Optional[str] = None,
+        order: Optional[Sequence[str]] = None,
+    ) -> Iterator[str]:
+        """Download artifacts, yielding the local path of each file as soon as it has landed.
+
+        Files are submitted to the download pool in the order given by ``order``, a
+        sequence of glob patterns matched against each file's path relative to
+        artifact_path: files matching the first pattern go first, and files matching no
+        pattern go last. They are yielded in the order they complete, so a small file
+        submitted early is not held back by a large one. Packed small files are fetched
+        before everything else and yielded once their pack has been extracted.
+
+        The first failed download cancels the pending ones and is raised from the
+        generator; closing the generator early cancels them as well.
+
+        Args:
+            artifact_path: Artifact file or directory to download; the root if None.
+            dst_path: Existing local directory to download into, or None for a new
+                temporary directory.
+            order: Glob patterns, most urgent first, e.g. ``["*.json", "tokenizer*",
+                "*.safetensors"]``.
+        """
+        if dst_path is None:
+            dst_path = create_tmp_dir()
+        dst_path = os.path.abspath(dst_path)
+        if not os.path.isdir(dst_path):
+            raise MlflowException(f"The destination path for downloaded artifacts must be a directory: {dst_path}")
+
+        if artifact_path and not self._is_directory(artifact_path):
+            local_path = self._create_download_destination(src_artifact_path=artifact_path, dst_local_dir_path=dst_path)
+            self._download_file(artifact_path, local_path)
+            yield local_path
+            return
+
+        patterns = list(order or [])
+        base = artifact_path.strip("/") if artifact_path else ""
+
+        def rank(path: str) -> Tuple[int, int]:
+            relative_path = posixpath.relpath(path, base) if base else path
+            if PACK_DIR_NAME in relative_path.split("/"):
+                return (0, 0)
+            for i, pattern in enumerate(patterns):
+                if fnmatch.fnmatch(relative_path, pattern):
+                    return (1, i)
+            return (1, len(patterns))
+
+        files = []
+        for file_info in self._iter_artifacts_recursive(artifact_path or ""):
+            if file_info.is_dir:
+                os.makedirs(os.path.join(dst_path, os.path.normpath(file_info.path)), exist_ok=True)
+            else:
+                files.append(file_info.path)
+        files.sort(key=rank)
+
+        local_paths = {
+            path: self._create_download_destination(src_artifact_path=path, dst_local_dir_path=dst_path)
+            for path in files
+        }
+        # Objects still to download per local pack directory; it is extracted once complete.
+        pack_pending: Dict[str, int] = {}
+        for path in files:
+            if PACK_DIR_NAME in path.split("/"):
+                pack_dir = os.path.dirname(local_paths[path])
+                pack_pending[pack_dir] = pack_pending.get(pack_dir, 0) + 1
+        unpacked_paths = {local_path for path, local_path in local_paths.items() if path not in pack_pending}
+
+        futures = {self.thread_pool.submit(self._download_file, path, local_paths[path]): path for path in files}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                local_path = local_paths[futures[future]]
+                pack_dir = os.path.dirname(local_path)
+                if pack_dir not in pack_pending:
+                    yield local_path
+                    continue
+                pack_pending[pack_dir] -= 1
+                if not pack_pending[pack_dir]:
+                    # Individually uploaded files win over packed copies, as in unpack_pack_dir.
+                    yield from extract_pack_dir(pack_dir, skip=unpacked_paths)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def download_artifacts_streaming(
+        self,
+        artifact_path: Optional[str],
+        on_file: Callable[[str], None],
+        dst_path: Optional[str] = None,
+        order: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Like iter_download_artifacts, calling on_file with each local path instead.
+
+        on_file runs on the calling thread while the remaining files keep downloading.
+
+        Returns:
+            The local path of the downloaded artifact_path.
+        """
+        if dst_path is None:
+            dst_path = create_tmp_dir()
+        for local_path in self.iter_download_artifacts(artifact_path, dst_path, order):
+            on_file(local_path)
+        return os.path.join(os.path.abspath(dst_path), os.path.normpath(artifact_path)) if artifact_path else dst_path
+
+    def _iter_artifacts_recursive(self, path):
+        """Yield the files under path, and its empty directories, from one flat listing.
+
+        Keys come back in lexicographic order, so everything under a directory marker
+        follows it directly; a marker is reported as an empty directory only if nothing
+        does.
+        """
+        from botocore.exceptions import ClientError
+
+        bucket, root_path = self.parse_s3_compliant_uri(self.artifact_uri)
+        dest_path = posixpath.join(root_path, path) if path else root_path
+        dest_path = dest_path.rstrip("/") if dest_path else ""
+        prefix = dest_path + "/" if dest_path else ""
+        found = False
+        empty_dir: Optional[str] = None
+        try:
+            paginator = self._get_s3_client().get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix, **getattr(self, "_bucket_owner_params", {})):
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    self._verify_listed_object_contains_artifact_path_prefix(
+                        listed_object_path=key, artifact_path=root_path
+                    )
+                    if empty_dir is not None and not key.startswith(empty_dir):
+                        yield FileInfo(posixpath.relpath(empty_dir, root_path), True, None)
+                    empty_dir = None
+                    if key == prefix:
+                        continue
+                    found = True
+                    if key.endswith("/"):
+                        empty_dir = key
+                    else:
+                        rel_path = posixpath.relpath(key, root_path)
+                        if self._download_cache is not None and obj.get("ETag"):
+                            self._listed_etags[rel_path] = obj["ETag"]
+                        yield FileInfo(rel_path, False, int(obj.get("Size", 0)))
+        except ClientError as error:
+            raise MlflowException(
+                f"Failed to list artifacts in {self.artifact_uri}: {error.response['Error']['Message']}",
+                error_code=_BOTO_TO_MLFLOW_ERROR.get(error.response["Error"]["Code"], INTERNAL_ERROR),
+            )
+        if empty_dir is not None:
+            yield FileInfo(posixpath.relpath(empty_dir, root_path), True, None)
+        if not found:
+            yield FileInfo(path, True, None)
+
+    def _download_file(self, remote_file_path, local_path):
+        """Download a file atomically, through the download cache if it is enabled."""
+        etag = self._object_etag(remote_file_path) if self._download_cache is not None else None
+        if self._download_cache is None or etag is None:
+            partial_path = f"{local_path}.{uuid.uuid4().hex[:8]}.part"
+            try:
+                self._fetch_file(remote_file_path, partial_path)
+                os.replace(partial_path, local_path)
+            except BaseException:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+                raise
+            return
+        self._download_cache.fetch(
+            posixpath.join(self.artifact_uri, remote_file_path),
+            etag,
+            local_path,
+            lambda path: self._fetch_file(remote_file_path, path),
+        )
+
+    def _fetch_file(self, remote_file_path: str, local_path: str) -> None:
+        """Fetch a file from S3, falling back to a ranged read when it only exists packed."""
+        from botocore.exceptions import ClientError
+
+        try:
+            super()._download_file(remote_file_path, local_path)
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                raise
+            if not self._download_packed_file(remote_file_path, local_path):
+                raise
+
+    def _object_etag(self, remote_file_path: str) -> Optional[str]:
+        """ETag of an artifact, from the last directory listing or a HEAD request.
+
+        Returns None if the object cannot be found, e.g. because it only exists packed.
+        """
+        from botocore.exceptions import ClientError
+
+        etag = self._listed_etags.pop(remote_file_path, None)
+        if etag is not None:
+            return etag
+        bucket, root_path = self.parse_s3_compliant_uri(self.artifact_uri)
+        try:
+            response = self._get_s3_client().head_object(
+                Bucket=bucket,
+                Key=posixpath.join(root_path, remote_file_path),
+                **getattr(self, "_bucket_owner_params", {}),
+            )
+        except ClientError:
+            return None
+        return response.get("ETag")
+
+    def _download_packed_file(self, remote_file_path: str, local_path: str) -> bool:
+        """Fetch a file from the pack archive that holds it, if any.
+
+        Pack directories of every enclosing artifact directory are searched, nearest
+        first, and within each the most recent index listing the file wins.
+
+        Returns:
+            True if the file was found in a pack and written to local_path.
+        """
+        bucket, root_path = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_client = self._get_s3_client()
+        bucket_owner_params = getattr(self, "_bucket_owner_params", {})
+        parent = posixpath.dirname(remote_file_path)
+        while True:
+            pack_path = pack_dir_path(parent)
+            relative_path = posixpath.relpath(remote_file_path, parent) if parent else remote_file_path
+            for index_name in self._pack_index_names(pack_path):
+                packed = self._read_pack_index(pack_path, index_name).get(relative_path)
+                if packed is None:
+                    continue
+                with open(local_path, "wb") as f:
+                    # An empty file has no byte range to request.
+                    if packed.size:
+                        response = s3_client.get_object(
+                            Bucket=bucket,
+                            Key=posixpath.join(root_path, pack_path, packed.archive),
+                            Range=f"bytes={packed.offset}-{packed.offset + packed.size - 1}",
+                            **bucket_owner_params,
+                        )
+                        for chunk in response["Body"].iter_chunks(_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                logger.debug("Downloaded packed artifact %s from %s", remote_file_path, packed.archive)
+                return True
+            if not parent:
+                return False
+            parent = posixpath.dirname(parent)
+
+    def _pack_index_names(self, pack_path: str) -> List[str]:
+        """Names of the pack indexes in the pack directory at pack_path, newest first."""
+        return sorted(
+            (
+                posixpath.basename(file_info.path)
+                for file_info in self.list_artifacts(pack_path)
+                if not file_info.is_dir and is_index_name(posixpath.basename(file_info.path))
+            ),
+            reverse=True,
+        )
+
+    def _read_pack_index(self, pack_path: str, index_name: str) -> Dict[str, PackedFile]:
+        bucket, root_path = self.parse_s3_compliant_uri(self.artifact_uri)
+        index_body = self._get_s3_client().get_object(
+            Bucket=bucket,
+            Key=posixpath.join(root_path, pack_path, index_name),
+            **getattr(self, "_bucket_owner_params", {}),
+        )["Body"]
+        return parse_index(index_body.read())
+
+    def _list_artifact_paths(self, artifact_path: Optional[str]) -> Set[str]:
+        """Paths of every object under artifact_path, relative to the artifact root."""
+        bucket, root_path = self.parse_s3_compliant_uri(self.artifact_uri)
+        dest_path = posixpath.join(root_path, artifact_path) if artifact_path else root_path
+        prefix = dest_path.rstrip("/") + "/" if dest_path else ""
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        return {
+            posixpath.relpath(obj["Key"], root_path) if root_path else obj["Key"]
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix, **getattr(self, "_bucket_owner_params", {}))
+            for obj in page.get("Contents", [])
+            if not obj["Key"].endswith("/")
+        }
+
+    def _delete_superseded(self, paths: List[str]) -> None:
+        """Delete artifacts superseded by a new pack, keeping them if that is not permitted.
+
+        Objects that remain are harmless for pack indexes and archives, which the new
+        index replaces, but an individually uploaded copy keeps winning over its packed
+        file.
+        """
+        from botocore.exceptions import ClientError
+
+        if not paths:
+            return
+        bucket, key_prefix = self.parse_s3_compliant_uri(self.artifact_uri)
+        s3_client = self._get_s3_client()
+        failed = 0
+        for start in range(0, len(paths), _MAX_DELETE_BATCH):
+            batch = paths[start : start + _MAX_DELETE_BATCH]
+            try:
+                response = s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": posixpath.join(key_prefix, path)} for path in batch], "Quiet": True},
+                    **getattr(self, "_bucket_owner_params", {}),
+                )
+            except ClientError:
+                failed += len(batch)
+            else:
+                failed += len(response.get("Errors", []))
+        if failed:
+            logger.warning(
+                "Could not delete %d artifacts superseded by packed small files; older individually "
+                "uploaded copies of those files still take precedence on download",
+                failed,
+            )
 
     def _extract_run_id(self) -> Optional[str]:
         """Extract run_id from artifact_uri using reverse scan for last 'artifacts' segment.
@@ -136,7 +1070,7 @@ class S3PresignedArtifactRepository(S3ArtifactRepository):
             return posixpath.join(artifact_path, filename)
         return filename
 
-    def _request_presigned_url(self, run_id: str, path: str, expiration: int = 900):
+    def _request_presigned_url(self, run_id: str, path: str, expiration: int = DEFAULT_URL_EXPIRATION_SECONDS):
         """Request a presigned upload URL from the tracking server (SigV4-authenticated)."""
         host_creds = self._get_tracking_host_creds()
         return rest_utils.http_request(
@@ -148,39 +1082,96 @@ class S3PresignedArtifactRepository(S3ArtifactRepository):
             max_retries=0,
         )
 
-    def _upload_via_presigned_url(self, local_file: str, artifact_path: Optional[str]) -> None:
+    def _fetch_presigned_url(self, path: str, expiration: int) -> Tuple[str, Dict[str, str]]:
+        """Fetch a presigned upload URL and its required headers for the broker."""
+        run_id = self._extract_run_id()
+        if run_id is None:
+            raise Exception(f"Could not extract run_id from artifact URI: {self.artifact_uri}")
+        response = self._request_presigned_url(run_id, path, expiration)
+
+        if not response.ok:
+            raise Exception(
+                f"Presigned upload URL request failed (HTTP {response.status_code})"
+            )
+
+        response_json = response.json()
+        return response_json.get("presigned_url"), response_json.get("headers", {})
+
+    def _upload_via_presigned_url(
+        self, local_file: str, artifact_path: Optional[str], compute_sha256: bool = False
+    ) -> Optional[str]:
         """Upload a file via a presigned URL.
 
         Two distinct HTTP paths:
         1. Tracking server API call (_request_presigned_url): SigV4-authenticated
-           via rest_utils.http_request.
+           via rest_utils.http_request. Issued through the URL broker, which may
+           already hold a prefetched or still-valid URL for this path.
         2. S3 presigned URL PUT: NO auth — authorization is embedded in the
-           presigned URL signature. Uses cloud_storage_http_request (same pattern
-           as presigned_url_artifact_repo.py and optimized_s3_artifact_repo.py).
+           presigned URL signature. Sent on the shared UploadConnectionPool so
+           connections to S3 are kept alive across uploads.
+
+        Streams the file directly to avoid loading large artifacts into memory. Large
+        files are memory-mapped (see buffer_reader.map_file), so the transport sends
+        views of the page cache in 1 MiB blocks instead of copying small chunks.
+        Each attempt reopens the file, so the scheduler can retry throttled or
+        transiently failed PUTs. The URL is only released once the PUT succeeds, so a
+        retried upload of the same path reuses it while it remains valid.
+
+        Checksums are computed by a HashingReader as the body is sent, so the file is
+        read once per attempt. With checksum verification on, the MD5 of the body is
+        compared to the ETag S3 returns, and a mismatch raises.
 
-        Streams the file directly to avoid loading large artifacts into memory.
+        Returns:
+            The hex SHA-256 of the uploaded file if compute_sha256 is set and the whole
+            file was sent, else None.
         """
         path = self._build_upload_path(local_file, artifact_path)
-        run_id = self._extract_run_id()
 
-        response = self._request_presigned_url(run_id, path)
+        @contextmanager
+        def open_body() -> Iterator[Tuple[Any, int]]:
+            with open(local_file, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                with map_file(f, size) as body:
+                    yield body, size
 
-        if not response.ok:
-            raise Exception(
-                f"Presigned upload URL request failed (HTTP {response.status_code})"
-            )
+        return self._put_via_presigned_url(path, open_body, compute_sha256)
 
-        response_json = response.json()
-        presigned_url = response_json.get("presigned_url")
-        headers = response_json.get("headers", {})
-
-        with open(local_file, "rb") as f:
-            put_response = cloud_storage_http_request(
-                "put",
-                presigned_url,
-                data=f,
-                headers=headers,
-            )
-            put_response.raise_for_status()
+    def _put_via_presigned_url(
+        self, path: str, open_body: Callable[[], ContextManager[Tuple[Any, int]]], compute_sha256: bool = False
+    ) -> Optional[str]:
+        """PUT a request body to ``path`` through a presigned URL.
+
+        ``open_body`` returns a context manager yielding a fresh (file-like, size) pair
+        positioned at the start of the data; it is entered once per attempt.
+        """
+        algorithms = (["md5"] if self._verify_checksum else []) + (["sha256"] if compute_sha256 else [])
+        readers: List[HashingReader] = []
 
+        def send_put():
+            presigned_url = self._url_broker.get(path)
+            with open_body() as (f, size):
+                body = f
+                if algorithms:
+                    body = HashingReader(f, size, algorithms)
+                    readers.append(body)
+                if self._bandwidth_limiter.rate is not None:
+                    body = ThrottledReader(body, size, self._bandwidth_limiter, resolve_priority(size))
+                # The pool does not retry: retries are driven by the upload scheduler so
+                # that throttling responses reach its concurrency control.
+                return self._connection_pool.request("put", presigned_url.url, data=body, headers=presigned_url.headers)
+
+        put_response = self._upload_scheduler.send(send_put)
+        put_response.raise_for_status()
+
+        self._url_broker.discard(path)
+        reader = readers[-1] if readers and readers[-1].complete else None
+        if self._verify_checksum:
+            if reader is None:
+                raise Exception(f"Presigned upload of {path} did not send the whole file")
+            if etag_matches(put_response.headers, reader.hexdigest("md5")) is False:
+                raise Exception(
+                    f"Presigned upload of {path} failed integrity check: S3 ETag "
+                    f"{put_response.headers.get('ETag')} does not match MD5 {reader.hexdigest('md5')}"
+                )
         logger.debug("Artifact uploaded via presigned URL: %s", path)
+        return reader.hexdigest("sha256") if compute_sha256 and reader is not None else None
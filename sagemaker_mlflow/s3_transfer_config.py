@@ -0,0 +1,142 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+
+_SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD_ENV_VAR = "SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD"
+_SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE_ENV_VAR = "SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE"
+_SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY_ENV_VAR = "SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY"
+_SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH_ENV_VAR = "SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH"
+_SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT_ENV_VAR = "SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT"
+
+_MIN_PART_SIZE = 5 * 1024 * 1024
+_MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+_MAX_CONCURRENCY = 1024
+_TRANSFER_CLIENTS = ("classic", "crt", "auto")
+
+
+def _crt_available() -> bool:
+    try:
+        import awscrt  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def load_transfer_config() -> Optional["TransferConfig"]:
+    """Build a TransferConfig for direct S3 transfers from the environment.
+
+    All settings are optional:
+
+    * SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD: size from which transfers are split into
+      parts, e.g. ``64MB``.
+    * SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE: part size, between 5 MiB and 5 GiB.
+    * SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY: concurrent part transfers per file.
+    * SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH: bytes per second per transfer, e.g. ``100MB``.
+    * SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT: ``classic``, ``crt`` or ``auto``. ``crt``
+      uses the AWS Common Runtime transfer manager (``pip install "boto3[crt]"``);
+      ``auto`` uses it only on instance types it is optimized for.
+
+    Sizes are in bytes, optionally with a KB, MB or GB suffix (powers of 1024, as in
+    the AWS CLI).
+
+    Returns:
+        The TransferConfig, or None if none of the settings is present.
+
+
+    Raises:
+        MlflowSageMakerException: If a setting is malformed or out of range, or the CRT
+            client is requested but not installed.
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    settings: Dict[str, Any] = {}
+    threshold = env_setting(_SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD_ENV_VAR, parse_size)
+    if threshold is not None:
+        if threshold < 1:
+            raise MlflowSageMakerException(f"{_SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD_ENV_VAR} must be positive")
+        settings["multipart_threshold"] = threshold
+
+    chunksize = env_setting(_SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE_ENV_VAR, parse_size)
+    if chunksize is not None:
+        if not _MIN_PART_SIZE <= chunksize <= _MAX_PART_SIZE:
+            raise MlflowSageMakerException(
+                f"{_SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE_ENV_VAR} must be between 5MB and 5GB, got {chunksize}"
+            )
+        settings["multipart_chunksize"] = chunksize
+
+    concurrency = env_setting(_SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY_ENV_VAR, int)
+    if concurrency is not None:
+        if not 1 <= concurrency <= _MAX_CONCURRENCY:
+            raise MlflowSageMakerException(
+                f"{_SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY_ENV_VAR} must be between 1 and {_MAX_CONCURRENCY}"
+            )
+        settings["max_concurrency"] = concurrency
+
+    bandwidth = env_setting(_SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH_ENV_VAR, parse_size)
+    if bandwidth is not None:
+        if bandwidth < 1:
+            raise MlflowSageMakerException(f"{_SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH_ENV_VAR} must be positive")
+        settings["max_bandwidth"] = bandwidth
+
+    client = os.environ.get(_SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT_ENV_VAR, "").strip().lower()
+    if client:
+        if client not in _TRANSFER_CLIENTS:
+            raise MlflowSageMakerException(
+                f"{_SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT_ENV_VAR} must be one of {', '.join(_TRANSFER_CLIENTS)}"
+            )
+        if client == "crt" and not _crt_available():
+            raise MlflowSageMakerException(
+                f"{_SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT_ENV_VAR}=crt requires the AWS CRT: " 'pip install "boto3[crt]"'
+            )
+        settings["preferred_transfer_client"] = client
+
+    return TransferConfig(**settings) if settings else None
+
+
+class ConfiguredTransferClient:
+    """S3 client proxy that applies a TransferConfig to managed transfers.
+
+    ``upload_file``, ``download_file``, ``upload_fileobj`` and ``download_fileobj``
+    get ``Config`` unless the caller passes one; everything else goes to the client.
+    """
+
+    def __init__(self, client: Any, config: "TransferConfig") -> None:
+        self._client = client
+        self._config = config
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def upload_file(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("Config", self._config)
+        return self._client.upload_file(*args, **kwargs)
+
+    def download_file(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("Config", self._config)
+        return self._client.download_file(*args, **kwargs)
+
+    def upload_fileobj(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("Config", self._config)
+        return self._client.upload_fileobj(*args, **kwargs)
+
+    def download_fileobj(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs.setdefault("Config", self._config)
+        return self._client.download_fileobj(*args, **kwargs)
@@ -0,0 +1,133 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sagemaker_mlflow.env_settings import env_setting
+from sagemaker_mlflow.upload_scheduler import get_upload_scheduler
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_TIMEOUT_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_TIMEOUT"
+
+# Presigned URLs for one artifact store resolve to a handful of S3 endpoints at most.
+_DEFAULT_POOL_HOSTS = 4
+
+# Bytes read from the request body per socket send. The http.client default of 8 KiB
+# (16 KiB in urllib3 2) means hundreds of thousands of Python-level reads per GB.
+SEND_BLOCK_SIZE = 1024 * 1024
+
+
+class _LargeBlockAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("blocksize", SEND_BLOCK_SIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class UploadConnectionPool:
+    """Keep-alive connection pool for presigned S3 data-plane requests.
+
+    Wraps a requests.Session whose HTTPAdapter keeps up to ``pool_maxsize`` idle
+    connections per host, so each concurrent upload can return its connection for
+    the next one instead of opening a new TCP and TLS session. Request bodies are sent
+    in SEND_BLOCK_SIZE blocks. The adapter does not retry; retries are the upload
+    scheduler's job.
+    """
+
+    def __init__(
+        self, pool_maxsize: int, pool_hosts: int = _DEFAULT_POOL_HOSTS, timeout: Optional[float] = None
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._adapter = _LargeBlockAdapter(
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=0, raise_on_status=False),
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send one request on a pooled connection.
+
+        The response body is read before returning, which releases the connection
+        back to the pool.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.request(method, url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """Return connection counters summed over the per-host pools.
+
+        ``connections_opened`` counts new connections (each one a TCP and, for HTTPS,
+        TLS handshake), ``connection_reuses`` the requests that went out on an
+        existing connection instead.
+        """
+        opened = 0
+        sent = 0
+        idle = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            sent += pool.num_requests
+            # Slots in the pool queue hold None until a connection is returned to them.
+            idle += sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0
+        return {
+            "connections_opened": opened,
+            "connection_reuses": max(0, sent - opened),
+            "idle_connections": idle,
+            "pool_maxsize": self.pool_maxsize,
+        }
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_pool: Optional[UploadConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_upload_connection_pool() -> UploadConnectionPool:
+    """Return the process-wide pool, sized to the upload scheduler's concurrency.
+
+    A new pool is created after a fork, since connections cannot be shared with the
+    parent process.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = UploadConnectionPool(
+                pool_maxsize=get_upload_scheduler().max_concurrency,
+                timeout=env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_TIMEOUT_ENV_VAR, float),
+            )
+        return _pool
+
+
+def _after_fork_in_child() -> None:
+    # The parent's pool is dropped without closing it: its sockets are still the
+    # parent's to use.
+    global _pool, _pool_lock
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
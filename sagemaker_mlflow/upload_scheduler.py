@@ -0,0 +1,217 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from requests.exceptions import ConnectionError, Timeout
+
+from sagemaker_mlflow.env_settings import env_setting
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_CONCURRENCY_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_CONCURRENCY"
+_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS_ENV_VAR = "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS"
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_INITIAL_CONCURRENCY = 8
+DEFAULT_MAX_ATTEMPTS = 6
+
+# S3 signals that a prefix is over its request rate with 503 SlowDown (and 429 from
+# some S3-compatible endpoints). These shrink the concurrency window.
+_THROTTLE_STATUS_CODES = frozenset([429, 503])
+
+# Transient failures that are retried without being treated as congestion.
+_RETRYABLE_STATUS_CODES = frozenset([408, 500, 502, 504]) | _THROTTLE_STATUS_CODES
+
+
+class AdaptiveUploadScheduler:
+    """AIMD concurrency limiter and retry policy for presigned S3 PUTs.
+
+    At most ``concurrency_limit`` requests run at once. Every successful request grows
+    the limit by ``1 / limit`` (one slot per window of successes); a throttling response
+    multiplies it by ``decrease_factor``, at most once per ``decrease_cooldown`` seconds
+    so that a burst of 503s from requests already in flight counts as one congestion
+    event. Throttled and transient failures are retried per request with exponential
+    backoff and full jitter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_concurrency: int = 1,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_backoff: float = 0.5,
+        max_backoff: float = 20.0,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self._limit = float(max(self._min_concurrency, min(initial_concurrency, self.max_concurrency)))
+        self._max_attempts = max(1, max_attempts)
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._decrease_factor = decrease_factor
+        self._decrease_cooldown = decrease_cooldown
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._requests = 0
+        self._retries = 0
+        self._throttle_events = 0
+
+    def _reset_after_fork(self) -> None:
+        # Requests in flight belonged to the parent's threads, which do not exist in a
+        # forked child; the learned concurrency limit is kept.
+        self._cond = threading.Condition()
+        self._in_flight = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _on_success(self) -> None:
+        with self._cond:
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def _on_throttle(self) -> None:
+        with self._cond:
+            self._throttle_events += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self._decrease_cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self._min_concurrency), self._limit * self._decrease_factor)
+            logger.debug("Presigned upload throttled, concurrency limit lowered to %d", int(self._limit))
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = random.uniform(0, min(self._max_backoff, self._base_backoff * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            try:
+                delay = max(delay, min(self._max_backoff, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    def send(self, send_request: Callable[[], Any]) -> Any:
+        """Run ``send_request`` within a concurrency slot, retrying transient failures.
+
+        ``send_request`` must issue one complete request and return its response; it is
+        called again from scratch on every retry, so it has to reopen any request body.
+
+        Returns:
+            The first response that is successful or not retryable, or the last response
+            once all attempts are used up.
+
+        Raises:
+            ConnectionError, Timeout: If the final attempt fails at the transport level.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            response = None
+            with self._slot():
+                with self._cond:
+                    self._requests += 1
+                try:
+                    response = send_request()
+                except (ConnectionError, Timeout):
+                    if attempt == self._max_attempts:
+                        raise
+                    logger.debug("Presigned upload attempt %d failed at transport level", attempt, exc_info=True)
+
+            retry_after = None
+            if response is not None:
+                status_code = response.status_code
+                if status_code not in _RETRYABLE_STATUS_CODES:
+                    if status_code < 400:
+                        self._on_success()
+                    return response
+                if status_code in _THROTTLE_STATUS_CODES:
+                    self._on_throttle()
+                if attempt == self._max_attempts:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            with self._cond:
+                self._retries += 1
+            time.sleep(self._backoff(attempt, retry_after))
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the scheduler counters."""
+        with self._cond:
+            return {
+                "requests": self._requests,
+                "retries": self._retries,
+                "throttle_events": self._throttle_events,
+                "concurrency_limit": int(self._limit),
+                "in_flight": self._in_flight,
+            }
+
+
+_scheduler: Optional[AdaptiveUploadScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_upload_scheduler() -> AdaptiveUploadScheduler:
+    """Return the process-wide scheduler shared by all presigned uploads.
+
+    Sharing one scheduler lets every artifact repository in the process back off
+    together when S3 throttles the prefix they all write to.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            max_concurrency = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_CONCURRENCY_ENV_VAR, int)
+            if max_concurrency is None:
+                max_concurrency = DEFAULT_MAX_CONCURRENCY
+            max_attempts = env_setting(_SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS_ENV_VAR, int)
+            _scheduler = AdaptiveUploadScheduler(
+                max_concurrency=max_concurrency,
+                initial_concurrency=min(DEFAULT_INITIAL_CONCURRENCY, max_concurrency),
+                max_attempts=DEFAULT_MAX_ATTEMPTS if max_attempts is None else max_attempts,
+            )
+        return _scheduler
+
+
+def _after_fork_in_child() -> None:
+    global _scheduler_lock
+    _scheduler_lock = threading.Lock()
+    if _scheduler is not None:
+        _scheduler._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
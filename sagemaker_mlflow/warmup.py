@@ -0,0 +1,152 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_SAGEMAKER_MLFLOW_PREWARM_ENV_VAR = "SAGEMAKER_MLFLOW_PREWARM"
+
+_MLFLOW_TRACKING_URI_ENV_VAR = "MLFLOW_TRACKING_URI"
+
+# Any authenticated read works; this one is cheap and exists on every server version.
+_PREWARM_ENDPOINT = "/api/2.0/mlflow/experiments/search"
+
+_started_from_env = False
+_started_from_env_lock = threading.Lock()
+
+
+def prewarm(tracking_arn: Optional[str] = None) -> Dict[str, float]:
+    """Pay the one-off cost of the first tracking request ahead of time.
+
+    Resolves the tracking server URL from the ARN, resolves credentials (assuming
+    SAGEMAKER_MLFLOW_ASSUME_ROLE_ARN if set, which caches the STS credentials), and
+    sends a signed request to the tracking server through mlflow's pooled HTTP
+    session, so DNS resolution and the TLS handshake are done and the connection is
+    kept for the requests that follow.
+
+    Args:
+        tracking_arn: ARN of the SageMaker MLflow tracking server or app. Defaults to
+            the current tracking URI.
+
+    Returns:
+        Seconds spent in each phase ("arn", "credentials", "connection", the latter
+        including signing) and in total.
+    """
+    from mlflow import get_tracking_uri
+    from mlflow.utils import rest_utils
+
+    from sagemaker_mlflow.auth_provider import AuthProvider
+    from sagemaker_mlflow.host_creds import get_host_creds
+
+    arn = tracking_arn or get_tracking_uri()
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    phase_started = time.perf_counter()
+    host_creds = get_host_creds(arn)
+    timings["arn"] = time.perf_counter() - phase_started
+
+    phase_started = time.perf_counter()
+    auth = AuthProvider()._get_auth_for_arn(arn)
+    if auth.creds is not None:
+        # Refreshable credentials are resolved lazily; fetch them now.
+        auth.creds.get_frozen_credentials()
+    timings["credentials"] = time.perf_counter() - phase_started
+
+    phase_started = time.perf_counter()
+    # Signed with the ARN's own auth rather than the plugin's, which signs for the
+    # current tracking URI. mlflow's default retry settings select the same pooled
+    # session the tracking store uses; the response status does not matter.
+    rest_utils.http_request(
+        rest_utils.MlflowHostCreds(
+            host=host_creds.host,
+            ignore_tls_verification=host_creds.ignore_tls_verification,
+            client_cert_path=host_creds.client_cert_path,
+            server_cert_path=host_creds.server_cert_path,
+        ),
+        _PREWARM_ENDPOINT,
+        "GET",
+        params={"max_results": 1},
+        auth=auth,
+    )
+    timings["connection"] = time.perf_counter() - phase_started
+
+    timings["total"] = time.perf_counter() - started
+    logger.info(
+        "Prewarmed SageMaker MLflow in %.3fs (%s)",
+        timings["total"],
+        ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in timings.items() if phase != "total"),
+    )
+    return timings
+
+
+def prewarm_in_background(tracking_arn: Optional[str] = None) -> "Future[Dict[str, float]]":
+    """Run :func:`prewarm` on a daemon thread.
+
+    Failures are logged as warnings rather than raised, so a prewarm that cannot reach
+    the server never affects the job; they are also set on the returned future.
+
+    Returns:
+        A future resolving to the phase timings.
+    """
+    future: "Future[Dict[str, float]]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(prewarm(tracking_arn))
+        except Exception as e:
+            logger.warning("Prewarming SageMaker MLflow failed: %s", e)
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="sagemaker-mlflow-prewarm", daemon=True).start()
+    return future
+
+
+def maybe_prewarm_from_env(tracking_arn: Optional[str] = None) -> Optional["Future[Dict[str, float]]"]:
+    """Start a background prewarm once per process if SAGEMAKER_MLFLOW_PREWARM is "true".
+
+    Called when the plugin is imported, which mlflow does while it is itself being
+    imported, so the connection is being set up well before the first tracking call.
+    The ARN defaults to MLFLOW_TRACKING_URI; a tracking URI set later in code is not
+    known yet, so call :func:`prewarm_in_background` with it instead.
+    """
+    global _started_from_env
+    if os.environ.get(_SAGEMAKER_MLFLOW_PREWARM_ENV_VAR, "").lower() != "true":
+        return None
+    arn = tracking_arn or os.environ.get(_MLFLOW_TRACKING_URI_ENV_VAR, "")
+    if not arn.startswith("arn:"):
+        return None
+    with _started_from_env_lock:
+        if _started_from_env:
+            return None
+        _started_from_env = True
+    return prewarm_in_background(arn)
+
+
+def _after_fork_in_child() -> None:
+    # A background prewarm started by the parent is not repeated in the child: the
+    # credentials it cached carry over, the connection it opened does not.
+    global _started_from_env_lock
+    _started_from_env_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
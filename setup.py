@@ -72,7 +72,12 @@ setup(
     # Require MLflow as a dependency of the plugin, so that plugin users can
     # simply install the plugin and then immediately use it with MLflow
     install_requires=["boto3>=1.34", "mlflow>=2.8"],
-    extras_require={"test": test_requirements, "test_prerelease": test_prerelease_requirements},
+    extras_require={
+        "test": test_requirements,
+        "test_prerelease": test_prerelease_requirements,
+        # HTTP/2 transport for tracking requests, enabled with SAGEMAKER_MLFLOW_HTTP2=true.
+        "http2": ["h2>=4,<5"],
+    },
     python_requires=">= 3.8",
     entry_points={
         "mlflow.tracking_store": "arn=sagemaker_mlflow.mlflow_sagemaker_store:MlflowSageMakerStore",
@@ -0,0 +1,102 @@
+"""Cost of resolving AWS credentials per signer versus once per process.
+
+Serves credentials from a local fake container metadata endpoint (the same protocol
+as the ECS and SageMaker container credential endpoints) with a configurable delay, and
+points the environment at it so the default provider chain ends there. Each signer
+then signs one tracking request, as mlflow does for every call. The "per signer" row
+resolves credentials for every signer, as AuthBoto did before they were shared.
+
+Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_credential_provider.py --signers 200 --latency-ms 20
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+import requests
+
+from sagemaker_mlflow.auth import AuthBoto
+from sagemaker_mlflow.credential_provider import get_credential_provider
+
+
+class _MetadataHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    requests_served = 0
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        type(self).requests_served += 1
+        body = json.dumps(
+            {
+                "AccessKeyId": "ASIABENCHMARK",
+                "SecretAccessKey": "secret",
+                "Token": "token",
+                "Expiration": (datetime.now(timezone.utc) + timedelta(hours=6)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _sign_with_new_signers(signers: int, shared: bool) -> Tuple[float, int]:
+    provider = get_credential_provider()
+    provider.clear()
+    served_before = _MetadataHandler.requests_served
+    request = requests.Request(
+        "GET", "https://us-west-2.experiments.sagemaker.aws/api/2.0/mlflow/runs/get", headers={"Connection": "close"}
+    )
+    started = time.perf_counter()
+    for _ in range(signers):
+        if not shared:
+            provider.clear()
+        AuthBoto("us-west-2", "sagemaker-mlflow")(request.prepare())
+    return time.perf_counter() - started, _MetadataHandler.requests_served - served_before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signers", type=int, default=100, help="Signers created, each signing one request")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Delay of the fake metadata endpoint")
+    args = parser.parse_args()
+
+    _MetadataHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MetadataHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    empty_dir = tempfile.mkdtemp()
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_PROFILE"):
+        os.environ.pop(name, None)
+    os.environ.update(
+        {
+            "AWS_CONTAINER_CREDENTIALS_FULL_URI": f"http://127.0.0.1:{server.server_port}/credentials",
+            "AWS_SHARED_CREDENTIALS_FILE": os.path.join(empty_dir, "credentials"),
+            "AWS_CONFIG_FILE": os.path.join(empty_dir, "config"),
+            "AWS_EC2_METADATA_DISABLED": "true",
+        }
+    )
+    try:
+        # Loads boto3 and the signer once, outside the timed runs.
+        _sign_with_new_signers(1, shared=True)
+        print(f"{'credentials':<14}{'total ms':>10}{'per signer ms':>15}{'metadata requests':>19}")
+        for name, shared in (("per signer", False), ("shared", True)):
+            elapsed, fetched = _sign_with_new_signers(args.signers, shared)
+            print(f"{name:<14}{elapsed * 1000:>10.1f}{elapsed * 1000 / args.signers:>15.3f}{fetched:>19}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
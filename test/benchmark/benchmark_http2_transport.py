@@ -0,0 +1,254 @@
+"""Concurrent small tracking calls over pooled HTTP/1.1 connections versus HTTP/2.
+
+Runs a TLS server in a separate process that negotiates HTTP/2 or HTTP/1.1 with ALPN,
+delays every new connection by a simulated handshake time and every response by a
+simulated server latency. Worker threads then send SigV4 signed log-metric sized POSTs through one
+requests session, as concurrent mlflow clients do: first over HTTP/1.1 with mlflow's
+connection pool size, where callers beyond the pool size open a connection per request,
+then with the HTTP/2 adapter, which multiplexes them over a few connections.
+
+Requires ``pip install "sagemaker-mlflow[http2]" cryptography``. Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_http2_transport.py --threads 64 --requests 2000 --handshake-ms 30
+"""
+
+import argparse
+import datetime
+import ipaddress
+import json
+import multiprocessing
+import os
+import socket
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from mlflow.environment_variables import MLFLOW_HTTP_POOL_MAXSIZE
+from requests.adapters import HTTPAdapter
+
+from sagemaker_mlflow.auth import AuthBoto
+from sagemaker_mlflow.http2_transport import mount_http2_adapter
+
+_RESPONSE_BODY = b"{}"
+
+
+def _write_certificate(directory: str) -> Tuple[str, str]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+            )
+        )
+    return cert_path, key_path
+
+
+class _Server:
+    """TLS server answering every request with 200 after ``latency`` seconds."""
+
+    def __init__(self, cert_path: str, key_path: str, handshake: float, latency: float, connections: Any) -> None:
+        self._context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._context.load_cert_chain(cert_path, key_path)
+        self._context.set_alpn_protocols(["h2", "http/1.1"])
+        self._handshake = handshake
+        self._latency = latency
+        self._socket = socket.create_server(("127.0.0.1", 0), backlog=1024)
+        self.port = self._socket.getsockname()[1]
+        self._connections = connections
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            # As real servers do; otherwise responses written back to back on one HTTP/2
+            # connection wait on the client's delayed ACKs.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._connections.get_lock():
+                self._connections.value += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        # Stands in for the TCP and TLS round trips to a remote endpoint.
+        time.sleep(self._handshake)
+        try:
+            with self._context.wrap_socket(sock, server_side=True) as tls:
+                if tls.selected_alpn_protocol() == "h2":
+                    self._serve_http2(tls)
+                else:
+                    self._serve_http1(tls)
+        except (OSError, ssl.SSLError):
+            pass
+
+    def _serve_http1(self, tls: ssl.SSLSocket) -> None:
+        reader = tls.makefile("rb")
+        while True:
+            request_line = reader.readline()
+            if not request_line:
+                return
+            content_length = 0
+            for line in iter(reader.readline, b"\r\n"):
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    content_length = int(value)
+            reader.read(content_length)
+            time.sleep(self._latency)
+            tls.sendall(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(_RESPONSE_BODY)}\r\n\r\n".encode("latin-1")
+                + _RESPONSE_BODY
+            )
+
+    def _serve_http2(self, tls: ssl.SSLSocket) -> None:
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        write_lock = threading.Lock()
+
+        def flush() -> None:
+            data = connection.data_to_send()
+            if data:
+                tls.sendall(data)
+
+        def respond(stream_id: int) -> None:
+            with write_lock:
+                connection.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-type", "application/json"), ("content-length", "2")],
+                )
+                connection.send_data(stream_id, _RESPONSE_BODY, end_stream=True)
+                flush()
+
+        with write_lock:
+            connection.initiate_connection()
+            flush()
+        while True:
+            data = tls.recv(65536)
+            if not data:
+                return
+            with write_lock:
+                for event in connection.receive_data(data):
+                    if isinstance(event, h2.events.DataReceived):
+                        connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        timer = threading.Timer(self._latency, respond, args=(event.stream_id,))
+                        timer.daemon = True
+                        timer.start()
+                flush()
+
+
+def _serve(cert_path: str, key_path: str, handshake: float, latency: float, ports: Any, connections: Any) -> None:
+    server = _Server(cert_path, key_path, handshake, latency, connections)
+    ports.put(server.port)
+    threading.Event().wait()
+
+
+def _run(
+    session: requests.Session, url: str, ca_path: str, threads: int, count: int
+) -> Tuple[float, float, List[float]]:
+    auth = AuthBoto("us-west-2", "sagemaker-mlflow")
+    body = json.dumps({"run_id": "0" * 32, "key": "loss", "value": 0.5, "timestamp": 0, "step": 1})
+
+    def call(_: int) -> float:
+        started = time.perf_counter()
+        response = session.post(
+            url + "/api/2.0/mlflow/runs/log-metric",
+            data=body,
+            headers={"Content-Type": "application/json", "Connection": "keep-alive"},
+            auth=auth,
+            verify=ca_path,
+        )
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    started, cpu_started = time.perf_counter(), time.process_time()
+    with ThreadPoolExecutor(threads) as executor:
+        latencies = list(executor.map(call, range(count)))
+    return time.perf_counter() - started, time.process_time() - cpu_started, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=64, help="Concurrent callers")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests sent in total")
+    parser.add_argument("--handshake-ms", type=float, default=30.0, help="Simulated TCP and TLS setup per connection")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated server time per request")
+    parser.add_argument(
+        "--pool-maxsize", type=int, default=MLFLOW_HTTP_POOL_MAXSIZE.get(), help="HTTP/1.1 connections kept per host"
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "AKIABENCHMARK")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "secret")
+    cert_path, key_path = _write_certificate(tempfile.mkdtemp())
+    print(
+        f"{'transport':<11}{'total ms':>10}{'req/s':>9}{'p50 ms':>8}{'p99 ms':>8}{'client cpu ms':>15}"
+        f"{'connections':>13}"
+    )
+    results: Dict[str, Dict[str, int]] = {}
+    for name in ("http/1.1", "http/2"):
+        # A separate process, so the server does not compete with the client for the GIL.
+        context = multiprocessing.get_context("spawn")
+        ports, connections = context.Queue(), context.Value("i", 0)
+        server = context.Process(
+            target=_serve,
+            args=(cert_path, key_path, args.handshake_ms / 1000, args.latency_ms / 1000, ports, connections),
+            daemon=True,
+        )
+        server.start()
+        url = f"https://127.0.0.1:{ports.get(timeout=30)}"
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=args.pool_maxsize))
+        adapter = mount_http2_adapter(session, url) if name == "http/2" else None
+        try:
+            elapsed, cpu, latencies = _run(session, url, cert_path, args.threads, args.requests)
+        finally:
+            session.close()
+            server.terminate()
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        print(
+            f"{name:<11}{elapsed * 1000:>10.1f}{args.requests / elapsed:>9.0f}{p50:>8.1f}{p99:>8.1f}{cpu * 1000:>15.0f}"
+            f"{connections.value:>13}"
+        )
+        if adapter is not None:
+            results[name] = adapter.stats()
+    print(f"http/2 adapter: {results['http/2']}")
+
+
+if __name__ == "__main__":
+    main()
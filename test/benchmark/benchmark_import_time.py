@@ -0,0 +1,84 @@
+"""Import cost of the plugin when mlflow starts.
+
+mlflow loads the plugin's entry points (tracking store, auth and header providers,
+registry, scorer and workspace stores, and the s3 artifact repository) as it imports,
+whether or not the process ever uses an ``arn:`` URI. This runs ``import mlflow`` in
+fresh interpreters under ``python -X importtime`` and reports the best wall time, the
+cumulative import time of the plugin's modules including everything they pulled in,
+and whether heavy dependencies such as boto3 were loaded.
+
+Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_import_time.py --repeat 10
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+_HEAVY_MODULES = ("boto3", "botocore", "botocore.auth", "s3transfer")
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    """Return (depth, cumulative microseconds, module) for each imported module."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((depth, int(cumulative), name.strip()))
+    return modules
+
+
+def _plugin_cost(modules: List[Tuple[int, int, str]]) -> Tuple[int, Dict[str, int]]:
+    """Sum the cumulative time of plugin modules not imported by another plugin module."""
+    total = 0
+    per_module = {}
+    plugin_depth = None
+    for depth, cumulative, name in reversed(modules):
+        # importtime prints children before their parent, so walk it backwards.
+        if plugin_depth is not None and depth <= plugin_depth:
+            plugin_depth = None
+        if name == "sagemaker_mlflow" or name.startswith("sagemaker_mlflow."):
+            per_module[name] = cumulative
+            if plugin_depth is None:
+                total += cumulative
+                plugin_depth = depth
+    return total, per_module
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter runs; the best is reported")
+    args = parser.parse_args()
+
+    code = "import sys, mlflow; print(','.join(m for m in %r if m in sys.modules))" % (_HEAVY_MODULES,)
+    best_wall = float("inf")
+    best_plugin = None
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+        )
+        wall = time.perf_counter() - started
+        plugin_total, per_module = _plugin_cost(_parse_importtime(result.stderr))
+        best_wall = min(best_wall, wall)
+        if best_plugin is None or plugin_total < best_plugin[0]:
+            best_plugin = (plugin_total, per_module, result.stdout.strip())
+
+    assert best_plugin is not None
+    plugin_total, per_module, heavy = best_plugin
+    print(f"import mlflow, wall time:        {best_wall * 1000:8.1f} ms")
+    print(f"plugin modules, cumulative:      {plugin_total / 1000:8.1f} ms")
+    print(f"heavy modules loaded:            {heavy or 'none'}")
+    for name, cumulative in sorted(per_module.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {name:<45}{cumulative / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Throughput of the presigned PUT body path, in GB/s per upload stream.
+
+Uploads one file to a local HTTP sink that discards the body, so the number measures
+the client side (file reads, Python per-chunk overhead, socket writes) rather than
+the network. Compares the plain file object with mlflow's default session against
+the memory-mapped reader on the upload connection pool, optionally with the MD5
+computed for checksum verification.
+
+Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_presigned_upload_reader.py --size-mib 2048
+"""
+
+import argparse
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import requests
+
+from sagemaker_mlflow.buffer_reader import map_file
+from sagemaker_mlflow.hashing_reader import HashingReader
+from sagemaker_mlflow.upload_connection_pool import UploadConnectionPool
+
+
+def _serve_sink(server: socket.socket) -> None:
+    buffer = bytearray(4 * 1024 * 1024)
+    while True:
+        conn, _ = server.accept()
+        threading.Thread(target=_handle, args=(conn, buffer), daemon=True).start()
+
+
+def _handle(conn: socket.socket, buffer: bytearray) -> None:
+    view = memoryview(buffer)
+    with conn:
+        pending = b""
+        while True:
+            while b"\r\n\r\n" not in pending:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                pending += data
+            head, pending = pending.split(b"\r\n\r\n", 1)
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            remaining = length - len(pending)
+            pending = b""
+            while remaining > 0:
+                received = conn.recv_into(view[: min(len(view), remaining)])
+                if not received:
+                    return
+                remaining -= received
+            conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+
+
+def _upload(send, path: str, use_mmap: bool, md5: bool) -> None:
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap:
+            with map_file(f, size) as body:
+                send(HashingReader(body, size, ["md5"]) if md5 else body)
+        else:
+            send(HashingReader(f, size, ["md5"]) if md5 else f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mib", type=int, default=1024, help="Size of the uploaded file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the best is reported")
+    parser.add_argument("--dir", default=None, help="Directory for the test file, e.g. on the NVMe volume")
+    args = parser.parse_args()
+
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    threading.Thread(target=_serve_sink, args=(server,), daemon=True).start()
+    url = f"http://127.0.0.1:{server.getsockname()[1]}/object"
+
+    session = requests.Session()
+    pool = UploadConnectionPool(pool_maxsize=1)
+    variants = [
+        ("file, default session", lambda body: session.put(url, data=body), False, False),
+        ("file, upload pool", lambda body: pool.request("put", url, data=body), False, False),
+        ("mmap, upload pool", lambda body: pool.request("put", url, data=body), True, False),
+        ("file + md5, upload pool", lambda body: pool.request("put", url, data=body), False, True),
+        ("mmap + md5, upload pool", lambda body: pool.request("put", url, data=body), True, True),
+    ]
+
+    with tempfile.NamedTemporaryFile(dir=args.dir) as f:
+        block = os.urandom(1024 * 1024)
+        for _ in range(args.size_mib):
+            f.write(block)
+        f.flush()
+        size = args.size_mib * 1024 * 1024
+
+        print(f"{'variant':<28}{'GB/s':>8}")
+        for name, send, use_mmap, md5 in variants:
+            # One warm-up run so every variant reads from the page cache.
+            _upload(send, f.name, use_mmap, md5)
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                _upload(send, f.name, use_mmap, md5)
+                best = min(best, time.perf_counter() - start)
+            print(f"{name:<28}{size / best / 1e9:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
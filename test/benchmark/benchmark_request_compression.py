@@ -0,0 +1,122 @@
+"""Signed tracking requests with and without request body compression.
+
+Posts log_batch-shaped JSON bodies, signed by AuthBoto, to a local stand-in for the
+tracking server that decompresses each body according to its Content-Encoding and
+parses it. The stand-in holds each response for the time the received bytes would take
+over a link of ``--link-mbps``, standing in for a cross-region connection; set it to 0
+to measure CPU cost alone. The zstd variant is skipped unless zstandard is installed.
+
+Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_request_compression.py --metrics 10000 --link-mbps 100
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from sagemaker_mlflow.auth import AuthBoto
+
+_VARIANTS: List[Tuple[str, Dict[str, str]]] = [
+    ("uncompressed", {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "none"}),
+    ("gzip", {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "gzip"}),
+    ("zstd", {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "zstd"}),
+]
+
+
+class _DecompressingHandler(BaseHTTPRequestHandler):
+    link_bytes_per_second: Optional[float] = None
+    received_bytes = 0
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).received_bytes += len(body)
+        if self.link_bytes_per_second:
+            time.sleep(len(body) / self.link_bytes_per_second)
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "zstd":
+            import zstandard
+
+            body = zstandard.ZstdDecompressor().decompress(body, max_output_size=1 << 30)
+        json.loads(body)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _log_batch_payload(metrics: int) -> dict:
+    rng = random.Random(0)
+    timestamp = int(time.time() * 1000)
+    return {
+        "run_id": "0123456789abcdef0123456789abcdef",
+        "metrics": [
+            {"key": f"train/{name}", "value": rng.random(), "timestamp": timestamp + step, "step": step}
+            for step in range(metrics // 4)
+            for name in ("loss", "accuracy", "learning_rate", "grad_norm")
+        ],
+        "params": [{"key": f"param_{i}", "value": str(rng.random())} for i in range(100)],
+        "tags": [{"key": "mlflow.source.name", "value": "train.py"}],
+    }
+
+
+def _time_variant(url: str, env: Dict[str, str], payload: dict, repeat: int) -> Tuple[float, int]:
+    durations = []
+    with requests.Session() as session:
+        for _ in range(repeat):
+            os.environ.update(env)
+            _DecompressingHandler.received_bytes = 0
+            started = time.perf_counter()
+            response = session.post(url, json=payload, auth=AuthBoto("us-west-2", "sagemaker-mlflow"))
+            durations.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return statistics.median(durations), _DecompressingHandler.received_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metrics", type=int, default=1000, help="Metrics per log_batch body")
+    parser.add_argument("--link-mbps", type=float, default=100.0, help="Simulated link bandwidth; 0 for unlimited")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per variant; the median is reported")
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    _DecompressingHandler.link_bytes_per_second = args.link_mbps * 1e6 / 8 or None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DecompressingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/2.0/mlflow/runs/log-batch"
+    payload = _log_batch_payload(args.metrics)
+    try:
+        print(f"{'variant':<14}{'bytes sent':>12}{'ratio':>8}{'median ms':>12}")
+        raw_size = None
+        for name, env in _VARIANTS:
+            if name == "zstd":
+                try:
+                    import zstandard  # noqa: F401
+                except ImportError:
+                    print(f"{name:<14}{'skipped: zstandard not installed':>32}")
+                    continue
+            elapsed, sent = _time_variant(url, env, payload, args.repeat)
+            raw_size = raw_size or sent
+            print(f"{name:<14}{sent:>12}{raw_size / sent:>8.1f}{elapsed * 1000:>12.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
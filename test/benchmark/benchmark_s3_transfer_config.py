@@ -0,0 +1,97 @@
+"""Direct S3 upload and download time under different transfer settings.
+
+Runs the repository's direct (non-presigned) path against a local moto S3 server, so
+the numbers reflect client-side transfer overhead: part sizes, concurrency and the
+transfer client. Each variant sets the SAGEMAKER_MLFLOW_S3_* variables, creates a
+repository and times log_artifact and download_artifacts of one file.
+
+Requires moto[server] (see requirements/integration_test_requirements.txt). The CRT
+variant is skipped unless awscrt is installed. Not collected by pytest. Run with::
+
+    python test/benchmark/benchmark_s3_transfer_config.py --size-mib 512
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Tuple
+from unittest import mock
+
+import boto3
+from moto.server import ThreadedMotoServer
+
+from sagemaker_mlflow.s3_presigned_artifact_repo import S3PresignedArtifactRepository
+from sagemaker_mlflow.s3_transfer_config import _crt_available
+
+_BUCKET = "benchmark-bucket"
+
+_VARIANTS: List[Tuple[str, Dict[str, str]]] = [
+    ("boto3 defaults", {}),
+    (
+        "8 MiB parts, 4 threads",
+        {"SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE": "8MB", "SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": "4"},
+    ),
+    (
+        "64 MiB parts, 16 threads",
+        {"SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE": "64MB", "SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": "16"},
+    ),
+    ("single part", {"SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD": "5GB"}),
+    ("crt", {"SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT": "crt"}),
+]
+
+
+def _time_variant(endpoint: str, env: Dict[str, str], local_file: str, repeat: int) -> Tuple[float, float]:
+    upload = download = float("inf")
+    with mock.patch.dict(os.environ, {"MLFLOW_S3_ENDPOINT_URL": endpoint, **env}):
+        repo = S3PresignedArtifactRepository(f"s3://{_BUCKET}/1/run/artifacts")
+        for _ in range(repeat):
+            dst = tempfile.mkdtemp()
+            try:
+                started = time.perf_counter()
+                repo.log_artifact(local_file)
+                upload = min(upload, time.perf_counter() - started)
+                started = time.perf_counter()
+                repo.download_artifacts(os.path.basename(local_file), dst)
+                download = min(download, time.perf_counter() - started)
+            finally:
+                shutil.rmtree(dst)
+    return upload, download
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mib", type=int, default=256, help="Size of the transferred file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    server = ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+        boto3.client("s3", endpoint_url=endpoint).create_bucket(Bucket=_BUCKET)
+
+        with tempfile.NamedTemporaryFile(suffix=".bin") as f:
+            f.write(os.urandom(args.size_mib * 1024 * 1024))
+            f.flush()
+            size_mb = args.size_mib * 1024 * 1024 / 1e6
+            print(f"{'variant':<28}{'upload MB/s':>14}{'download MB/s':>16}")
+            for name, env in _VARIANTS:
+                if env.get("SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT") == "crt" and not _crt_available():
+                    print(f"{name:<28}{'skipped: awscrt not installed':>30}")
+                    continue
+                upload, download = _time_variant(endpoint, env, f.name, args.repeat)
+                print(f"{name:<28}{size_mb / upload:>14.0f}{size_mb / download:>16.0f}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
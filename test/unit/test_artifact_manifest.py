@@ -0,0 +1,133 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sagemaker_mlflow.artifact_manifest import ArtifactManifest, ManifestEntry, hash_file, scan_directory
+
+TEST_ARTIFACT_URI = "s3://test-bucket/123/abc456/artifacts"
+
+
+class TestArtifactManifest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp.name
+        self.manifest_dir = os.path.join(self.tmp_dir, "manifests")
+        self.data_dir = os.path.join(self.tmp_dir, "data")
+        os.makedirs(self.data_dir)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.data_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def _record_all(self, manifest, files):
+        for index, entry in manifest.find_changed(files):
+            manifest.record(files[index][1], entry)
+
+    def test_hash_file(self):
+        path = self._write("a.bin", b"payload")
+        self.assertEqual(hash_file(path), hashlib.sha256(b"payload").hexdigest())
+
+    def test_new_files_are_changed(self):
+        files = [(self._write("a.txt", b"a"), "a.txt"), (self._write("b.txt", b"b"), "b.txt")]
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+
+        changed = manifest.find_changed(files)
+
+        self.assertEqual([index for index, _ in changed], [0, 1])
+        self.assertEqual(changed[0][1].sha256, hashlib.sha256(b"a").hexdigest())
+
+    @mock.patch("sagemaker_mlflow.artifact_manifest.hash_file")
+    def test_new_files_not_hashed_without_hash_new(self, mock_hash):
+        mock_hash.side_effect = hash_file
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        known = (self._write("a.txt", b"a"), "a.txt")
+        self._record_all(manifest, [known])
+        mock_hash.reset_mock()
+        self._write("a.txt", b"A")
+
+        changed = manifest.find_changed([(self._write("b.txt", b"b"), "b.txt"), known], hash_new=False)
+
+        self.assertEqual([index for index, _ in changed], [0, 1])
+        self.assertEqual(changed[0][1].sha256, "")
+        self.assertEqual(changed[0][1].size, 1)
+        mock_hash.assert_called_once_with(known[0])
+
+    def test_scan_directory_lists_nested_files(self):
+        os.makedirs(os.path.join(self.data_dir, "a", "b"))
+        for name in ["top.txt", os.path.join("a", "mid.txt"), os.path.join("a", "b", "deep.txt")]:
+            self._write(name, name.encode())
+
+        scanned = scan_directory(self.data_dir, max_workers=2)
+
+        self.assertEqual(
+            [os.path.relpath(path, self.data_dir) for path, _ in scanned],
+            [os.path.join("a", "b", "deep.txt"), os.path.join("a", "mid.txt"), "top.txt"],
+        )
+        self.assertEqual(scanned[-1][1].st_size, len("top.txt"))
+
+    def test_find_changed_uses_given_stats(self):
+        files = [(self._write("a.txt", b"a"), "a.txt")]
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        self._record_all(manifest, files)
+
+        with mock.patch("sagemaker_mlflow.artifact_manifest.os.stat") as mock_stat:
+            self.assertEqual(manifest.find_changed(files, stats=[os.lstat(files[0][0])]), [])
+        mock_stat.assert_not_called()
+
+    def test_unchanged_files_skipped_after_record(self):
+        files = [(self._write("a.txt", b"a"), "a.txt")]
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        self._record_all(manifest, files)
+
+        self.assertEqual(manifest.find_changed(files), [])
+
+    def test_modified_content_detected(self):
+        path = self._write("a.txt", b"a")
+        files = [(path, "a.txt")]
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        self._record_all(manifest, files)
+
+        self._write("a.txt", b"changed")
+
+        self.assertEqual(len(manifest.find_changed(files)), 1)
+
+    def test_touched_file_with_same_content_skipped(self):
+        path = self._write("a.txt", b"a")
+        files = [(path, "a.txt")]
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        self._record_all(manifest, files)
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(manifest.find_changed(files), [])
+        self.assertEqual(manifest.get("a.txt").mtime_ns, stat.st_mtime_ns + 10**9)
+
+    def test_save_and_reload(self):
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        manifest.record("a.txt", ManifestEntry(1, 2, "abc"))
+        manifest.save()
+
+        reloaded = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        self.assertEqual(reloaded.get("a.txt"), ManifestEntry(1, 2, "abc"))
+        self.assertIsNone(ArtifactManifest("s3://other/1/2/artifacts", self.manifest_dir).get("a.txt"))
+
+    def test_corrupt_manifest_ignored(self):
+        manifest = ArtifactManifest(TEST_ARTIFACT_URI, self.manifest_dir)
+        os.makedirs(self.manifest_dir)
+        with open(manifest.path, "w") as f:
+            f.write("{not json")
+
+        self.assertIsNone(manifest.get("a.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
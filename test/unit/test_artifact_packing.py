@@ -0,0 +1,156 @@
+import json
+import os
+import tarfile
+import tempfile
+import unittest
+
+from sagemaker_mlflow.artifact_packing import (
+    PACK_DIR_NAME,
+    extract_pack_dir,
+    pack_dir_path,
+    pack_files,
+    parse_index,
+    unpack_directory,
+)
+
+
+class TestArtifactPacking(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src_dir = os.path.join(self._tmp.name, "src")
+        self.out_dir = os.path.join(self._tmp.name, "out")
+        os.makedirs(self.src_dir)
+        os.makedirs(self.out_dir)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _files(self, contents):
+        files = []
+        for relative_path, content in contents.items():
+            local_file = os.path.join(self.src_dir, relative_path)
+            os.makedirs(os.path.dirname(local_file), exist_ok=True)
+            with open(local_file, "wb") as f:
+                f.write(content)
+            files.append((local_file, relative_path))
+        return files
+
+    def test_index_ranges_point_at_file_data(self):
+        contents = {"a.txt": b"alpha", "shards/b.bin": b"\x00" * 3000, "empty": b""}
+        archives, index_path = pack_files(self._files(contents), self.out_dir, 1024 * 1024, pack_id="0001")
+
+        self.assertEqual(len(archives), 1)
+        self.assertEqual(os.path.basename(index_path), "index-0001.json")
+        with open(index_path, "rb") as f:
+            index = parse_index(f.read())
+        with open(archives[0], "rb") as f:
+            data = f.read()
+        for relative_path, content in contents.items():
+            packed = index[relative_path]
+            self.assertEqual(packed.archive, "pack-0001-00000.tar")
+            self.assertEqual(data[packed.offset : packed.offset + packed.size], content)
+
+    def test_archives_are_standard_tar(self):
+        archives, _ = pack_files(self._files({"dir/a.txt": b"alpha"}), self.out_dir, 1024 * 1024)
+
+        with tarfile.open(archives[0]) as tar:
+            self.assertEqual(tar.getnames(), ["dir/a.txt"])
+
+    def test_archives_are_size_bounded(self):
+        contents = {f"f{i}.bin": b"x" * 4000 for i in range(5)}
+        archives, index_path = pack_files(self._files(contents), self.out_dir, 10000)
+
+        self.assertGreater(len(archives), 1)
+        for archive in archives:
+            # One file may overflow the bound by at most its own size plus tar padding.
+            self.assertLessEqual(os.path.getsize(archive), 10000 + 4000 + 10240)
+        with open(index_path, "rb") as f:
+            self.assertEqual(set(parse_index(f.read())), set(contents))
+
+    def test_unpack_directory_round_trip(self):
+        contents = {"a.txt": b"alpha", "sub/b.txt": b"beta"}
+        download_dir = os.path.join(self._tmp.name, "download")
+        pack_dir = os.path.join(download_dir, PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        pack_files(self._files(contents), pack_dir, 1024 * 1024)
+
+        self.assertEqual(unpack_directory(download_dir), 2)
+
+        self.assertFalse(os.path.exists(pack_dir))
+        for relative_path, content in contents.items():
+            with open(os.path.join(download_dir, relative_path), "rb") as f:
+                self.assertEqual(f.read(), content)
+
+    def test_unpack_keeps_existing_files_and_newest_index_wins(self):
+        download_dir = os.path.join(self._tmp.name, "download")
+        pack_dir = os.path.join(download_dir, PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        pack_files(self._files({"a.txt": b"old", "b.txt": b"old"}), pack_dir, 1024 * 1024, pack_id="0001")
+        pack_files(self._files({"a.txt": b"new"}), pack_dir, 1024 * 1024, pack_id="0002")
+        with open(os.path.join(download_dir, "b.txt"), "wb") as f:
+            f.write(b"individual")
+
+        unpack_directory(download_dir)
+
+        with open(os.path.join(download_dir, "a.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        with open(os.path.join(download_dir, "b.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"individual")
+
+    def test_carried_entries_point_into_earlier_archives(self):
+        download_dir = os.path.join(self._tmp.name, "download")
+        pack_dir = os.path.join(download_dir, PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        _, first_index = pack_files(
+            self._files({"a.txt": b"old", "b.txt": b"kept"}), pack_dir, 1024 * 1024, pack_id="0001"
+        )
+        with open(first_index, "rb") as f:
+            earlier = parse_index(f.read())
+        _, second_index = pack_files(
+            self._files({"a.txt": b"new"}), pack_dir, 1024 * 1024, pack_id="0002", carried=earlier
+        )
+        os.remove(first_index)
+
+        with open(second_index, "rb") as f:
+            index = parse_index(f.read())
+        self.assertEqual(
+            (index["a.txt"].archive, index["b.txt"].archive), ("pack-0002-00000.tar", "pack-0001-00000.tar")
+        )
+        unpack_directory(download_dir)
+        for name, content in (("a.txt", b"new"), ("b.txt", b"kept")):
+            with open(os.path.join(download_dir, name), "rb") as f:
+                self.assertEqual(f.read(), content)
+
+    def test_extract_pack_dir_returns_paths_and_honours_skip(self):
+        download_dir = os.path.join(self._tmp.name, "download")
+        pack_dir = os.path.join(download_dir, PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        pack_files(self._files({"a.txt": b"alpha", "b.txt": b"beta"}), pack_dir, 1024 * 1024)
+
+        extracted = extract_pack_dir(pack_dir, skip={os.path.join(download_dir, "b.txt")})
+
+        self.assertEqual(extracted, [os.path.join(download_dir, "a.txt")])
+        self.assertFalse(os.path.exists(os.path.join(download_dir, "b.txt")))
+
+    def test_unpack_rejects_paths_outside_directory(self):
+        pack_dir = os.path.join(self.out_dir, PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        with open(os.path.join(pack_dir, "index-0001.json"), "w") as f:
+            json.dump({"version": 1, "archives": ["pack.tar"], "files": {"../escape.txt": [0, 0, 0]}}, f)
+
+        with self.assertRaises(ValueError):
+            unpack_directory(self.out_dir)
+
+    def test_parse_index_rejects_archive_paths(self):
+        index = {"version": 1, "archives": ["../pack.tar"], "files": {}}
+        with self.assertRaises(ValueError):
+            parse_index(json.dumps(index).encode())
+
+    def test_pack_dir_path(self):
+        self.assertEqual(pack_dir_path(None), PACK_DIR_NAME)
+        self.assertEqual(pack_dir_path("data"), f"data/{PACK_DIR_NAME}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,24 @@
+import gzip
+import hashlib
+import json
 import unittest
 import os
+import threading
+import time
+from datetime import datetime
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import ANY, call, patch, Mock
+
+import requests
 from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
 from requests import PreparedRequest
 
 from sagemaker_mlflow.auth import AuthBoto, EMPTY_SHA256_HASH, DEFAULT_CREDENTIAL_TTL_SECONDS
+from sagemaker_mlflow.auth_retry import AuthRetryState
+from sagemaker_mlflow.credential_provider import get_credential_provider
+from sagemaker_mlflow.request_rate_limiter import RequestRateLimiter, parse_rate_limits
 
 
 class TestAuthBoto(unittest.TestCase):
@@ -12,6 +26,7 @@ class TestAuthBoto(unittest.TestCase):
     def setUp(self):
         # Clear the credential cache before each test
         AuthBoto._credential_cache.clear()
+        get_credential_provider().clear()
 
     @patch("boto3.Session")
     def test_init(self, mock_session):
@@ -31,6 +46,14 @@ class TestAuthBoto(unittest.TestCase):
         mock_session.assert_called_once()
         mock_get_credentials.assert_called_once()
 
+    @patch("boto3.Session")
+    def test_init_shares_credentials(self, mock_session):
+        first = AuthBoto("us-west-2", "sagemaker-mlflow")
+        second = AuthBoto("us-west-2", "sagemaker-mlflow")
+
+        self.assertIs(first.creds, second.creds)
+        mock_session.assert_called_once()
+
     @patch("boto3.Session")
     def test_init_with_assume_role_arn(self, mock_session):
         # Arrange
@@ -295,5 +318,150 @@ class TestAuthBoto(unittest.TestCase):
             mock_set_credentials.assert_called_once_with(assume_role_arn, mock_credentials, 300)
 
 
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Answers with the queued responses in order, recording the signing headers."""
+
+    responses: list = []
+    received: list = []
+    received_headers: list = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.received.append((self.headers["Authorization"], self.headers["X-Amz-Date"], body))
+        self.received_headers.append(self.headers)
+        status, headers, payload = self.responses.pop(0)
+        # Without the Date header send_response would add, so tests can set their own.
+        self.send_response_only(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@patch("boto3.Session")
+class TestAuthBotoRetry(unittest.TestCase):
+    def setUp(self):
+        get_credential_provider().clear()
+        self.state = AuthRetryState()
+        patcher = patch("sagemaker_mlflow.auth.get_auth_retry_state", return_value=self.state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _ScriptedHandler.responses = []
+        _ScriptedHandler.received = []
+        _ScriptedHandler.received_headers = []
+        server = HTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_port}/api/2.0/mlflow/runs/log-metric"
+
+    def _post(self, payload=None, **kwargs):
+        return requests.Session().post(
+            self.url, json=payload or {"key": "loss"}, auth=AuthBoto("us-west-2", "sagemaker-mlflow"), **kwargs
+        )
+
+    def test_expired_credentials_are_refreshed(self, mock_session):
+        mock_session.return_value.get_credentials.side_effect = [Credentials("OLD", "s"), Credentials("NEW", "s")]
+        _ScriptedHandler.responses = [
+            (403, {"x-amzn-ErrorType": "ExpiredTokenException"}, b'{"message": "expired"}'),
+            (200, {}, b"{}"),
+        ]
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r.status_code for r in response.history], [403])
+        (first, _, body), (second, _, retried_body) = _ScriptedHandler.received
+        self.assertIn("Credential=OLD/", first)
+        self.assertIn("Credential=NEW/", second)
+        self.assertEqual(retried_body, body)
+        self.assertEqual(self.state.stats()["expired_credentials"], 1)
+        self.assertEqual(self.state.stats()["retries"], 1)
+
+    def test_clock_skew_is_corrected(self, mock_session):
+        mock_session.return_value.get_credentials.return_value = Credentials("AKID", "s")
+        server_time = time.time() + 3600
+        _ScriptedHandler.responses = [
+            (403, {"Date": formatdate(server_time, usegmt=True)}, b'{"message": "Signature expired: ..."}'),
+            (200, {}, b"{}"),
+        ]
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 200)
+        signed_at = datetime.strptime(_ScriptedHandler.received[1][1] + "+0000", "%Y%m%dT%H%M%SZ%z").timestamp()
+        self.assertAlmostEqual(signed_at, server_time, delta=5)
+        self.assertEqual(self.state.stats()["clock_skew"], 1)
+
+    def test_retries_once(self, mock_session):
+        mock_session.return_value.get_credentials.return_value = Credentials("AKID", "s")
+        expired = (403, {"x-amzn-ErrorType": "ExpiredTokenException"}, b"{}")
+        _ScriptedHandler.responses = [expired, expired]
+
+        response = self._post()
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(len(_ScriptedHandler.received), 2)
+        self.assertEqual(self.state.stats()["retry_failures"], 1)
+
+    def test_other_errors_are_not_retried(self, mock_session):
+        mock_session.return_value.get_credentials.return_value = Credentials("AKID", "s")
+        _ScriptedHandler.responses = [(403, {"x-amzn-ErrorType": "AccessDeniedException"}, b"{}")]
+
+        self.assertEqual(self._post().status_code, 403)
+        self.assertEqual(len(_ScriptedHandler.received), 1)
+
+    def test_streamed_response_left_unread(self, mock_session):
+        mock_session.return_value.get_credentials.return_value = Credentials("AKID", "s")
+        _ScriptedHandler.responses = [(200, {}, b"artifact bytes")]
+
+        response = self._post(stream=True)
+
+        self.assertFalse(response._content_consumed)
+        self.assertEqual(response.raw.read(), b"artifact bytes")
+
+    @patch.dict(
+        os.environ,
+        {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "gzip", "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES": "1KB"},
+    )
+    def test_compressed_body_is_signed(self, mock_session):
+        mock_session.return_value.get_credentials.side_effect = [Credentials("OLD", "s"), Credentials("NEW", "s")]
+        _ScriptedHandler.responses = [
+            (403, {"x-amzn-ErrorType": "ExpiredTokenException"}, b"{}"),
+            (200, {}, b"{}"),
+            (200, {}, b"{}"),
+        ]
+        payload = {"metrics": [{"key": "loss", "value": 0.5, "step": step} for step in range(100)]}
+
+        self.assertEqual(self._post(payload).status_code, 200)
+        self._post({"key": "small"})
+
+        for (_, _, body), headers in list(zip(_ScriptedHandler.received, _ScriptedHandler.received_headers))[:2]:
+            self.assertEqual(headers["Content-Encoding"], "gzip")
+            self.assertEqual(headers["X-Amz-Content-SHA256"], hashlib.sha256(body).hexdigest())
+            self.assertEqual(json.loads(gzip.decompress(body)), payload)
+        self.assertNotIn("Content-Encoding", _ScriptedHandler.received_headers[2])
+
+    def test_rate_limited_before_signing(self, mock_session):
+        mock_session.return_value.get_credentials.return_value = Credentials("AKID", "s")
+        limiter = RequestRateLimiter(parse_rate_limits("write=1000"))
+        _ScriptedHandler.responses = [(429, {"Retry-After": "1"}, b"{}"), (200, {}, b"{}")]
+
+        with patch("sagemaker_mlflow.auth.get_request_rate_limiter", return_value=limiter):
+            self.assertEqual(self._post().status_code, 429)
+            started = time.time()
+            self.assertEqual(self._post().status_code, 200)
+
+        signed_at = datetime.strptime(_ScriptedHandler.received[1][1] + "+0000", "%Y%m%dT%H%M%SZ%z").timestamp()
+        # Signed once the Retry-After pause was over, not before waiting. X-Amz-Date is in whole seconds.
+        self.assertGreaterEqual(signed_at, int(started + 1))
+        stats = next(iter(limiter.stats().values()))
+        self.assertEqual((stats["requests"], stats["throttled"], stats["throttled_waits"]), (2, 1, 1))
+
+
 if __name__ == "__main__":
     unittest.main()
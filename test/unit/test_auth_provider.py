@@ -39,6 +39,19 @@ class AuthProviderTest(TestCase):
         self.assertEqual(result.region, "us-east-2")
         self.assertEqual(result.sigv4._service_name, "sagemaker")
 
+    def test_auth_provider_get_auth_for_arn(self):
+        metadata_provider = mock.Mock()
+        metadata_provider.resource_type = "mlflow-tracking-server"
+        metadata_provider.region = "us-west-2"
+
+        auth_provider = AuthProvider()
+        auth_provider.host_metadata_provider = metadata_provider
+        arn = "arn:aws:sagemaker:us-west-2:000000000000:mlflow-tracking-server/mw"
+        result = auth_provider._get_auth_for_arn(arn)
+
+        metadata_provider.set_arn.assert_called_once_with(arn)
+        self.assertEqual(result.region, "us-west-2")
+
     def test_auth_provider_returns_correct_sigv4_unknown(self):
         region = "us-east-2"
         metadata_provider = mock.Mock()
@@ -50,7 +63,7 @@ class AuthProviderTest(TestCase):
         self.assertRaises(ResourceTypeUnsupportedException, auth_provider.get_auth)
 
     @mock.patch.dict("os.environ", {"SAGEMAKER_MLFLOW_ASSUME_ROLE_ARN": "arn:aws:iam::123456789012:role/test-role"})
-    @mock.patch("sagemaker_mlflow.auth.boto3.Session")
+    @mock.patch("boto3.Session")
     def test_auth_provider_with_assume_role(self, mock_session):
         region = "us-east-2"
 
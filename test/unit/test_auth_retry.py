@@ -0,0 +1,61 @@
+import time
+from email.utils import formatdate
+from unittest import TestCase
+
+from sagemaker_mlflow.auth_retry import (
+    AUTH_FAILURE_CLOCK_SKEW,
+    AUTH_FAILURE_EXPIRED_CREDENTIALS,
+    AuthRetryState,
+    classify_auth_failure,
+)
+
+
+class TestClassifyAuthFailure(TestCase):
+    def test_expired_credentials(self):
+        message = '{"message":"The security token included in the request is expired"}'
+        self.assertEqual(classify_auth_failure(403, None, message), AUTH_FAILURE_EXPIRED_CREDENTIALS)
+        self.assertEqual(classify_auth_failure(403, "ExpiredTokenException", ""), AUTH_FAILURE_EXPIRED_CREDENTIALS)
+
+    def test_clock_skew(self):
+        message = '{"message":"Signature expired: 20240101T000000Z is now earlier than 20240101T000500Z"}'
+        self.assertEqual(classify_auth_failure(403, "InvalidSignatureException", message), AUTH_FAILURE_CLOCK_SKEW)
+        self.assertEqual(classify_auth_failure(403, None, "Signature not yet current"), AUTH_FAILURE_CLOCK_SKEW)
+        self.assertEqual(classify_auth_failure(400, "RequestTimeTooSkewed", ""), AUTH_FAILURE_CLOCK_SKEW)
+
+    def test_other_responses(self):
+        self.assertIsNone(classify_auth_failure(403, "InvalidSignatureException", "The signature does not match"))
+        self.assertIsNone(classify_auth_failure(403, "AccessDeniedException", "not authorized"))
+        self.assertIsNone(classify_auth_failure(500, None, "ExpiredToken"))
+
+
+class TestAuthRetryState(TestCase):
+    def test_correct_clock(self):
+        state = AuthRetryState()
+
+        self.assertTrue(state.correct_clock(formatdate(time.time() + 3600, usegmt=True)))
+
+        self.assertAlmostEqual(state.clock_offset, 3600, delta=2)
+
+    def test_correct_clock_ignores_bad_dates(self):
+        state = AuthRetryState()
+        self.assertFalse(state.correct_clock(None))
+        self.assertFalse(state.correct_clock("yesterday"))
+        self.assertEqual(state.clock_offset, 0)
+
+    def test_stats(self):
+        state = AuthRetryState()
+        state.record_failure(AUTH_FAILURE_EXPIRED_CREDENTIALS)
+        state.record_retry(succeeded=True)
+        state.record_failure(AUTH_FAILURE_CLOCK_SKEW)
+        state.record_retry(succeeded=False)
+
+        self.assertEqual(
+            state.stats(),
+            {
+                "expired_credentials": 1,
+                "clock_skew": 1,
+                "retries": 2,
+                "retry_failures": 1,
+                "clock_offset_seconds": 0.0,
+            },
+        )
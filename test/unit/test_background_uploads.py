@@ -0,0 +1,145 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from sagemaker_mlflow import background_uploads
+from sagemaker_mlflow.background_uploads import BackgroundUploadError, BackgroundUploader
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+
+class TestBackgroundUploader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.staging_dir = os.path.join(self.tmp_dir, "staging")
+        os.makedirs(self.staging_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, name, size):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_upload_reads_staged_copy_and_cleans_up(self):
+        local_file = self._write("model.bin", 10)
+        seen = {}
+
+        def upload(staged_path):
+            seen["name"] = os.path.basename(staged_path)
+            with open(staged_path, "rb") as f:
+                seen["data"] = f.read()
+
+        uploader = BackgroundUploader(staging_dir=self.staging_dir)
+        future = uploader.submit(local_file, upload)
+        # The caller may remove its file as soon as submit returns.
+        os.remove(local_file)
+        future.result(5)
+
+        self.assertEqual(seen, {"name": "model.bin", "data": b"x" * 10})
+        self.assertEqual(os.listdir(self.staging_dir), [])
+        self.assertEqual(uploader.staged_bytes, 0)
+
+    def test_rewriting_original_in_place_does_not_change_upload(self):
+        local_file = self._write("model.bin", 10)
+        release = threading.Event()
+        seen = []
+
+        def upload(staged_path):
+            release.wait(5)
+            with open(staged_path, "rb") as f:
+                seen.append(f.read())
+
+        uploader = BackgroundUploader(staging_dir=self.staging_dir)
+        future = uploader.submit(local_file, upload)
+        # As torch.save or open(path, "wb") would for the next checkpoint.
+        with open(local_file, "r+b") as f:
+            f.write(b"y" * 10)
+        release.set()
+        future.result(5)
+
+        self.assertEqual(seen, [b"x" * 10])
+
+    def test_directory_is_staged_recursively(self):
+        local_dir = os.path.join(self.tmp_dir, "ckpt")
+        os.makedirs(os.path.join(local_dir, "sub"))
+        with open(os.path.join(local_dir, "sub", "a.txt"), "w") as f:
+            f.write("a")
+        seen = []
+
+        uploader = BackgroundUploader(staging_dir=self.staging_dir)
+        uploader.submit(local_dir, lambda staged: seen.append(os.listdir(os.path.join(staged, "sub")))).result(5)
+
+        self.assertEqual(seen, [["a.txt"]])
+
+    def test_submit_blocks_while_staged_bytes_over_limit(self):
+        first = self._write("first", 60)
+        second = self._write("second", 60)
+        release = threading.Event()
+        uploader = BackgroundUploader(max_staged_bytes=100, max_workers=2, staging_dir=self.staging_dir)
+        uploader.submit(first, lambda staged: release.wait(5))
+
+        submitted = threading.Event()
+        thread = threading.Thread(target=lambda: (uploader.submit(second, lambda staged: None), submitted.set()))
+        thread.start()
+        self.assertFalse(submitted.wait(0.2))
+        self.assertEqual(uploader.staged_bytes, 60)
+
+        release.set()
+        self.assertTrue(submitted.wait(5))
+        thread.join(5)
+        uploader.wait_all()
+        self.assertEqual(uploader.staged_bytes, 0)
+
+    def test_wait_all_reports_failures_once(self):
+        local_file = self._write("a.txt", 1)
+        uploader = BackgroundUploader(staging_dir=self.staging_dir)
+
+        def fail(staged_path):
+            raise Exception("HTTP 403")
+
+        uploader.submit(local_file, fail)
+        with self.assertRaises(BackgroundUploadError) as cm:
+            uploader.wait_all()
+        self.assertIn(local_file, cm.exception.failures)
+        uploader.wait_all()
+
+    def test_wait_all_scoped_to_run(self):
+        local_file = self._write("a.txt", 1)
+        release = threading.Event()
+        uploader = BackgroundUploader(staging_dir=self.staging_dir)
+        other = uploader.submit(local_file, lambda staged: release.wait(5), run_id="other")
+        mine = uploader.submit(local_file, lambda staged: None, run_id="mine")
+
+        uploader.wait_all(run_id="mine")
+        self.assertTrue(mine.done())
+        self.assertFalse(other.done())
+        release.set()
+        uploader.wait_all()
+
+    def test_flush_logs_failures_instead_of_raising(self):
+        uploader = mock.Mock()
+        uploader.wait_all.side_effect = BackgroundUploadError({"a.txt": Exception("boom")})
+        with mock.patch.object(background_uploads, "_uploader", uploader):
+            with self.assertLogs("sagemaker_mlflow.background_uploads", level="ERROR"):
+                background_uploads.flush_background_uploads("run1")
+        uploader.wait_all.assert_called_once_with("run1")
+
+    def test_invalid_setting_raises(self):
+        env = {"SAGEMAKER_PRESIGNED_URL_UPLOAD_BACKGROUND_WORKERS": "two"}
+        with mock.patch.object(background_uploads, "_uploader", None), mock.patch.dict(os.environ, env):
+            with self.assertRaisesRegex(MlflowSageMakerException, "SAGEMAKER_PRESIGNED_URL_UPLOAD_BACKGROUND_WORKERS"):
+                background_uploads.get_background_uploader()
+
+    def test_flush_without_uploader_is_noop(self):
+        with mock.patch.object(background_uploads, "_uploader", None):
+            background_uploads.flush_background_uploads()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+from sagemaker_mlflow.bandwidth_limiter import (
+    PRIORITY_BULK,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    BandwidthLimiter,
+    ThrottledReader,
+    default_upload_priority,
+    resolve_priority,
+    upload_priority,
+)
+from sagemaker_mlflow.buffer_reader import BufferReader
+
+
+class TestBandwidthLimiter(unittest.TestCase):
+
+    def test_unlimited_does_not_wait(self):
+        limiter = BandwidthLimiter()
+        limiter.acquire(10**12)
+        self.assertEqual(limiter.stats()["throttled_blocks"], 0)
+        self.assertEqual(limiter.stats()["bytes_sent"], 10**12)
+
+    def test_rate_is_enforced(self):
+        limiter = BandwidthLimiter(rate=1_000_000, burst=100_000)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire(100_000)
+        # The burst covers the first block and the second may go out on credit, so the
+        # remaining 200 KB take ~0.2s.
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+        self.assertGreater(limiter.stats()["throttled_blocks"], 0)
+
+    def test_set_rate_at_runtime(self):
+        limiter = BandwidthLimiter(rate=1_000, burst=1_000)
+        limiter.acquire(1_000_000)
+        released = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(1), released.set()))
+        thread.start()
+        self.assertFalse(released.wait(0.1))
+
+        limiter.set_rate(None)
+        self.assertTrue(released.wait(5))
+        thread.join(5)
+        self.assertIsNone(limiter.rate)
+
+    def test_urgent_class_goes_first(self):
+        limiter = BandwidthLimiter(rate=1_000_000, burst=10_000)
+        limiter.acquire(100_000)
+        order = []
+
+        def acquire(priority, name):
+            limiter.acquire(50_000, priority)
+            order.append(name)
+
+        bulk = threading.Thread(target=acquire, args=(PRIORITY_BULK, "bulk"))
+        bulk.start()
+        time.sleep(0.02)
+        high = threading.Thread(target=acquire, args=(PRIORITY_HIGH, "high"))
+        high.start()
+        bulk.join(5)
+        high.join(5)
+
+        self.assertEqual(order, ["high", "bulk"])
+
+    def test_throttled_reader_keeps_length(self):
+        limiter = BandwidthLimiter(rate=10**9)
+        reader = ThrottledReader(BufferReader(b"x" * 100), 100, limiter, PRIORITY_NORMAL)
+        self.assertEqual(len(reader), 100)
+        self.assertEqual(len(reader.read(30)), 30)
+        self.assertEqual(len(reader), 70)
+        self.assertEqual(limiter.stats()["bytes_sent"], 30)
+
+
+class TestPriorityResolution(unittest.TestCase):
+
+    def test_size_and_context(self):
+        self.assertEqual(resolve_priority(10), PRIORITY_HIGH)
+        self.assertEqual(resolve_priority(10**9), PRIORITY_NORMAL)
+        with default_upload_priority(PRIORITY_BULK):
+            self.assertEqual(resolve_priority(10), PRIORITY_HIGH)
+            self.assertEqual(resolve_priority(10**9), PRIORITY_BULK)
+        with upload_priority(PRIORITY_BULK):
+            self.assertEqual(resolve_priority(10), PRIORITY_BULK)
+        self.assertEqual(resolve_priority(10**9), PRIORITY_NORMAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import array
+import mmap
+import tempfile
+import unittest
+from unittest import mock
+
+from sagemaker_mlflow import buffer_reader
+from sagemaker_mlflow.buffer_reader import BufferReader, map_file
+
+
+class TestBufferReader(unittest.TestCase):
+
+    def test_reads_slices_without_copying(self):
+        data = bytearray(b"0123456789")
+        reader = BufferReader(data)
+
+        first = reader.read(4)
+        self.assertIsInstance(first, memoryview)
+        self.assertEqual(bytes(first), b"0123")
+        self.assertEqual(len(reader), 6)
+        # A view into the caller's buffer, not a copy of it.
+        data[0:1] = b"X"
+        self.assertEqual(bytes(first), b"X123")
+
+        self.assertEqual(bytes(reader.read()), b"456789")
+        self.assertEqual(len(reader), 0)
+        self.assertFalse(reader.read(4))
+
+    def test_multibyte_items_read_as_bytes(self):
+        data = array.array("i", [1, 2, 3])
+        reader = BufferReader(memoryview(data))
+
+        self.assertEqual(len(reader), data.itemsize * 3)
+        self.assertEqual(bytes(reader.read()), data.tobytes())
+
+    def test_non_contiguous_view(self):
+        reader = BufferReader(memoryview(b"abcdef")[::2])
+        self.assertEqual(bytes(reader.read()), b"ace")
+
+
+class TestMapFile(unittest.TestCase):
+
+    def setUp(self):
+        self.file = tempfile.TemporaryFile()
+        self.addCleanup(self.file.close)
+        self.file.write(b"0123456789" * 10)
+        self.file.flush()
+        self.file.seek(0)
+
+    def test_small_file_yielded_unchanged(self):
+        with map_file(self.file, 100) as body:
+            self.assertIs(body, self.file)
+
+    @mock.patch.object(buffer_reader, "MMAP_MIN_FILE_SIZE", 10)
+    def test_large_file_mapped_and_unmapped_after_use(self):
+        mappings = []
+        real_mmap = mmap.mmap
+
+        def track(*args, **kwargs):
+            mappings.append(real_mmap(*args, **kwargs))
+            return mappings[-1]
+
+        with mock.patch.object(buffer_reader.mmap, "mmap", side_effect=track):
+            with map_file(self.file, 100) as body:
+                self.assertIsInstance(body, BufferReader)
+                self.assertEqual(len(body), 100)
+                self.assertEqual(bytes(body.read(10)), b"0123456789")
+
+        self.assertTrue(mappings[0].closed)
+
+    @mock.patch.object(buffer_reader, "MMAP_MIN_FILE_SIZE", 10)
+    def test_unmappable_file_falls_back_to_reading(self):
+        with mock.patch.object(buffer_reader.mmap, "mmap", side_effect=OSError("not supported")):
+            with map_file(self.file, 100) as body:
+                self.assertIs(body, self.file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,18 @@ class TestCredentialCache(unittest.TestCase):
         result = self.cache.get_credentials(self.test_role_arn)
         self.assertIsNone(result)
 
+    def test_invalidate_removes_rejected_credentials_only(self):
+        # Test that invalidating stale credentials keeps newer ones cached since
+        self.cache.set_credentials(self.test_role_arn, self.test_credentials, 300)
+        newer_credentials = dict(self.test_credentials, AccessKeyId="newer-access-key")
+        self.cache.set_credentials(self.test_role_arn, newer_credentials, 300)
+
+        self.cache.invalidate(self.test_role_arn, self.test_credentials)
+        self.assertEqual(self.cache.get_credentials(self.test_role_arn), newer_credentials)
+
+        self.cache.invalidate(self.test_role_arn, newer_credentials)
+        self.assertIsNone(self.cache.get_credentials(self.test_role_arn))
+
     def test_cache_hit_returns_credentials(self):
         # Test that cache hit returns stored credentials
         ttl_seconds = 300
@@ -0,0 +1,38 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from sagemaker_mlflow.credential_identity import credentials_identity
+
+
+class TestCredentialsIdentity(TestCase):
+    def setUp(self):
+        config_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(config_dir.cleanup)
+        self.credentials_file = os.path.join(config_dir.name, "credentials")
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "AWS_PROFILE": "default",
+                "AWS_SHARED_CREDENTIALS_FILE": self.credentials_file,
+                "AWS_CONFIG_FILE": os.path.join(config_dir.name, "config"),
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_explicit_credentials_identified_by_value(self):
+        self.assertEqual(credentials_identity("AKID", "secret"), credentials_identity("AKID", "secret"))
+        self.assertNotEqual(credentials_identity("AKID", "secret"), credentials_identity("AKID", "rotated"))
+        self.assertNotIn("secret", repr(credentials_identity("AKID", "secret")))
+
+    def test_ambient_identity_follows_environment_and_files(self):
+        identity = credentials_identity()
+        self.assertEqual(credentials_identity(), identity)
+
+        with mock.patch.dict(os.environ, {"AWS_PROFILE": "other"}):
+            self.assertNotEqual(credentials_identity(), identity)
+
+        with open(self.credentials_file, "w") as f:
+            f.write("[default]\n")
+        self.assertNotEqual(credentials_identity(), identity)
@@ -0,0 +1,81 @@
+import os
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, mock
+
+from botocore.credentials import Credentials, RefreshableCredentials
+
+from sagemaker_mlflow.credential_provider import SharedCredentialProvider
+
+
+def _refreshable(expires_in):
+    expiry = datetime.now(timezone.utc) + expires_in
+    return RefreshableCredentials.create_from_metadata(
+        {"access_key": "AKID", "secret_key": "secret", "token": "token", "expiry_time": expiry.isoformat()},
+        refresh_using=mock.Mock(side_effect=AssertionError("refreshed")),
+        method="container-role",
+    )
+
+
+@mock.patch.dict(os.environ, {"AWS_PROFILE": "default"})
+@mock.patch("boto3.Session")
+class TestSharedCredentialProvider(TestCase):
+    def test_resolves_once(self, session):
+        provider = SharedCredentialProvider()
+
+        first = provider.get_credentials()
+        second = provider.get_credentials()
+
+        self.assertIs(first, second)
+        session.assert_called_once_with()
+        self.assertEqual(provider.stats(), {"resolutions": 1, "hits": 1})
+
+    def test_resolves_again_when_environment_changes(self, session):
+        provider = SharedCredentialProvider()
+        session.return_value.get_credentials.side_effect = [Credentials("a", "s"), Credentials("b", "s")]
+
+        provider.get_credentials()
+        with mock.patch.dict(os.environ, {"AWS_PROFILE": "other"}):
+            credentials = provider.get_credentials()
+
+        self.assertEqual(credentials.access_key, "b")
+
+    def test_missing_credentials_are_not_cached(self, session):
+        provider = SharedCredentialProvider()
+        session.return_value.get_credentials.side_effect = [None, Credentials("a", "s")]
+
+        self.assertIsNone(provider.get_credentials())
+        self.assertEqual(provider.get_credentials().access_key, "a")
+
+    def test_invalidate_only_drops_rejected_credentials(self, session):
+        provider = SharedCredentialProvider()
+        session.return_value.get_credentials.side_effect = [Credentials("a", "s"), Credentials("b", "s")]
+        stale = provider.get_credentials()
+
+        provider.invalidate(Credentials("other", "s"))
+        self.assertIs(provider.get_credentials(), stale)
+        provider.invalidate(stale)
+        self.assertEqual(provider.get_credentials().access_key, "b")
+
+    def test_fork_keeps_valid_credentials_static(self, session):
+        provider = SharedCredentialProvider()
+        session.return_value.get_credentials.return_value = _refreshable(timedelta(hours=1))
+        provider.get_credentials()
+
+        provider._reset_after_fork()
+        credentials = provider.get_credentials()
+
+        self.assertNotIsInstance(credentials, RefreshableCredentials)
+        self.assertEqual(
+            (credentials.access_key, credentials.secret_key, credentials.token), ("AKID", "secret", "token")
+        )
+        self.assertEqual(credentials.method, "container-role")
+        session.assert_called_once_with()
+
+    def test_fork_resolves_credentials_close_to_expiry(self, session):
+        provider = SharedCredentialProvider()
+        session.return_value.get_credentials.side_effect = [_refreshable(timedelta(minutes=5)), Credentials("b", "s")]
+        provider.get_credentials()
+
+        provider._reset_after_fork()
+
+        self.assertEqual(provider.get_credentials().access_key, "b")
@@ -0,0 +1,181 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase, mock, skipUnless
+
+from sagemaker_mlflow import download_cache
+from sagemaker_mlflow.download_cache import DownloadCache, default_download_cache_dir, get_download_cache
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+URI = "s3://bucket/1/run/artifacts/model/weights.bin"
+
+
+def _writer(content, calls=None, delay=0.0):
+    def download(path):
+        if calls is not None:
+            calls.append(path)
+        time.sleep(delay)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    return download
+
+
+def _fetch_in_child(root, local_path, marker_dir):
+    def download(path):
+        open(os.path.join(marker_dir, str(os.getpid())), "w").close()
+        time.sleep(0.2)
+        with open(path, "wb") as f:
+            f.write(b"shared")
+
+    DownloadCache(root).fetch(URI, '"etag"', local_path, download)
+
+
+class TestDownloadCache(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = os.path.join(tmp.name, "cache")
+        self.dst = os.path.join(tmp.name, "dst")
+        os.makedirs(self.dst)
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_hit_is_hard_linked(self):
+        cache = DownloadCache(self.root, link=True)
+        calls = []
+        first = os.path.join(self.dst, "a.bin")
+        second = os.path.join(self.dst, "b.bin")
+
+        self.assertFalse(cache.fetch(URI, '"etag"', first, _writer(b"weights", calls)))
+        os.utime(first, (1000, 1000))
+        self.assertTrue(cache.fetch(URI, '"etag"', second, _writer(b"other", calls)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self._read(second), b"weights")
+        self.assertEqual(os.stat(first).st_ino, os.stat(second).st_ino)
+        self.assertFalse(os.stat(second).st_mode & 0o222)
+        # The hit is recorded without touching the linked files.
+        self.assertEqual(os.stat(first).st_mtime, 1000)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "evictions": 0})
+
+    def test_new_etag_is_a_new_entry(self):
+        cache = DownloadCache(self.root)
+        path = os.path.join(self.dst, "a.bin")
+        cache.fetch(URI, '"v1"', path, _writer(b"old"))
+        self.assertFalse(cache.fetch(URI, '"v2"', path, _writer(b"new")))
+        self.assertEqual(self._read(path), b"new")
+
+    def test_copies_by_default(self):
+        cache = DownloadCache(self.root)
+        path = os.path.join(self.dst, "a.bin")
+        cache.fetch(URI, '"etag"', path, _writer(b"weights"))
+        with open(path, "ab") as f:
+            f.write(b"!")
+        other = os.path.join(self.dst, "b.bin")
+        cache.fetch(URI, '"etag"', other, _writer(b"unused"))
+        self.assertEqual(self._read(other), b"weights")
+
+    def test_failed_download_is_not_cached(self):
+        cache = DownloadCache(self.root)
+        path = os.path.join(self.dst, "a.bin")
+
+        def fail(tmp_path):
+            with open(tmp_path, "wb") as f:
+                f.write(b"part")
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            cache.fetch(URI, '"etag"', path, fail)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(os.path.join(self.root, "tmp")), [])
+        self.assertFalse(cache.fetch(URI, '"etag"', path, _writer(b"weights")))
+
+    def test_concurrent_misses_download_once(self):
+        cache = DownloadCache(self.root)
+        calls = []
+        threads = [
+            threading.Thread(
+                target=cache.fetch,
+                args=(URI, '"etag"', os.path.join(self.dst, f"{i}.bin"), _writer(b"weights", calls, 0.1)),
+            )
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(os.listdir(self.dst)), ["0.bin", "1.bin", "2.bin", "3.bin"])
+
+    @skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_processes_share_entries(self):
+        marker_dir = tempfile.mkdtemp(dir=self.dst)
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_fetch_in_child, args=(self.root, os.path.join(self.dst, f"{i}.bin"), marker_dir))
+            for i in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual([process.exitcode for process in processes], [0, 0, 0])
+        self.assertEqual(len(os.listdir(marker_dir)), 1)
+        self.assertEqual(self._read(os.path.join(self.dst, "2.bin")), b"shared")
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = DownloadCache(self.root, max_bytes=10)
+        path = os.path.join(self.dst, "x.bin")
+        cache.fetch("s3://b/a", "1", path, _writer(b"aaaa"))
+        cache.fetch("s3://b/b", "1", path, _writer(b"bbbb"))
+        old = time.time() - 60
+        for root, _, files in os.walk(self.root):
+            for name in files:
+                os.utime(os.path.join(root, name), (old, old))
+        cache.fetch("s3://b/a", "1", path, _writer(b"unused"))
+
+        cache.fetch("s3://b/c", "1", path, _writer(b"cccc"))
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        calls = []
+        self.assertTrue(cache.fetch("s3://b/a", "1", path, _writer(b"aaaa", calls)))
+        self.assertFalse(cache.fetch("s3://b/b", "1", path, _writer(b"bbbb", calls)))
+        self.assertEqual(len(calls), 1)
+
+    def test_cache_scanned_only_when_estimate_exceeds_limit(self):
+        cache = DownloadCache(self.root, max_bytes=10)
+        path = os.path.join(self.dst, "x.bin")
+        with mock.patch.object(cache, "evict", wraps=cache.evict) as evict:
+            cache.fetch("s3://b/a", "1", path, _writer(b"aaaa"))
+            cache.fetch("s3://b/b", "1", path, _writer(b"bbbb"))
+            self.assertEqual(evict.call_count, 1)
+
+            cache.fetch("s3://b/c", "1", path, _writer(b"cccc"))
+            self.assertEqual(evict.call_count, 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_max_bytes_setting(self):
+        self.addCleanup(setattr, download_cache, "_cache", None)
+        for value, expected in (("2GiB", 2 * 1024**3), ("1000", 1000)):
+            download_cache._cache = None
+            with mock.patch.dict(
+                os.environ,
+                {"SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR": self.root, "SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES": value},
+            ):
+                self.assertEqual(get_download_cache().max_bytes, expected)
+
+        download_cache._cache = None
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_MAX_BYTES": "lots"}):
+            with self.assertRaises(MlflowSageMakerException):
+                get_download_cache()
+
+    def test_default_dir(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR": "/data/cache"}):
+            self.assertEqual(default_download_cache_dir(), "/data/cache")
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_DIR": "", "XDG_CACHE_HOME": "/xdg"}):
+            self.assertEqual(default_download_cache_dir(), "/xdg/sagemaker_mlflow/downloads")
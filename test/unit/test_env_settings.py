@@ -0,0 +1,36 @@
+import os
+from unittest import TestCase, mock
+
+from sagemaker_mlflow.env_settings import env_setting, parse_size
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+
+
+class TestParseSize(TestCase):
+    def test_plain_bytes(self):
+        self.assertEqual(parse_size("1048576"), 1024 * 1024)
+
+    def test_suffixes_are_binary(self):
+        self.assertEqual(parse_size("8KB"), 8 * 1024)
+        self.assertEqual(parse_size("64mb"), 64 * 1024**2)
+        self.assertEqual(parse_size("2 GiB"), 2 * 1024**3)
+
+    def test_invalid(self):
+        for value in ("", "1.5MB", "-1", "10TB", "MB"):
+            with self.assertRaises(ValueError, msg=value):
+                parse_size(value)
+
+
+class TestEnvSetting(TestCase):
+    def test_unset_or_empty(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_TEST_SIZE": ""}):
+            self.assertIsNone(env_setting("SAGEMAKER_MLFLOW_TEST_SIZE", parse_size))
+        self.assertIsNone(env_setting("SAGEMAKER_MLFLOW_TEST_UNSET", parse_size))
+
+    def test_parsed(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_TEST_SIZE": "8MiB"}):
+            self.assertEqual(env_setting("SAGEMAKER_MLFLOW_TEST_SIZE", parse_size), 8 * 1024**2)
+
+    def test_invalid_names_variable(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_TEST_SIZE": "big"}):
+            with self.assertRaisesRegex(MlflowSageMakerException, "Invalid SAGEMAKER_MLFLOW_TEST_SIZE"):
+                env_setting("SAGEMAKER_MLFLOW_TEST_SIZE", parse_size)
@@ -0,0 +1,201 @@
+import os
+import signal
+import threading
+import traceback
+from contextlib import contextmanager
+from unittest import TestCase, mock, skipUnless
+
+from sagemaker_mlflow import (
+    background_uploads,
+    bandwidth_limiter,
+    credential_provider,
+    http2_transport,
+    request_hedging,
+    request_rate_limiter,
+    s3_client_cache,
+    upload_connection_pool,
+    upload_scheduler,
+)
+from sagemaker_mlflow.auth import AuthBoto
+from sagemaker_mlflow.bandwidth_limiter import PRIORITY_BULK, PRIORITY_HIGH
+from sagemaker_mlflow.credential_cache import CredentialCache
+from sagemaker_mlflow.presigned_url_broker import PresignedUrlBroker
+
+CREDENTIALS = {"AccessKeyId": "AKID", "SecretAccessKey": "secret", "SessionToken": "token"}
+
+
+def _assert_in_child(check):
+    """Run check in a forked child, failing if it raises or hangs."""
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            signal.alarm(10)
+            check()
+            code = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0, f"child failed with status {status}"
+
+
+@contextmanager
+def _held(lock):
+    """Hold lock on another thread, as a request in flight at fork time would."""
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with lock:
+            acquired.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    acquired.wait()
+    try:
+        yield
+    finally:
+        release.set()
+        thread.join()
+
+
+@skipUnless(hasattr(os, "fork"), "requires fork")
+class TestForkSafety(TestCase):
+    def test_credentials_carry_over_and_lock_is_reset(self):
+        cache = AuthBoto._credential_cache
+        self.addCleanup(cache.clear)
+        cache.set_credentials("arn:aws:iam::000000000000:role/r", CREDENTIALS, 600)
+
+        def check():
+            assert cache.get_credentials("arn:aws:iam::000000000000:role/r") == CREDENTIALS
+
+        with _held(cache._lock):
+            _assert_in_child(check)
+
+    def test_shared_credentials_carry_over(self):
+        provider = credential_provider.SharedCredentialProvider()
+        with mock.patch("boto3.Session") as session, mock.patch.object(credential_provider, "_provider", provider):
+            session.return_value.get_credentials.return_value = mock.Mock(_expiry_time=None, spec=["method"])
+            provider.get_credentials()
+
+            def check():
+                assert credential_provider.get_credential_provider().get_credentials() is not None
+                assert provider.stats()["resolutions"] == 1
+
+            with _held(provider._lock), _held(credential_provider._provider_lock):
+                _assert_in_child(check)
+
+    def test_expired_credentials_are_dropped(self):
+        cache = CredentialCache()
+        cache.set_credentials("role", CREDENTIALS, 600)
+
+        def check():
+            assert cache._cache == {}
+
+        with mock.patch("time.time", return_value=10**12):
+            _assert_in_child(check)
+
+    def test_scheduler_slots_are_released(self):
+        scheduler = upload_scheduler.AdaptiveUploadScheduler(max_concurrency=1, initial_concurrency=1)
+        with mock.patch.object(upload_scheduler, "_scheduler", scheduler):
+            with scheduler._slot(), _held(upload_scheduler._scheduler_lock):
+
+                def check():
+                    with upload_scheduler.get_upload_scheduler()._slot():
+                        pass
+                    assert scheduler.concurrency_limit == 1
+
+                _assert_in_child(check)
+
+    def test_limiter_forgets_parent_waiters(self):
+        limiter = bandwidth_limiter.BandwidthLimiter(rate=1024 * 1024 * 1024)
+        limiter._waiting[PRIORITY_HIGH] = 1
+        self.addCleanup(limiter._waiting.clear)
+        with mock.patch.object(bandwidth_limiter, "_limiter", limiter), _held(limiter._cond):
+
+            def check():
+                bandwidth_limiter.get_bandwidth_limiter().acquire(1, PRIORITY_BULK)
+                assert limiter.rate == 1024 * 1024 * 1024
+
+            _assert_in_child(check)
+
+    def test_broker_does_not_wait_for_parent_prefetch(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch_url(path, expiration):
+            if threading.current_thread().name.startswith("SageMakerPresignedUrlPrefetch"):
+                release.wait()
+            return f"https://bucket.s3.amazonaws.com/{path}", {}
+
+        broker = PresignedUrlBroker(fetch_url)
+        broker.prefetch(["model.bin"])
+
+        def check():
+            assert broker.get("model.bin").url == "https://bucket.s3.amazonaws.com/model.bin"
+
+        _assert_in_child(check)
+
+    def test_pools_and_clients_are_not_shared(self):
+        cache = s3_client_cache.S3ClientCache()
+        cache.get_client(access_key_id="AKID", secret_access_key="secret", region_name="us-west-2")
+        uploader = mock.Mock()
+        with mock.patch.object(s3_client_cache, "_cache", cache), mock.patch.object(
+            background_uploads, "_uploader", uploader
+        ):
+            parent_pool = upload_connection_pool.get_upload_connection_pool()
+
+            def check():
+                assert cache.stats()["clients"] == 0
+                assert background_uploads._uploader is None
+                assert upload_connection_pool.get_upload_connection_pool() is not parent_pool
+
+            with _held(upload_connection_pool._pool_lock):
+                _assert_in_child(check)
+        self.assertIs(upload_connection_pool.get_upload_connection_pool(), parent_pool)
+
+    def test_http2_connections_are_not_shared(self):
+        adapter = http2_transport.Http2Adapter(mock.Mock())
+        connection = mock.Mock()
+        adapter._connections[("example.com", 443, True, None)] = [connection]
+
+        def check():
+            assert adapter._connections == {}
+            assert not adapter._lock.locked()
+            assert not http2_transport._mount_lock.locked()
+
+        with _held(adapter._lock), _held(http2_transport._mount_lock):
+            _assert_in_child(check)
+        connection.close.assert_not_called()
+
+    def test_rate_limiter_keeps_rate_and_resets_locks(self):
+        limiter = request_rate_limiter.RequestRateLimiter({("*", "*"): 100.0})
+        request = mock.Mock(url="https://example.com/api/2.0/mlflow/runs/get", method="GET")
+        limiter.acquire(request)
+        bucket, sent_at = request._sagemaker_mlflow_rate_limit
+        bucket.record_response(sent_at, throttled=True)
+
+        def check():
+            limiter.acquire(request)
+            assert limiter.stats()["example.com/read"]["rate_per_second"] < 100
+
+        with mock.patch.object(request_rate_limiter, "_limiter", limiter), _held(limiter._lock), _held(bucket._cond):
+            _assert_in_child(check)
+
+    def test_hedger_starts_new_workers(self):
+        hedger = request_hedging.RequestHedger()
+        # Calls go through the workers once the API has a latency threshold.
+        for _ in range(21):
+            hedger.call("GetRun", lambda: None)
+        parent_executor = hedger._executor
+        self.assertIsNotNone(parent_executor)
+
+        def check():
+            assert hedger.call("GetRun", lambda: "child") == "child"
+            assert hedger._executor is not parent_executor
+
+        with mock.patch.object(request_hedging, "_hedger", hedger), _held(hedger._lock):
+            _assert_in_child(check)
@@ -0,0 +1,55 @@
+import hashlib
+import io
+import unittest
+
+from sagemaker_mlflow.hashing_reader import HashingReader, etag_matches
+
+DATA = b"0123456789" * 1000
+MD5 = hashlib.md5(DATA).hexdigest()
+
+
+class TestHashingReader(unittest.TestCase):
+
+    def test_hashes_data_as_it_is_read(self):
+        reader = HashingReader(io.BytesIO(DATA), len(DATA), ["md5", "sha256"])
+        self.assertEqual(len(reader), len(DATA))
+
+        chunks = []
+        while True:
+            chunk = reader.read(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            self.assertEqual(len(reader), len(DATA) - sum(map(len, chunks)))
+
+        self.assertEqual(b"".join(chunks), DATA)
+        self.assertTrue(reader.complete)
+        self.assertEqual(reader.hexdigest("md5"), MD5)
+        self.assertEqual(reader.hexdigest("sha256"), hashlib.sha256(DATA).hexdigest())
+
+    def test_partial_read_not_complete(self):
+        reader = HashingReader(io.BytesIO(DATA), len(DATA))
+        reader.read(10)
+        self.assertFalse(reader.complete)
+
+
+class TestEtagMatches(unittest.TestCase):
+
+    def test_plain_etag(self):
+        self.assertTrue(etag_matches({"ETag": f'"{MD5}"'}, MD5))
+        self.assertFalse(etag_matches({"ETag": '"00000000000000000000000000000000"'}, MD5))
+
+    def test_uncomparable_etags(self):
+        self.assertIsNone(etag_matches({}, MD5))
+        self.assertIsNone(etag_matches({"ETag": '"abc-2"'}, MD5))
+        self.assertIsNone(etag_matches({"ETag": '"abc"', "x-amz-server-side-encryption": "aws:kms"}, MD5))
+        self.assertIsNone(
+            etag_matches({"ETag": '"abc"', "x-amz-server-side-encryption-customer-algorithm": "AES256"}, MD5)
+        )
+
+    def test_sse_s3_etag_is_compared(self):
+        self.assertTrue(etag_matches({"ETag": f'"{MD5}"', "x-amz-server-side-encryption": "AES256"}, MD5))
+
+
+if __name__ == "__main__":
+    unittest.main()
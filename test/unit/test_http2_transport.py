@@ -0,0 +1,463 @@
+import datetime
+import gzip
+import ipaddress
+import json
+import os
+import socket
+import ssl
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import requests
+from mlflow.utils import rest_utils
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sagemaker_mlflow import http2_transport
+from sagemaker_mlflow.host_creds import get_host_creds
+from sagemaker_mlflow.http2_transport import Http2Adapter, mount_http2_adapter, mount_tracking_http2_adapter
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+except ImportError:
+    h2 = None
+
+
+def _write_certificate(directory):
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+            )
+        )
+    return cert_path, key_path
+
+
+class _Http2Server:
+    """TLS server answering HTTP/2 requests by path:
+
+    * /503: status 503.
+    * /gzip: a gzip encoded JSON body.
+    * /refused: resets the stream with REFUSED_STREAM.
+    * /goaway: sends GOAWAY without processing the stream.
+    * /hang: never answers.
+    * /size: 200 with the length of the request body, for bodies too large to echo.
+    * anything else: 200 echoing the method, path, headers and body as JSON.
+    """
+
+    def __init__(self, cert_path, key_path, protocols=("h2",)):
+        self._context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._context.load_cert_chain(cert_path, key_path)
+        self._context.set_alpn_protocols(list(protocols))
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self.url = f"https://127.0.0.1:{self._socket.getsockname()[1]}"
+        self.connections = 0
+        self.requests = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock):
+        try:
+            with self._context.wrap_socket(sock, server_side=True) as tls:
+                if tls.selected_alpn_protocol() == "h2":
+                    self._serve_http2(tls)
+        except (OSError, ssl.SSLError):
+            pass
+
+    def _serve_http2(self, tls):
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        connection.initiate_connection()
+        tls.sendall(connection.data_to_send())
+        headers, bodies = {}, {}
+        while True:
+            data = tls.recv(65536)
+            if not data:
+                return
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers[event.stream_id] = event.headers
+                    bodies[event.stream_id] = b""
+                elif isinstance(event, h2.events.DataReceived):
+                    bodies[event.stream_id] += event.data
+                    connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    self._respond(
+                        connection, event.stream_id, headers.pop(event.stream_id), bodies.pop(event.stream_id)
+                    )
+            tls.sendall(connection.data_to_send())
+
+    def _respond(self, connection, stream_id, headers, body):
+        request = dict(headers)
+        self.requests.append((headers, body))
+        path = request[":path"]
+        if path == "/refused":
+            connection.reset_stream(stream_id, h2.errors.ErrorCodes.REFUSED_STREAM)
+            return
+        if path == "/goaway":
+            connection.close_connection(last_stream_id=stream_id - 2)
+            return
+        if path == "/hang":
+            return
+        status = 503 if path == "/503" else 200
+        if path == "/size":
+            echo = {"size": len(body)}
+        else:
+            echo = {"method": request[":method"], "path": path, "headers": headers, "body": body.decode("utf-8")}
+        payload = json.dumps(echo).encode("utf-8")
+        response_headers = [(":status", str(status)), ("content-type", "application/json; charset=utf-8")]
+        if path == "/gzip":
+            payload = gzip.compress(payload)
+            response_headers.append(("content-encoding", "gzip"))
+        response_headers += [("content-length", str(len(payload))), ("x-test", "a"), ("x-test", "b")]
+        connection.send_headers(stream_id, response_headers)
+        connection.send_data(stream_id, payload, end_stream=True)
+
+    def close(self):
+        if self._socket.fileno() == -1:
+            return
+        # Shut down first to wake the accept() call, which otherwise keeps the port listening.
+        self._socket.shutdown(socket.SHUT_RDWR)
+        self._socket.close()
+
+
+def _fallback(retry):
+    fallback = Mock(spec=HTTPAdapter)
+    fallback.max_retries = retry
+    fallback.send.return_value = requests.Response()
+    return fallback
+
+
+@unittest.skipUnless(h2 is not None, "requires h2")
+class TestHttp2Adapter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cert_path, cls.key_path = _write_certificate(tempfile.mkdtemp())
+
+    def setUp(self):
+        self.server = _Http2Server(self.cert_path, self.key_path)
+        self.fallback = _fallback(Retry(total=2, status_forcelist=[503], backoff_factor=0))
+        self.adapter = Http2Adapter(self.fallback)
+        self.session = requests.Session()
+        # Otherwise REQUESTS_CA_BUNDLE takes precedence over the session's CA.
+        self.session.trust_env = False
+        self.session.verify = self.cert_path
+        self.session.mount(self.server.url + "/", self.adapter)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.close()
+
+    def test_request_sent_over_http2(self):
+        response = self.session.post(
+            self.server.url + "/api/2.0/mlflow/runs/create?a=b", json={"a": 1}, headers={"Connection": "keep-alive"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.reason, "OK")
+        self.assertEqual(response.encoding, "utf-8")
+        self.assertEqual(response.headers["X-Test"], "a, b")
+        self.assertEqual(response.url, self.server.url + "/api/2.0/mlflow/runs/create?a=b")
+        self.assertIs(response.connection, self.adapter)
+        echo = response.json()
+        self.assertEqual(echo["method"], "POST")
+        self.assertEqual(echo["path"], "/api/2.0/mlflow/runs/create?a=b")
+        self.assertEqual(echo["body"], '{"a": 1}')
+        headers = dict(echo["headers"])
+        self.assertEqual(headers[":authority"], self.server.url[len("https://") :])
+        self.assertEqual(headers["content-type"], "application/json")
+        self.assertNotIn("connection", headers)
+        self.assertEqual(
+            self.adapter.stats(), {"http2_responses": 1, "connections": 1, "fallbacks": 0, "disabled": False}
+        )
+
+    def test_concurrent_requests_share_one_connection(self):
+        def call(i):
+            return self.session.get(f"{self.server.url}/{i}").json()["path"]
+
+        with ThreadPoolExecutor(16) as executor:
+            paths = list(executor.map(call, range(64)))
+
+        self.assertEqual(paths, [f"/{i}" for i in range(64)])
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.adapter.stats()["connections"], 1)
+
+    def test_compressed_response_decoded(self):
+        response = self.session.get(self.server.url + "/gzip")
+
+        self.assertEqual(response.json()["path"], "/gzip")
+
+    def test_large_body_sent_within_flow_control(self):
+        body = "x" * (256 * 1024)
+
+        response = self.session.post(self.server.url + "/size", data=body)
+
+        self.assertEqual(response.json(), {"size": len(body)})
+
+    def test_retryable_status_sent_through_fallback(self):
+        self.session.get(self.server.url + "/503")
+
+        self.fallback.send.assert_called_once()
+
+    def test_retryable_status_returned_without_retries(self):
+        self.fallback.max_retries = Retry(total=0, status_forcelist=[503])
+
+        response = self.session.get(self.server.url + "/503")
+
+        self.assertEqual(response.status_code, 503)
+        self.fallback.send.assert_not_called()
+
+    def test_unprocessed_requests_sent_through_fallback(self):
+        # POST is not retried by this policy, but the server did not process these.
+        self.fallback.max_retries = Retry(total=1, allowed_methods=["GET"])
+
+        self.session.post(self.server.url + "/refused", data=b"{}")
+        self.session.post(self.server.url + "/goaway", data=b"{}")
+
+        self.assertEqual(self.fallback.send.call_count, 2)
+        self.assertEqual(self.session.get(self.server.url).status_code, 200)
+        self.assertEqual(self.server.connections, 2)
+
+    def test_timeout_raised_without_retries(self):
+        self.fallback.max_retries = Retry(total=0)
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.session.post(self.server.url + "/hang", data=b"{}", timeout=0.2)
+
+        self.fallback.send.assert_not_called()
+        # The stream was cancelled; the connection carries on.
+        self.assertEqual(self.session.get(self.server.url).status_code, 200)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_timed_out_request_sent_through_fallback_if_retried(self):
+        self.session.get(self.server.url + "/hang", timeout=0.2)
+
+        self.fallback.send.assert_called_once()
+
+    def test_server_without_http2_uses_fallback(self):
+        server = _Http2Server(self.cert_path, self.key_path, protocols=("http/1.1",))
+        self.session.mount(server.url + "/", self.adapter)
+        try:
+            self.session.get(server.url)
+            self.session.get(server.url)
+        finally:
+            server.close()
+
+        self.assertEqual(self.fallback.send.call_count, 2)
+        self.assertEqual(server.connections, 1)
+
+    def test_connection_failure_uses_fallback(self):
+        self.fallback.max_retries = Retry(total=0)
+        self.server.close()
+
+        self.session.post(self.server.url, data=b"{}")
+
+        self.fallback.send.assert_called_once()
+
+    def test_protocol_error_disables_http2(self):
+        with patch.object(
+            h2.connection.H2Connection, "send_headers", side_effect=h2.exceptions.ProtocolError("bad")
+        ), self.assertLogs(http2_transport.logger, "WARNING"):
+            self.session.get(self.server.url)
+        self.session.get(self.server.url)
+
+        self.assertEqual(self.fallback.send.call_count, 2)
+        self.assertTrue(self.adapter.stats()["disabled"])
+
+    def test_unsupported_requests_sent_through_fallback(self):
+        adapter = Http2Adapter(self.fallback)
+        plain = requests.Request("GET", "http://127.0.0.1:1/").prepare()
+        proxied = requests.Request("GET", self.server.url).prepare()
+        with open(os.devnull, "rb") as f:
+            streamed = requests.Request("POST", self.server.url, data=f).prepare()
+            adapter.send(streamed)
+        adapter.send(plain)
+        adapter.send(proxied, proxies={"https": "http://proxy:3128"})
+
+        self.assertEqual(self.fallback.send.call_count, 3)
+        self.assertEqual(self.server.connections, 0)
+
+    def test_close_closes_connections_and_fallback(self):
+        self.session.get(self.server.url)
+        (connection,) = next(iter(self.adapter._connections.values()))
+
+        self.adapter.close()
+
+        self.assertFalse(connection.usable)
+        self.fallback.close.assert_called_once()
+        self.assertEqual(self.adapter._connections, {})
+
+
+class TestMethodRetryable(unittest.TestCase):
+    def test_follows_allowed_methods(self):
+        self.assertTrue(http2_transport._method_retryable(Retry(), "get"))
+        self.assertFalse(http2_transport._method_retryable(Retry(), "POST"))
+        self.assertTrue(http2_transport._method_retryable(Retry(allowed_methods=None), "POST"))
+
+
+class TestMountHttp2Adapter(unittest.TestCase):
+    def setUp(self):
+        http2_transport._http2_unavailable_logged = False
+
+    @unittest.skipUnless(h2 is not None, "requires h2")
+    def test_mount_orders_prefixes_and_keeps_fallback(self):
+        session = requests.Session()
+        https_adapter = session.adapters["https://"]
+
+        adapter = mount_http2_adapter(session, "https://Example.com/")
+
+        self.assertIsInstance(adapter, Http2Adapter)
+        self.assertIs(adapter._fallback, https_adapter)
+        self.assertEqual(list(session.adapters), ["https://example.com/", "https://", "http://"])
+        self.assertIs(session.get_adapter("https://example.com/api/2.0/mlflow/runs/get"), adapter)
+        self.assertIs(session.get_adapter("https://other.com/"), https_adapter)
+
+    @unittest.skipUnless(h2 is not None, "requires h2")
+    def test_mount_is_idempotent(self):
+        session = requests.Session()
+
+        adapter = mount_http2_adapter(session, "https://example.com")
+
+        self.assertIs(mount_http2_adapter(session, "https://example.com"), adapter)
+        self.assertEqual(len(session.adapters), 3)
+
+    @unittest.skipUnless(h2 is not None, "requires h2")
+    def test_max_connections_from_env(self):
+        with patch.dict(os.environ, {"SAGEMAKER_MLFLOW_HTTP2_MAX_CONNECTIONS": "2"}):
+            adapter = mount_http2_adapter(requests.Session(), "https://example.com")
+
+        self.assertEqual(adapter._max_connections, 2)
+
+    def test_missing_dependency_keeps_session(self):
+        session = requests.Session()
+
+        with patch.dict(sys.modules, {"h2": None}), self.assertLogs(http2_transport.logger, "WARNING") as logs:
+            self.assertIsNone(mount_http2_adapter(session, "https://example.com"))
+            self.assertIsNone(mount_http2_adapter(session, "https://example.com"))
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("sagemaker-mlflow[http2]", logs.output[0])
+        self.assertEqual(list(session.adapters), ["https://", "http://"])
+
+    @unittest.skipUnless(h2 is not None, "requires h2")
+    def test_mount_tracking_adapter_uses_mlflow_session(self):
+        adapter = mount_tracking_http2_adapter("https://example.com")
+        session = http2_transport._tracking_session()
+        self.addCleanup(session.adapters.pop, "https://example.com/")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+
+        with patch.object(adapter, "send", return_value=response) as mock_send:
+            rest_utils.http_request(
+                rest_utils.MlflowHostCreds("https://example.com"), "/api/2.0/mlflow/runs/get", "GET"
+            )
+
+        mock_send.assert_called_once()
+
+    def test_tracking_session_is_the_one_mlflow_uses(self):
+        # Pins the private parts of mlflow's request_utils the transport relies on; run
+        # against every mlflow version in the tox matrix.
+        session = http2_transport._tracking_session()
+        self.assertIsInstance(session, requests.Session)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+
+        with patch.object(session, "request", return_value=response) as mock_request:
+            rest_utils.http_request(
+                rest_utils.MlflowHostCreds("https://example.com"), "/api/2.0/mlflow/runs/get", "GET"
+            )
+
+        mock_request.assert_called_once()
+
+    def test_tracking_session_follows_mlflow_signature(self):
+        calls = []
+
+        def get_request_session(max_retries, backoff_factor, retry_codes, raise_on_status):
+            calls.append((max_retries, backoff_factor, retry_codes, raise_on_status))
+            return "session"
+
+        with patch("mlflow.utils.request_utils._get_request_session", get_request_session):
+            self.assertEqual(http2_transport._tracking_session(), "session")
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(calls[0][3], True)
+
+    def test_unknown_mlflow_signature_keeps_http1(self):
+        def get_request_session(max_retries, new_setting):
+            raise AssertionError("not called")
+
+        self.addCleanup(setattr, http2_transport, "_session_unavailable_logged", False)
+        with patch("mlflow.utils.request_utils._get_request_session", get_request_session), self.assertLogs(
+            http2_transport.logger, "WARNING"
+        ):
+            self.assertIsNone(mount_tracking_http2_adapter("https://example.com"))
+
+
+class TestHostCredsHttp2(unittest.TestCase):
+    ARN = "arn:aws:sagemaker:us-west-2:000000000000:mlflow-tracking-server/xw"
+
+    @patch("sagemaker_mlflow.http2_transport.mount_tracking_http2_adapter")
+    @patch("sagemaker_mlflow.host_creds.host_metadata_provider")
+    def test_mounted_only_when_enabled(self, mock_provider, mock_mount):
+        mock_provider.construct_tracking_server_url.return_value = "https://example.com"
+
+        with patch.dict(os.environ, {"SAGEMAKER_MLFLOW_HTTP2": "false"}):
+            get_host_creds(self.ARN)
+        mock_mount.assert_not_called()
+
+        with patch.dict(os.environ, {"SAGEMAKER_MLFLOW_HTTP2": "true"}):
+            get_host_creds(self.ARN)
+        mock_mount.assert_called_once_with("https://example.com")
+
+    @patch("sagemaker_mlflow.host_creds.host_metadata_provider")
+    def test_transport_not_imported_unless_enabled(self, mock_provider):
+        mock_provider.construct_tracking_server_url.return_value = "https://example.com"
+
+        with patch.dict(sys.modules), patch.dict(os.environ, {"SAGEMAKER_MLFLOW_HTTP2": ""}):
+            del sys.modules["sagemaker_mlflow.http2_transport"]
+            get_host_creds(self.ARN)
+            self.assertNotIn("sagemaker_mlflow.http2_transport", sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
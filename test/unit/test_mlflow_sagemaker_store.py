@@ -1,6 +1,8 @@
 import unittest
 from unittest import mock, TestCase
 
+from mlflow.entities import RunStatus
+
 from sagemaker_mlflow.mlflow_sagemaker_store import MlflowSageMakerStore
 from sagemaker_mlflow.host_creds import get_host_creds
 
@@ -27,6 +29,18 @@ class MlflowSageMakerStoreTest(TestCase):
         test_instance = MlflowSageMakerStore(TEST_VALID_ARN, "")
         assert test_instance is not None
 
+    @mock.patch("sagemaker_mlflow.mlflow_sagemaker_store.RestStore.update_run_info")
+    @mock.patch("sagemaker_mlflow.mlflow_sagemaker_store.flush_background_uploads")
+    def test_update_run_info_flushes_uploads_when_run_ends(self, mock_flush, mock_update):
+        store = MlflowSageMakerStore(TEST_VALID_ARN, "")
+
+        store.update_run_info("run1", RunStatus.RUNNING, None, "name")
+        mock_flush.assert_not_called()
+
+        store.update_run_info("run1", RunStatus.FINISHED, 123, "name")
+        mock_flush.assert_called_once_with("run1")
+        mock_update.assert_called_with("run1", RunStatus.FINISHED, 123, "name")
+
 
 if __name__ == "__main__":
     unittest.main()
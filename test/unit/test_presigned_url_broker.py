@@ -0,0 +1,88 @@
+import threading
+import unittest
+from unittest import mock
+
+from sagemaker_mlflow import presigned_url_broker
+from sagemaker_mlflow.presigned_url_broker import PresignedUrlBroker
+
+
+class TestPresignedUrlBroker(unittest.TestCase):
+
+    def setUp(self):
+        self.fetch = mock.Mock(side_effect=lambda path, expiration: (f"https://s3/{path}", {"h": path}))
+
+    @mock.patch("sagemaker_mlflow.presigned_url_broker.time.monotonic")
+    def test_get_fetches_once_and_reuses_until_expiry(self, mock_time):
+        mock_time.return_value = 1000.0
+        broker = PresignedUrlBroker(self.fetch, expiration=900, refresh_margin=60)
+
+        first = broker.get("a.txt")
+        second = broker.get("a.txt")
+        self.assertIs(first, second)
+        self.assertEqual(first.url, "https://s3/a.txt")
+        self.assertEqual(first.headers, {"h": "a.txt"})
+        self.fetch.assert_called_once_with("a.txt", 900)
+
+        # Within the refresh margin of expiry the URL is refreshed just in time.
+        mock_time.return_value = 1000.0 + 900 - 30
+        third = broker.get("a.txt")
+        self.assertEqual(self.fetch.call_count, 2)
+        self.assertEqual(third.expires_at, mock_time.return_value + 900)
+
+    def test_discard_forces_new_fetch(self):
+        broker = PresignedUrlBroker(self.fetch)
+        broker.get("a.txt")
+        broker.discard("a.txt")
+        broker.get("a.txt")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_prefetch_is_used_by_get(self):
+        broker = PresignedUrlBroker(self.fetch)
+        broker.prefetch(["a.txt", "b.txt"])
+        broker.prefetch(["a.txt", "b.txt"])
+
+        self.assertEqual(broker.get("a.txt").url, "https://s3/a.txt")
+        self.assertEqual(broker.get("b.txt").url, "https://s3/b.txt")
+        self.assertEqual(self.fetch.call_count, 2)
+
+    def test_get_waits_for_in_flight_prefetch(self):
+        release = threading.Event()
+
+        def slow_fetch(path, expiration):
+            release.wait(5)
+            return f"https://s3/{path}", {}
+
+        fetch = mock.Mock(side_effect=slow_fetch)
+        broker = PresignedUrlBroker(fetch)
+        broker.prefetch(["a.txt"])
+
+        result = {}
+        getter = threading.Thread(target=lambda: result.update(url=broker.get("a.txt")))
+        getter.start()
+        release.set()
+        getter.join(5)
+
+        self.assertEqual(result["url"].url, "https://s3/a.txt")
+        fetch.assert_called_once()
+
+    def test_prefetch_failure_surfaces_from_get(self):
+        fetch = mock.Mock(side_effect=Exception("HTTP 503"))
+        broker = PresignedUrlBroker(fetch)
+        broker.prefetch(["a.txt"])
+
+        with self.assertRaises(Exception):
+            broker.get("a.txt")
+
+    def test_brokers_share_prefetch_threads(self):
+        before = {t.name for t in threading.enumerate()}
+        for i in range(10):
+            broker = PresignedUrlBroker(self.fetch)
+            broker.prefetch([f"{i}.txt"])
+            broker.get(f"{i}.txt")
+
+        started = {t.name for t in threading.enumerate()} - before
+        self.assertLessEqual(len(started), presigned_url_broker.DEFAULT_PREFETCH_WORKERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
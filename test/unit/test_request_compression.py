@@ -0,0 +1,75 @@
+import gzip
+import os
+from unittest import TestCase, mock, skipUnless
+
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.request_compression import DEFAULT_MIN_BYTES, load_request_compression
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BODY = (
+    b'{"run_id": "r", "metrics": ['
+    + b",".join(b'{"key": "loss", "value": 0.5, "step": 1}' for _ in range(5000))
+    + b"]}"
+)
+
+
+class TestLoadRequestCompression(TestCase):
+    def test_disabled_by_default(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": ""}):
+            self.assertIsNone(load_request_compression())
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "none"}):
+            self.assertIsNone(load_request_compression())
+
+    @mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "gzip"})
+    def test_gzip(self):
+        compression = load_request_compression()
+
+        compressed = compression.compress(BODY)
+
+        self.assertEqual(compression.encoding, "gzip")
+        self.assertEqual(compression.min_bytes, DEFAULT_MIN_BYTES)
+        self.assertEqual(gzip.decompress(compressed), BODY)
+        self.assertEqual(compression.compress(BODY), compressed)
+
+    @mock.patch.dict(
+        os.environ,
+        {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "GZIP", "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES": "1MB"},
+    )
+    def test_small_bodies_are_not_compressed(self):
+        compression = load_request_compression()
+        self.assertEqual(compression.min_bytes, 1024 * 1024)
+        self.assertIsNone(compression.compress(BODY))
+
+    @mock.patch.dict(
+        os.environ,
+        {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "gzip", "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES": "0"},
+    )
+    def test_incompressible_bodies_are_sent_as_is(self):
+        self.assertIsNone(load_request_compression().compress(os.urandom(4096)))
+
+    def test_invalid_settings(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "brotli"}):
+            with self.assertRaisesRegex(MlflowSageMakerException, "expected gzip, zstd or none"):
+                load_request_compression()
+        env = {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "gzip", "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES": "lots"}
+        with mock.patch.dict(os.environ, env):
+            with self.assertRaisesRegex(MlflowSageMakerException, "SAGEMAKER_MLFLOW_REQUEST_COMPRESSION_MIN_BYTES"):
+                load_request_compression()
+
+    @mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "zstd"})
+    def test_zstd_requires_zstandard(self):
+        with mock.patch.dict("sys.modules", {"zstandard": None}):
+            with self.assertRaisesRegex(MlflowSageMakerException, "pip install zstandard"):
+                load_request_compression()
+
+    @skipUnless(zstandard is not None, "requires zstandard")
+    @mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_COMPRESSION": "zstd"})
+    def test_zstd(self):
+        compression = load_request_compression()
+        compressed = compression.compress(BODY)
+        self.assertEqual(compression.encoding, "zstd")
+        self.assertEqual(zstandard.ZstdDecompressor().decompress(compressed), BODY)
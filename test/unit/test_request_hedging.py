@@ -0,0 +1,206 @@
+import contextvars
+import itertools
+import os
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from mlflow.protos.model_registry_pb2 import GetModelVersion
+from mlflow.protos.service_pb2 import GetRun, LogMetric
+from mlflow.store.model_registry.rest_store import RestStore as RegistryRestStore
+from mlflow.store.tracking.rest_store import RestStore
+
+from sagemaker_mlflow import request_hedging
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.mlflow_sagemaker_registry_store import MlflowSageMakerRegistryStore
+from sagemaker_mlflow.mlflow_sagemaker_store import MlflowSageMakerStore
+from sagemaker_mlflow.request_hedging import RequestHedger, call_hedged, get_request_hedger
+
+ARN = "arn:aws:sagemaker:us-west-2:000000000000:mlflow-tracking-server/mw"
+
+
+class _Attempts:
+    """Callable answering with its attempt number, after the delay given for that attempt."""
+
+    def __init__(self, *delays):
+        self._delays = delays
+        self._counter = itertools.count()
+
+    def __call__(self):
+        attempt = next(self._counter)
+        time.sleep(self._delays[attempt] if attempt < len(self._delays) else 0)
+        return attempt
+
+
+class TestRequestHedger(unittest.TestCase):
+    def _warm(self, hedger, api="GetRun"):
+        # Fast calls, run inline, that set the threshold and fill the budget with a hedge.
+        for _ in range(20):
+            hedger.call(api, lambda: None)
+
+    def test_not_hedged_until_threshold_known(self):
+        hedger = RequestHedger()
+        threads = []
+
+        def call():
+            threads.append(threading.current_thread())
+            return _Attempts(0.3)()
+
+        self.assertEqual(hedger.call("GetRun", call), 0)
+
+        self.assertEqual(threads, [threading.current_thread()])
+        self.assertIsNone(hedger._executor)
+        self.assertEqual(hedger.stats()["hedges"], 0)
+        self.assertEqual(hedger.stats()["thresholds_ms"], {})
+
+    def test_slow_call_hedged(self):
+        hedger = RequestHedger(percentile=95, max_ratio=0.05)
+        self._warm(hedger)
+
+        started = time.monotonic()
+        self.assertEqual(hedger.call("GetRun", _Attempts(2)), 1)
+
+        self.assertLess(time.monotonic() - started, 1)
+        stats = hedger.stats()
+        self.assertEqual((stats["calls"], stats["hedges"], stats["hedge_wins"]), (21, 1, 1))
+        self.assertEqual(stats["hedge_win_rate"], 1.0)
+        self.assertIn("GetRun", stats["thresholds_ms"])
+
+    def test_primary_wins_if_hedge_is_slower(self):
+        hedger = RequestHedger()
+        self._warm(hedger)
+
+        self.assertEqual(hedger.call("GetRun", _Attempts(0.2, 2)), 0)
+
+        stats = hedger.stats()
+        self.assertEqual((stats["hedges"], stats["hedge_wins"], stats["hedge_win_rate"]), (1, 0, 0.0))
+
+    def test_budget_caps_hedges(self):
+        hedger = RequestHedger(max_ratio=0.05)
+        self._warm(hedger)
+        hedger.call("GetRun", _Attempts(0.1))
+
+        self.assertEqual(hedger.call("GetRun", _Attempts(0.1)), 0)
+
+        stats = hedger.stats()
+        self.assertEqual((stats["hedges"], stats["budget_exhausted"]), (1, 1))
+
+    def test_thresholds_are_per_api(self):
+        hedger = RequestHedger()
+        self._warm(hedger, "GetRun")
+
+        hedger.call("SearchRuns", _Attempts(0.1))
+
+        self.assertEqual(hedger.stats()["hedges"], 0)
+
+    def test_failed_hedge_waits_for_primary(self):
+        hedger = RequestHedger()
+        self._warm(hedger)
+        attempts = _Attempts(0.3)
+
+        def call():
+            attempt = attempts()
+            if attempt == 1:
+                raise MlflowSageMakerException("throttled")
+            return attempt
+
+        self.assertEqual(hedger.call("GetRun", call), 0)
+
+        stats = hedger.stats()
+        self.assertEqual((stats["hedges"], stats["hedge_wins"]), (1, 0))
+
+    def test_raises_once_every_attempt_failed(self):
+        hedger = RequestHedger()
+        self._warm(hedger)
+        attempts = _Attempts(0.3)
+
+        def call():
+            raise MlflowSageMakerException(f"attempt {attempts()} failed")
+
+        with self.assertRaisesRegex(MlflowSageMakerException, "attempt 0 failed"):
+            hedger.call("GetRun", call)
+        self.assertEqual(hedger.stats()["hedges"], 1)
+
+    def test_attempts_run_in_callers_context(self):
+        hedger = RequestHedger()
+        self._warm(hedger)
+        variable = contextvars.ContextVar("variable", default=None)
+        variable.set("caller")
+        seen = []
+        attempts = _Attempts(0.5)
+
+        def call():
+            attempts()
+            seen.append((threading.current_thread().name, variable.get()))
+
+        hedger.call("GetRun", call)
+
+        self.assertEqual([value for _, value in seen], ["caller"])
+        self.assertTrue(seen[0][0].startswith("SageMakerHedge"))
+
+
+class TestCallHedged(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, request_hedging, "_hedger_loaded", False)
+        self.addCleanup(setattr, request_hedging, "_hedger", None)
+        request_hedging._hedger_loaded = False
+        request_hedging._hedger = None
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(get_request_hedger())
+
+    def test_settings_from_env(self):
+        env = {
+            "SAGEMAKER_MLFLOW_HEDGED_READS": "true",
+            "SAGEMAKER_MLFLOW_HEDGE_PERCENTILE": "99",
+            "SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO": "0.1",
+        }
+        with patch.dict(os.environ, env):
+            hedger = get_request_hedger()
+
+        self.assertEqual((hedger._percentile, hedger._max_ratio), (99, 0.1))
+
+    def test_invalid_settings(self):
+        for name, value in (("SAGEMAKER_MLFLOW_HEDGE_PERCENTILE", "100"), ("SAGEMAKER_MLFLOW_HEDGE_MAX_RATIO", "2")):
+            request_hedging._hedger_loaded = False
+            with self.subTest(name=name), patch.dict(
+                os.environ, {"SAGEMAKER_MLFLOW_HEDGED_READS": "true", name: value}
+            ), self.assertRaises(MlflowSageMakerException):
+                get_request_hedger()
+
+    @patch.object(request_hedging, "get_request_hedger")
+    def test_only_read_calls_hedged(self, mock_get_hedger):
+        hedger = mock_get_hedger.return_value
+        call_endpoint = Mock(return_value="response")
+
+        call_hedged(call_endpoint, LogMetric, "{}")
+        call_hedged(call_endpoint, GetRun, "{}", response_proto=Mock())
+        hedger.call.assert_not_called()
+
+        hedger.call.side_effect = lambda api, call: call()
+        self.assertEqual(call_hedged(call_endpoint, GetRun, "{}", endpoint="/runs/get"), "response")
+        hedger.call.assert_called_once()
+        self.assertEqual(hedger.call.call_args.args[0], "GetRun")
+        call_endpoint.assert_called_with(GetRun, "{}", endpoint="/runs/get")
+
+    @patch.object(request_hedging, "get_request_hedger")
+    @patch.object(RegistryRestStore, "_call_endpoint", return_value="model version")
+    @patch.object(RestStore, "_call_endpoint", return_value="run")
+    def test_stores_hedge_reads(self, mock_tracking_call, mock_registry_call, mock_get_hedger):
+        mock_get_hedger.return_value.call.side_effect = lambda api, call: call()
+
+        self.assertEqual(MlflowSageMakerStore(ARN, None)._call_endpoint(GetRun, "{}"), "run")
+        registry_store = MlflowSageMakerRegistryStore(ARN)
+        self.assertEqual(registry_store._call_endpoint(GetModelVersion, "{}"), "model version")
+
+        self.assertEqual(
+            [c.args[0] for c in mock_get_hedger.return_value.call.call_args_list], ["GetRun", "GetModelVersion"]
+        )
+        mock_tracking_call.assert_called_once_with(GetRun, "{}")
+        mock_registry_call.assert_called_once_with(GetModelVersion, "{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+from urllib3.util.retry import RequestHistory, Retry
+
+from sagemaker_mlflow import request_rate_limiter
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.request_rate_limiter import (
+    OPERATION_READ,
+    OPERATION_SEARCH,
+    OPERATION_WRITE,
+    AdaptiveTokenBucket,
+    RequestRateLimiter,
+    get_request_rate_limiter,
+    is_throttled,
+    operation_class,
+    parse_rate_limits,
+)
+
+URL = "https://t-xyz.us-west-2.experiments.sagemaker.aws/api/2.0/mlflow"
+
+
+class _Clock:
+    """Monotonic clock moved by the test, or the real one while ``now`` is None."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return time.monotonic() if self.now is None else self.now
+
+
+def _response(status=200, headers=None, request=None, history=()):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response.request = request
+    response.raw = Mock(retries=Retry(total=3, history=tuple(history)))
+    return response
+
+
+class TestOperationClass(unittest.TestCase):
+    def test_classes(self):
+        self.assertEqual(operation_class("GET", URL + "/runs/get?run_id=1"), OPERATION_READ)
+        self.assertEqual(operation_class("POST", URL + "/runs/log-metric"), OPERATION_WRITE)
+        self.assertEqual(operation_class("DELETE", URL + "/runs/delete"), OPERATION_WRITE)
+        self.assertEqual(operation_class("POST", URL + "/runs/search"), OPERATION_SEARCH)
+        self.assertEqual(operation_class("GET", URL + "/model-versions/search?filter=x"), OPERATION_SEARCH)
+
+    def test_is_throttled(self):
+        self.assertTrue(is_throttled(_response(429)))
+        self.assertTrue(is_throttled(_response(400, {"x-amzn-ErrorType": "ThrottlingException:http://"})))
+        self.assertFalse(is_throttled(_response(400, {"x-amzn-ErrorType": "ValidationException"})))
+        self.assertFalse(is_throttled(_response(503)))
+
+
+class TestParseRateLimits(unittest.TestCase):
+    def test_rules(self):
+        self.assertEqual(
+            parse_rate_limits("*=50, search=5,Example.com:443/write=20,"),
+            {("*", "*"): 50.0, ("*", "search"): 5.0, ("example.com:443", "write"): 20.0},
+        )
+
+    def test_invalid_rules(self):
+        for value in ("50", "list=5", "search=fast", "search=0"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_rate_limits(value)
+
+    def test_env(self):
+        self.addCleanup(setattr, request_rate_limiter, "_limiter_loaded", False)
+        for value, expected in (("", type(None)), ("*=5", RequestRateLimiter)):
+            request_rate_limiter._limiter_loaded = False
+            with patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS": value}):
+                self.assertIsInstance(get_request_rate_limiter(), expected)
+
+        request_rate_limiter._limiter_loaded = False
+        with patch.dict(os.environ, {"SAGEMAKER_MLFLOW_REQUEST_RATE_LIMITS": "search"}):
+            with self.assertRaises(MlflowSageMakerException):
+                get_request_rate_limiter()
+
+
+class TestAdaptiveTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        # Only the module's clock: condition waits keep the real one.
+        patcher = patch.object(request_rate_limiter, "time", Mock(wraps=time, monotonic=self.clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rate_is_enforced(self):
+        self.clock.now = None
+        bucket = AdaptiveTokenBucket(20)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        # The first request is let through at once, the other four a twentieth of a second apart.
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+        self.assertGreater(bucket.stats()["throttled_waits"], 0)
+
+    def test_throttling_lowers_rate_once_per_round(self):
+        bucket = AdaptiveTokenBucket(10)
+        in_flight = [bucket.acquire() for _ in range(1)]
+        self.clock.now += 1
+        in_flight += [bucket.acquire() for _ in range(3)]
+
+        for sent_at in in_flight:
+            bucket.record_response(sent_at, throttled=True)
+        self.assertEqual(bucket.rate, 5)
+
+        self.clock.now += 0.5
+        bucket.record_response(bucket.acquire(), throttled=True)
+        self.assertAlmostEqual(bucket.rate, (5 + 0.5 * 10 / 30) / 2)
+        self.assertEqual(bucket.stats()["throttled"], 5)
+
+    def test_rate_recovers_and_has_a_floor(self):
+        bucket = AdaptiveTokenBucket(3)
+        for _ in range(10):
+            self.clock.now += 2
+            bucket.record_response(bucket.acquire(), throttled=True)
+        self.assertEqual(bucket.rate, 0.5)
+
+        self.clock.now += 5
+        self.assertAlmostEqual(bucket.rate, 1.0)
+        self.clock.now += 60
+        self.assertEqual(bucket.rate, 3)
+
+    def test_retry_after_pauses_requests(self):
+        bucket = AdaptiveTokenBucket(1000)
+        bucket.record_response(bucket.acquire(), throttled=True, retry_after=2)
+        released = threading.Event()
+        waiter = threading.Thread(target=lambda: (bucket.acquire(), released.set()))
+        waiter.start()
+        self.assertFalse(released.wait(0.1))
+
+        self.clock.now += 2
+        self.assertTrue(released.wait(5))
+        waiter.join(5)
+
+
+class TestRequestRateLimiter(unittest.TestCase):
+    def _request(self, method, path):
+        return requests.Request(method, URL + path).prepare()
+
+    def test_most_specific_rule_applies(self):
+        host = URL.split("/")[2]
+        limiter = RequestRateLimiter(parse_rate_limits(f"search=5,{host}/write=20,*=50"))
+
+        for method, path in (("POST", "/runs/search"), ("POST", "/runs/log-metric"), ("GET", "/runs/get")):
+            limiter.acquire(self._request(method, path))
+        limiter.acquire(requests.Request("POST", "https://other.com/runs/log-metric").prepare())
+
+        stats = limiter.stats()
+        self.assertEqual(
+            {key: bucket["max_rate_per_second"] for key, bucket in stats.items()},
+            {f"{host}/search": 5, f"{host}/write": 20, f"{host}/read": 50, "other.com/write": 50},
+        )
+
+    def test_uncovered_requests_not_limited(self):
+        limiter = RequestRateLimiter(parse_rate_limits("search=5"))
+        request = self._request("GET", "/runs/get")
+
+        limiter.acquire(request)
+
+        self.assertEqual(limiter.stats(), {})
+        self.assertIs(limiter.record_response(_response(429, request=request)).request, request)
+
+    def test_throttled_responses_adapt_bucket(self):
+        limiter = RequestRateLimiter(parse_rate_limits("*=100"))
+        first, second = self._request("POST", "/runs/log-metric"), self._request("POST", "/runs/log-batch")
+        limiter.acquire(first)
+        limiter.record_response(_response(429, {"Retry-After": "0"}, first))
+        limiter.acquire(second)
+        retried = [RequestHistory("POST", URL, None, 429, None)]
+        limiter.record_response(_response(200, request=second, history=retried))
+        limiter.record_response(_response(200, request=second))
+
+        bucket = next(iter(limiter.stats().values()))
+        self.assertEqual(bucket["throttled"], 2)
+        self.assertLess(bucket["rate_per_second"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
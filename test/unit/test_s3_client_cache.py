@@ -0,0 +1,75 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from mlflow.store.artifact import s3_artifact_repo
+
+from sagemaker_mlflow.s3_client_cache import S3ClientCache, get_s3_client_cache
+
+
+class TestS3ClientCache(TestCase):
+    def setUp(self):
+        config_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(config_dir.cleanup)
+        self.credentials_file = os.path.join(config_dir.name, "credentials")
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "AWS_ACCESS_KEY_ID": "AKID",
+                "AWS_SECRET_ACCESS_KEY": "secret",
+                "AWS_SHARED_CREDENTIALS_FILE": self.credentials_file,
+                "AWS_CONFIG_FILE": os.path.join(config_dir.name, "config"),
+                "AWS_DEFAULT_REGION": "us-west-2",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("MLFLOW_S3_ENDPOINT_URL", None)
+        s3_artifact_repo._cached_get_s3_client.cache_clear()
+        self.addCleanup(s3_artifact_repo._cached_get_s3_client.cache_clear)
+
+    def test_same_settings_share_a_client(self):
+        cache = S3ClientCache()
+        client = cache.get_client()
+        self.assertIs(cache.get_client(), client)
+        self.assertEqual(cache.stats(), {"clients": 1, "hits": 1, "misses": 1})
+
+    def test_shares_mlflows_clients(self):
+        client = S3ClientCache().get_client(region_name="eu-west-1")
+        self.assertIs(s3_artifact_repo._get_s3_client(region_name="eu-west-1"), client)
+        self.assertEqual(client.meta.region_name, "eu-west-1")
+
+    def test_client_is_configured_by_mlflow(self):
+        with mock.patch.dict(os.environ, {"MLFLOW_S3_ENDPOINT_URL": "http://localhost:9000"}):
+            client = S3ClientCache().get_client()
+        self.assertEqual(client.meta.endpoint_url, "http://localhost:9000")
+
+    def test_endpoint_and_region_are_part_of_the_key(self):
+        cache = S3ClientCache()
+        default = cache.get_client()
+        self.assertIsNot(cache.get_client(region_name="eu-west-1"), default)
+        self.assertIsNot(cache.get_client(s3_endpoint_url="http://localhost:9000"), default)
+        self.assertEqual(cache.stats()["clients"], 3)
+
+    def test_rotated_credentials_get_a_new_client(self):
+        cache = S3ClientCache()
+        explicit = cache.get_client(access_key_id="AKID", secret_access_key="old")
+        self.assertIsNot(cache.get_client(access_key_id="AKID", secret_access_key="new"), explicit)
+
+        ambient = cache.get_client()
+        with mock.patch.dict(os.environ, {"AWS_SESSION_TOKEN": "rotated"}):
+            self.assertIsNot(cache.get_client(), ambient)
+
+        ambient = cache.get_client()
+        with open(self.credentials_file, "w") as f:
+            f.write("[default]\n")
+        self.assertIsNot(cache.get_client(), ambient)
+
+    def test_clear(self):
+        cache = S3ClientCache()
+        client = cache.get_client()
+        cache.clear()
+        self.assertIsNot(cache.get_client(), client)
+
+    def test_process_wide_cache(self):
+        self.assertIs(get_s3_client_cache(), get_s3_client_cache())
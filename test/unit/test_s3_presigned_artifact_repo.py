@@ -11,13 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import asyncio
+import hashlib
+import io
+import json
 import os
+import shutil
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock, TestCase
 
+from mlflow.entities import FileInfo
+from mlflow.store.artifact import artifact_repo
 from mlflow.utils import rest_utils
 
+from sagemaker_mlflow.artifact_packing import PACK_DIR_NAME, pack_files
+from sagemaker_mlflow.bandwidth_limiter import BandwidthLimiter
+from sagemaker_mlflow.background_uploads import BackgroundUploadError, BackgroundUploader
+from sagemaker_mlflow.download_cache import DownloadCache
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.s3_client_cache import S3ClientCache
 from sagemaker_mlflow.s3_presigned_artifact_repo import (
     S3PresignedArtifactRepository,
     _SAGEMAKER_PRESIGNED_URL_UPLOAD_ENV_VAR,
@@ -29,6 +43,7 @@ TEST_TRACKING_URL = "https://us-west-2.experiments.sagemaker.aws"
 TEST_PRESIGNED_URL = "https://test-bucket.s3.amazonaws.com/presigned-put?X-Amz-Signature=abc"
 
 MODULE = "sagemaker_mlflow.s3_presigned_artifact_repo"
+PUT_REQUEST = "sagemaker_mlflow.upload_connection_pool.UploadConnectionPool.request"
 
 
 def _mock_response(status_code=200, json_data=None):
@@ -91,6 +106,25 @@ class TestFeatureFlagAndInit(TestCase):
             repo.log_artifact("/tmp/model.pkl")
             mock_parent.assert_called_once()
 
+    def test_size_settings_accept_units(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_ARCHIVE_BYTES": "8MB"}):
+            repo = _create_repo()
+        self.assertEqual(repo._pack_archive_bytes, 8 * 1024 * 1024)
+
+    def test_invalid_settings_raise(self):
+        for env_var, value in (
+            ("SAGEMAKER_PRESIGNED_URL_PREFETCH_DEPTH", "two"),
+            ("SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD", "1 megabyte"),
+        ):
+            with self.subTest(env_var=env_var), mock.patch.dict(os.environ, {env_var: value}):
+                with self.assertRaisesRegex(MlflowSageMakerException, f"Invalid {env_var}"):
+                    _create_repo()
+
+        repo = _create_repo()
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_MAX_WORKERS": "many"}):
+            with self.assertRaises(MlflowSageMakerException):
+                repo.max_workers
+
 
 class TestRunIdExtraction(TestCase):
     """Tests #11-14: run_id extraction from artifact URI."""
@@ -141,11 +175,11 @@ class TestPresignedUploadHappyPath(TestCase):
     def setUp(self):
         self.repo = _create_repo()
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_presigned_upload_happy_path(self, mock_get_creds, mock_http, mock_cloud):
-        """#2: Mock server returns URL → file PUT uploaded via cloud_storage_http_request."""
+        """#2: Mock server returns URL → file PUT uploaded via the upload connection pool."""
         mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
         mock_http.return_value = _mock_response()
         mock_cloud.return_value = _mock_response()
@@ -168,7 +202,7 @@ class TestPresignedUploadHappyPath(TestCase):
         finally:
             os.unlink(tmp_path)
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_presigned_upload_streams_file(self, mock_get_creds, mock_http, mock_cloud):
@@ -191,7 +225,7 @@ class TestPresignedUploadHappyPath(TestCase):
         finally:
             os.unlink(tmp_path)
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_presigned_upload_with_artifact_path(self, mock_get_creds, mock_http, mock_cloud):
@@ -214,7 +248,7 @@ class TestPresignedUploadHappyPath(TestCase):
         finally:
             os.unlink(tmp_path)
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_presigned_upload_includes_headers(self, mock_get_creds, mock_http, mock_cloud):
@@ -307,7 +341,7 @@ class TestTransientFailures(TestCase):
         finally:
             os.unlink(tmp_path)
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_put_failure_raises(self, mock_get_creds, mock_http, mock_cloud):
@@ -343,7 +377,7 @@ class TestDirectoryUploads(TestCase):
             repo.log_artifacts("/tmp/some_dir", "output")
             mock_parent.assert_called_once_with("/tmp/some_dir", "output")
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_presigned_upload_directory(self, mock_get_creds, mock_http, mock_cloud):
@@ -370,7 +404,7 @@ class TestDirectoryUploads(TestCase):
             ["output/file1.txt", "output/file2.txt", "output/file3.txt"],
         )
 
-    @mock.patch(f"{MODULE}.cloud_storage_http_request")
+    @mock.patch(PUT_REQUEST)
     @mock.patch(f"{MODULE}.rest_utils.http_request")
     @mock.patch(f"{MODULE}._get_host_creds")
     def test_log_artifacts_failure_propagates(
@@ -389,5 +423,946 @@ class TestDirectoryUploads(TestCase):
                 self.repo.log_artifacts(tmp_dir)
 
 
+class TestPresignedUrlReuse(TestCase):
+    """Presigned URLs are prefetched for directories and reused on retry."""
+
+    def setUp(self):
+        self.repo = _create_repo()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_retry_reuses_url_after_failed_put(self, mock_get_creds, mock_http, mock_cloud):
+        """A failed PUT keeps the URL; retrying the same path does not request a new one."""
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.side_effect = [Exception("Connection reset"), _mock_response()]
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pkl") as f:
+            f.write(b"data")
+            tmp_path = f.name
+
+        try:
+            with self.assertRaises(Exception):
+                self.repo.log_artifact(tmp_path)
+            self.repo.log_artifact(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+
+        self.assertEqual(mock_http.call_count, 1)
+        self.assertEqual(mock_cloud.call_count, 2)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_successful_put_releases_url(self, mock_get_creds, mock_http, mock_cloud):
+        """After a successful PUT a later upload of the same path fetches a new URL."""
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pkl") as f:
+            f.write(b"data")
+            tmp_path = f.name
+
+        try:
+            self.repo.log_artifact(tmp_path)
+            self.repo.log_artifact(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+
+        self.assertEqual(mock_http.call_count, 2)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_directory_upload_prefetches_urls(self, mock_get_creds, mock_http, mock_cloud):
+        """Queued files have their URLs requested before their upload starts."""
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ["a.txt", "b.txt", "c.txt"]:
+                with open(os.path.join(tmp_dir, name), "w") as f:
+                    f.write("content")
+
+            with mock.patch.object(self.repo._url_broker, "prefetch", wraps=self.repo._url_broker.prefetch) as spy:
+                self.repo.log_artifacts(tmp_dir, "output")
+
+        prefetched = {path for call in spy.call_args_list for path in call[0][0]}
+        self.assertEqual(len(prefetched), 2)
+        self.assertTrue(all(path.startswith("output/") for path in prefetched))
+        self.assertEqual(mock_http.call_count, 3)
+        self.assertEqual(mock_cloud.call_count, 3)
+
+
+class TestThrottledUploads(TestCase):
+    """S3 throttling on the presigned PUT is retried instead of failing the upload."""
+
+    def setUp(self):
+        self.repo = _create_repo()
+
+    @mock.patch("sagemaker_mlflow.upload_scheduler.time.sleep")
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_put_503_retried_with_same_url(self, mock_get_creds, mock_http, mock_cloud, mock_sleep):
+        """503 SlowDown → PUT retried, the presigned URL is requested once."""
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        throttled = _mock_response(status_code=503)
+        throttled.headers = {}
+        mock_cloud.side_effect = [throttled, _mock_response()]
+        throttle_events = self.repo.get_upload_stats()["throttle_events"]
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pkl") as f:
+            f.write(b"data")
+            tmp_path = f.name
+
+        try:
+            self.repo.log_artifact(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+
+        self.assertEqual(mock_http.call_count, 1)
+        self.assertEqual(mock_cloud.call_count, 2)
+        self.assertEqual(self.repo.get_upload_stats()["throttle_events"], throttle_events + 1)
+
+
+class TestIncrementalUploads(TestCase):
+    """Incremental mode skips files unchanged since their last upload."""
+
+    def setUp(self):
+        self._manifest_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._manifest_dir.cleanup)
+        self.repo = self._create_incremental_repo()
+
+    def _create_incremental_repo(self):
+        env = {
+            "SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL": "true",
+            "SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR": self._manifest_dir.name,
+        }
+        with mock.patch.dict(os.environ, env):
+            return _create_repo()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_only_changed_files_reuploaded(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ["a.txt", "b.txt", "c.txt"]:
+                with open(os.path.join(tmp_dir, name), "w") as f:
+                    f.write(name)
+
+            self.repo.log_artifacts(tmp_dir, "ckpt")
+            self.assertEqual(mock_cloud.call_count, 3)
+
+            with open(os.path.join(tmp_dir, "b.txt"), "w") as f:
+                f.write("modified")
+            # A fresh repository (as mlflow creates per call) reads the saved manifest.
+            self._create_incremental_repo().log_artifacts(tmp_dir, "ckpt")
+
+        self.assertEqual(mock_cloud.call_count, 4)
+        self.assertEqual(mock_http.call_args[1]["json"]["path"], "ckpt/b.txt")
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_failed_upload_not_recorded(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.side_effect = [Exception("Connection reset"), _mock_response()]
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pkl") as f:
+            f.write(b"data")
+            tmp_path = f.name
+
+        try:
+            with self.assertRaises(Exception):
+                self.repo.log_artifact(tmp_path)
+            self.repo.log_artifact(tmp_path)
+            self.repo.log_artifact(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+
+        self.assertEqual(mock_cloud.call_count, 2)
+
+
+class TestSmallFilePacking(TestCase):
+    """Packing mode uploads small files as archives plus an index."""
+
+    def setUp(self):
+        env = {
+            "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_SMALL_FILES": "true",
+            "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD": "100",
+        }
+        with mock.patch.dict(os.environ, env):
+            self.repo = _create_repo()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_small_files_packed(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "shards"))
+            for i in range(20):
+                with open(os.path.join(tmp_dir, "shards", f"{i}.txt"), "w") as f:
+                    f.write("small")
+            with open(os.path.join(tmp_dir, "weights.bin"), "wb") as f:
+                f.write(b"x" * 1000)
+
+            with mock.patch.object(self.repo, "_get_s3_client"):
+                self.repo.log_artifacts(tmp_dir, "model")
+
+        paths_sent = [call[1]["json"]["path"] for call in mock_http.call_args_list]
+        self.assertEqual(len(paths_sent), 3)
+        self.assertIn("model/weights.bin", paths_sent)
+        self.assertTrue(paths_sent[-1].startswith("model/.sagemaker-mlflow-packs/index-"))
+        self.assertTrue(any(path.startswith("model/.sagemaker-mlflow-packs/pack-") for path in paths_sent))
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_unchanged_large_files_skipped_when_incremental(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.side_effect = _reading_put()
+
+        with tempfile.TemporaryDirectory() as tmp_dir, tempfile.TemporaryDirectory() as manifest_dir:
+            env = {
+                "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_SMALL_FILES": "true",
+                "SAGEMAKER_PRESIGNED_URL_UPLOAD_PACK_FILE_THRESHOLD": "100",
+                "SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL": "true",
+                "SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR": manifest_dir,
+            }
+            with mock.patch.dict(os.environ, env):
+                self.repo = _create_repo()
+            with open(os.path.join(tmp_dir, "big.bin"), "wb") as f:
+                f.write(b"x" * 1000)
+            for epoch in range(2):
+                for i in range(2):
+                    with open(os.path.join(tmp_dir, f"{i}.txt"), "w") as f:
+                        f.write(f"epoch {epoch}")
+                with mock.patch.object(self.repo, "_get_s3_client"):
+                    self.repo.log_artifacts(tmp_dir, "model")
+            entry = self.repo._get_manifest().get("model/big.bin")
+
+        paths_sent = [call[1]["json"]["path"] for call in mock_http.call_args_list]
+        self.assertEqual(paths_sent.count("model/big.bin"), 1)
+        self.assertEqual(len([path for path in paths_sent if "/index-" in path]), 2)
+        self.assertEqual(entry.sha256, hashlib.sha256(b"x" * 1000).hexdigest())
+
+    def test_relog_supersedes_earlier_pack(self):
+        earlier_index = {
+            "version": 1,
+            "archives": ["pack-1-00000.tar", "pack-1-00001.tar"],
+            "files": {"0.txt": [0, 512, 5], "old.txt": [1, 512, 3]},
+        }
+        keys = ["0.txt", "1.txt", ".sagemaker-mlflow-packs/index-1.json", ".sagemaker-mlflow-packs/pack-1-00000.tar"]
+        s3_client = mock.Mock()
+        s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": f"123/abc456/artifacts/model/{key}"} for key in keys]}
+        ]
+        index_body = mock.Mock()
+        index_body.read.return_value = json.dumps(earlier_index).encode()
+        s3_client.get_object.return_value = {"Body": index_body}
+        s3_client.delete_objects.return_value = {}
+        uploaded = {}
+
+        def upload_selected(uploads, upload_paths, manifest_entries):
+            for local_file, upload_path in zip((upload[0] for upload in uploads), upload_paths):
+                with open(local_file, "rb") as f:
+                    uploaded[upload_path] = f.read()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("0.txt", "2.txt"):
+                with open(os.path.join(tmp_dir, name), "w") as f:
+                    f.write("small")
+            with mock.patch.object(self.repo, "_get_s3_client", return_value=s3_client), mock.patch.object(
+                self.repo, "_upload_selected", side_effect=upload_selected
+            ):
+                self.repo.log_artifacts(tmp_dir, "model")
+
+        index_name = next(path for path in uploaded if "/index-" in path)
+        index = json.loads(uploaded[index_name])
+        self.assertEqual(set(index["files"]), {"0.txt", "2.txt", "old.txt"})
+        self.assertEqual(index["archives"][index["files"]["old.txt"][0]], "pack-1-00001.tar")
+        deleted = [obj["Key"] for obj in s3_client.delete_objects.call_args[1]["Delete"]["Objects"]]
+        self.assertEqual(
+            deleted,
+            [
+                "123/abc456/artifacts/model/.sagemaker-mlflow-packs/index-1.json",
+                "123/abc456/artifacts/model/.sagemaker-mlflow-packs/pack-1-00000.tar",
+                "123/abc456/artifacts/model/0.txt",
+            ],
+        )
+
+    @mock.patch(f"{MODULE}.S3ArtifactRepository.list_artifacts")
+    def test_download_packed_file_uses_ranged_read(self, mock_list):
+        from mlflow.entities import FileInfo
+
+        index = {"version": 1, "archives": ["pack-1-00000.tar"], "files": {"shards/0.txt": [0, 512, 5]}}
+        mock_list.side_effect = lambda path: (
+            [FileInfo(f"{path}/index-1.json", False, 10)] if path == "model/.sagemaker-mlflow-packs" else []
+        )
+        s3_client = mock.Mock()
+        index_body = mock.Mock()
+        index_body.read.return_value = json.dumps(index).encode()
+        archive_body = mock.Mock()
+        archive_body.iter_chunks.return_value = [b"small"]
+        s3_client.get_object.side_effect = [{"Body": index_body}, {"Body": archive_body}]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_path = os.path.join(tmp_dir, "0.txt")
+            with mock.patch.object(self.repo, "_get_s3_client", return_value=s3_client):
+                found = self.repo._download_packed_file("model/shards/0.txt", local_path)
+            with open(local_path, "rb") as f:
+                content = f.read()
+
+        self.assertTrue(found)
+        self.assertEqual(content, b"small")
+        archive_call = s3_client.get_object.call_args_list[1][1]
+        self.assertEqual(archive_call["Key"], "123/abc456/artifacts/model/.sagemaker-mlflow-packs/pack-1-00000.tar")
+        self.assertEqual(archive_call["Range"], "bytes=512-516")
+
+    @mock.patch(f"{MODULE}.S3ArtifactRepository.list_artifacts", return_value=[])
+    def test_download_packed_file_not_found(self, mock_list):
+        with mock.patch.object(self.repo, "_get_s3_client"):
+            self.assertFalse(self.repo._download_packed_file("model/shards/0.txt", "/tmp/unused"))
+        self.assertEqual(
+            [call[0][0] for call in mock_list.call_args_list],
+            ["model/shards/.sagemaker-mlflow-packs", "model/.sagemaker-mlflow-packs", ".sagemaker-mlflow-packs"],
+        )
+
+
+class TestBackgroundUploads(TestCase):
+    """Async mode returns futures and uploads staged copies in the background."""
+
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_PRESIGNED_URL_UPLOAD_ASYNC": "true"}):
+            self.repo = _create_repo()
+        self.uploader = BackgroundUploader()
+        patcher = mock.patch(f"{MODULE}.get_background_uploader", return_value=self.uploader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_log_artifact_returns_before_upload(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_file = os.path.join(tmp_dir, "model.pkl")
+            with open(local_file, "wb") as f:
+                f.write(b"data")
+            self.assertIsNone(self.repo.log_artifact(local_file, "models"))
+            os.remove(local_file)
+            self.repo.wait_all()
+
+        self.assertEqual(mock_http.call_args[1]["json"]["path"], "models/model.pkl")
+        self.assertEqual(mock_http.call_args[1]["json"]["run_id"], "abc456")
+        mock_cloud.assert_called_once()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_log_artifact_async_returns_future(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_cloud.return_value = _mock_response()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_file = os.path.join(tmp_dir, "model.pkl")
+            with open(local_file, "wb") as f:
+                f.write(b"data")
+            future = self.repo.log_artifact_async(local_file, "models")
+            os.remove(local_file)
+            future.result(5)
+
+        self.assertTrue(future.done())
+        self.assertEqual(mock_http.call_args[1]["json"]["path"], "models/model.pkl")
+        self.assertEqual(mock_http.call_args[1]["json"]["run_id"], "abc456")
+        mock_cloud.assert_called_once()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_log_artifacts_failure_raised_by_wait_all(self, mock_get_creds, mock_http, mock_cloud):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response(status_code=403)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "a.txt"), "w") as f:
+                f.write("a")
+            self.repo.log_artifacts(tmp_dir, "ckpt")
+
+        with self.assertRaises(BackgroundUploadError):
+            self.repo.wait_all()
+        mock_cloud.assert_not_called()
+
+
+def _reading_put(etag=None):
+    """PUT side effect that consumes the body, as the HTTP client would."""
+
+    def put(method, url, data=None, headers=None):
+        while data.read(4096):
+            pass
+        response = _mock_response()
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    return put
+
+
+class TestChecksumVerification(TestCase):
+    """Checksums are computed while the body streams and checked against the ETag."""
+
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_PRESIGNED_URL_UPLOAD_VERIFY_CHECKSUM": "true"}):
+            self.repo = _create_repo()
+
+    def _log(self, content):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            local_file = os.path.join(tmp_dir, "model.pkl")
+            with open(local_file, "wb") as f:
+                f.write(content)
+            self.repo.log_artifact(local_file)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_matching_etag_accepted(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = _reading_put(f'"{hashlib.md5(b"model_data").hexdigest()}"')
+
+        self._log(b"model_data")
+
+        mock_put.assert_called_once()
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_mismatched_etag_raises(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = _reading_put('"00000000000000000000000000000000"')
+
+        with self.assertRaisesRegex(Exception, "integrity check"):
+            self._log(b"model_data")
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_incremental_new_file_hashed_during_upload(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = _reading_put()
+
+        with tempfile.TemporaryDirectory() as manifest_dir:
+            env = {
+                "SAGEMAKER_PRESIGNED_URL_UPLOAD_INCREMENTAL": "true",
+                "SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR": manifest_dir,
+            }
+            with mock.patch.dict(os.environ, env):
+                self.repo = _create_repo()
+            with mock.patch("sagemaker_mlflow.artifact_manifest.hash_file") as mock_hash:
+                self._log(b"model_data")
+            mock_hash.assert_not_called()
+            entry = self.repo._get_manifest().get("model.pkl")
+
+        self.assertEqual(entry.sha256, hashlib.sha256(b"model_data").hexdigest())
+
+
+class TestStreamUploads(TestCase):
+    """log_artifact_from_stream uploads in-memory data without a temp file."""
+
+    def setUp(self):
+        self.repo = _create_repo()
+        self.bodies = []
+
+        def put(method, url, data=None, headers=None):
+            self.bodies.append((len(data), b"".join(bytes(chunk) for chunk in iter(lambda: data.read(3), b""))))
+            return _mock_response()
+
+        self.put = put
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_bytes_and_buffers_uploaded(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = self.put
+
+        with mock.patch(f"{MODULE}.tempfile") as mock_tempfile:
+            self.repo.log_artifact_from_stream(b"text", "a.txt", "eval")
+            self.repo.log_artifact_from_stream(memoryview(bytearray(b"image")), "b.png")
+            buffer = io.BytesIO(b"skip:payload")
+            buffer.seek(5)
+            self.repo.log_artifact_from_stream(buffer, "c.bin")
+        mock_tempfile.assert_not_called()
+
+        self.assertEqual(self.bodies, [(4, b"text"), (5, b"image"), (7, b"payload")])
+        self.assertEqual(
+            [call[1]["json"]["path"] for call in mock_http.call_args_list], ["eval/a.txt", "b.png", "c.bin"]
+        )
+
+    @mock.patch("sagemaker_mlflow.upload_scheduler.time.sleep")
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_seekable_stream_rewound_on_retry(self, mock_get_creds, mock_http, mock_put, mock_sleep):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        throttled = _mock_response(status_code=503)
+        throttled.headers = {}
+        responses = [throttled, _mock_response()]
+
+        def put(method, url, data=None, headers=None):
+            self.put(method, url, data=data, headers=headers)
+            return responses.pop(0)
+
+        mock_put.side_effect = put
+
+        with tempfile.TemporaryFile() as f:
+            f.write(b"header|body")
+            f.seek(7)
+            self.repo.log_artifact_from_stream(f, "a.bin")
+
+        self.assertEqual(self.bodies, [(4, b"body"), (4, b"body")])
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_non_seekable_stream_uploaded(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = self.put
+        stream = mock.Mock()
+        stream.seekable.return_value = False
+        stream.read.return_value = b"streamed"
+        del stream.getbuffer
+
+        self.repo.log_artifact_from_stream(stream, "a.bin")
+
+        self.assertEqual(self.bodies, [(8, b"streamed")])
+
+    def test_disabled_uploads_stream_with_s3_client(self):
+        repo = _create_repo(env_enabled=False)
+        s3_client = mock.Mock()
+        uploaded = {}
+
+        def upload_fileobj(fileobj, bucket, key, ExtraArgs=None):
+            uploaded[key] = (fileobj.read(), bucket, ExtraArgs)
+
+        s3_client.upload_fileobj.side_effect = upload_fileobj
+
+        with mock.patch.object(repo, "_get_s3_client", return_value=s3_client), mock.patch(
+            "tempfile.mkstemp"
+        ) as mock_mkstemp:
+            repo.log_artifact_from_stream(b"data", "a.txt", "eval")
+
+        mock_mkstemp.assert_not_called()
+        self.assertEqual(
+            uploaded,
+            {"123/abc456/artifacts/eval/a.txt": (b"data", "test-bucket", {"ContentType": "text/plain"})},
+        )
+
+    @unittest.skipUnless(
+        hasattr(artifact_repo, "StreamUploadMixin"), "mlflow version without StreamUploadMixin"
+    )
+    def test_is_stream_upload_mixin(self):
+        self.assertIsInstance(self.repo, artifact_repo.StreamUploadMixin)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_async_stream_uploaded(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = self.put
+
+        async def chunks():
+            for chunk in (b"as", b"ync"):
+                yield chunk
+
+        asyncio.run(self.repo.log_artifact_from_async_stream(chunks(), "a.bin"))
+
+        self.assertEqual(self.bodies, [(5, b"async")])
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_async_stream_spills_to_temp_file(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.side_effect = self.put
+
+        async def chunks():
+            for chunk in (b"abc", b"def", b"g"):
+                yield chunk
+
+        with mock.patch(f"{MODULE}._STREAM_SPOOL_BYTES", 4):
+            asyncio.run(self.repo.log_artifact_from_async_stream(chunks(), "a.bin"))
+
+        self.assertEqual(self.bodies, [(7, b"abcdefg")])
+
+
+class TestSyncArtifacts(TestCase):
+    """sync_artifacts uploads only differences and optionally deletes removed files."""
+
+    def setUp(self):
+        manifest_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(manifest_dir.cleanup)
+        self.local_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.local_dir.cleanup)
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_ARTIFACT_MANIFEST_DIR": manifest_dir.name}):
+            self.repo = _create_repo()
+            self.direct_repo = _create_repo(env_enabled=False)
+
+    def _write(self, name, content):
+        path = os.path.join(self.local_dir.name, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_sync_uploads_differences_and_deletes(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        mock_put.return_value = _mock_response()
+        self._write("step1.pt", "1")
+        self._write("shards/a.bin", "a")
+        self._write("shards/b.bin", "b")
+
+        result = self.repo.sync_artifacts(self.local_dir.name, "ckpt")
+        self.assertEqual(result, {"uploaded": 3, "unchanged": 0, "deleted": 0})
+
+        self._write("shards/a.bin", "changed")
+        self._write("step2.pt", "2")
+        os.remove(os.path.join(self.local_dir.name, "step1.pt"))
+        mock_http.reset_mock()
+        s3_client = mock.Mock()
+        with mock.patch.object(self.repo, "_get_s3_client", return_value=s3_client):
+            result = self.repo.sync_artifacts(self.local_dir.name, "ckpt", delete=True)
+
+        self.assertEqual(result, {"uploaded": 2, "unchanged": 1, "deleted": 1})
+        self.assertEqual(
+            sorted(call[1]["json"]["path"] for call in mock_http.call_args_list),
+            ["ckpt/shards/a.bin", "ckpt/step2.pt"],
+        )
+        s3_client.delete_objects.assert_called_once_with(
+            Bucket="test-bucket", Delete={"Objects": [{"Key": "123/abc456/artifacts/ckpt/step1.pt"}], "Quiet": True}
+        )
+        self.assertIsNone(self.repo._get_manifest().get("ckpt/step1.pt"))
+
+    def test_sync_without_presigned_uses_s3_client(self):
+        self._write("model.pt", "m")
+        with mock.patch.object(self.direct_repo, "_get_s3_client") as mock_client, mock.patch.object(
+            self.direct_repo, "_upload_file"
+        ) as mock_upload:
+            self.assertEqual(self.direct_repo.sync_artifacts(self.local_dir.name)["uploaded"], 1)
+            self.assertEqual(self.direct_repo.sync_artifacts(self.local_dir.name)["uploaded"], 0)
+
+        mock_upload.assert_called_once_with(
+            mock_client.return_value,
+            os.path.join(os.path.abspath(self.local_dir.name), "model.pt"),
+            "test-bucket",
+            "123/abc456/artifacts/model.pt",
+        )
+
+
+class TestBandwidthLimit(TestCase):
+    """Presigned PUT bodies draw from the shared bandwidth limiter when a rate is set."""
+
+    @mock.patch(PUT_REQUEST)
+    @mock.patch(f"{MODULE}.rest_utils.http_request")
+    @mock.patch(f"{MODULE}._get_host_creds")
+    def test_body_throttled_when_rate_set(self, mock_get_creds, mock_http, mock_put):
+        mock_get_creds.return_value = rest_utils.MlflowHostCreds(host=TEST_TRACKING_URL, auth="arn")
+        mock_http.return_value = _mock_response()
+        bodies = []
+
+        def put(method, url, data=None, headers=None):
+            bodies.append((type(data).__name__, len(data), bytes(data.read())))
+            return _mock_response()
+
+        mock_put.side_effect = put
+        repo = _create_repo()
+        repo._bandwidth_limiter = BandwidthLimiter()
+        repo.log_artifact_from_stream(b"unlimited", "a.txt")
+        repo._bandwidth_limiter.set_rate(10**9)
+        repo.log_artifact_from_stream(b"limited", "b.txt")
+
+        self.assertEqual(bodies, [("BufferReader", 9, b"unlimited"), ("ThrottledReader", 7, b"limited")])
+        self.assertEqual(repo.get_upload_stats()["bytes_sent"], 7)
+
+
+class TestTransferConfig(TestCase):
+    """Direct S3 transfers use the transfer settings from the environment."""
+
+    def test_direct_upload_uses_transfer_config(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": "3"}):
+            repo = _create_repo(env_enabled=False)
+        s3_client = mock.Mock()
+        with mock.patch(f"{MODULE}.get_s3_client_cache") as mock_cache:
+            mock_cache.return_value.get_client.return_value = s3_client
+            repo._get_s3_client().upload_file(Filename="a", Bucket="b", Key="k")
+        self.assertEqual(s3_client.upload_file.call_args.kwargs["Config"].max_concurrency, 3)
+
+    def test_no_settings_returns_plain_client(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": ""}):
+            repo = _create_repo(env_enabled=False)
+        s3_client = mock.Mock()
+        with mock.patch(f"{MODULE}.get_s3_client_cache") as mock_cache:
+            mock_cache.return_value.get_client.return_value = s3_client
+            self.assertIs(repo._get_s3_client(), s3_client)
+
+    def test_repositories_share_clients(self):
+        first = _create_repo(env_enabled=False)
+        second = _create_repo(artifact_uri="s3://test-bucket/456/def789/artifacts", env_enabled=False)
+        for repo in (first, second):
+            repo._access_key_id = "AKID"
+            repo._secret_access_key = "secret"
+            repo._session_token = None
+        with mock.patch(f"{MODULE}.get_s3_client_cache", return_value=S3ClientCache()):
+            self.assertIs(first._get_s3_client(), second._get_s3_client())
+
+    def test_clients_use_tracking_server_region(self):
+        repos = [_create_repo(env_enabled=False), _create_repo(tracking_uri="http://localhost:5000", env_enabled=False)]
+        with mock.patch(f"{MODULE}.get_s3_client_cache") as mock_cache:
+            for repo in repos:
+                repo._get_s3_client()
+        regions = [call.kwargs["region_name"] for call in mock_cache.return_value.get_client.call_args_list]
+        self.assertEqual(regions, ["us-west-2", None])
+
+    def test_invalid_settings_fail_at_construction(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE": "1KB"}):
+            with self.assertRaises(MlflowSageMakerException):
+                _create_repo(env_enabled=False)
+
+
+class TestConcurrentDownloads(TestCase):
+    """Directory downloads list once, flat, and write each file atomically."""
+
+    def setUp(self):
+        self.repo = _create_repo(env_enabled=False)
+        self.repo._bucket_owner_params = {}
+        self.s3_client = mock.Mock()
+        patcher = mock.patch.object(self.repo, "_get_s3_client", return_value=self.s3_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _list(self, *pages):
+        self.s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": f"123/abc456/artifacts/{key}", "Size": 1} for key in page]} for page in pages
+        ]
+
+    def test_flat_listing(self):
+        self._list(["model/", "model/a.bin", "model/empty/", "model/shards/"], ["model/shards/1.bin", "model/z/"])
+
+        infos = list(self.repo._iter_artifacts_recursive("model"))
+
+        self.assertEqual(
+            [(info.path, info.is_dir) for info in infos],
+            [("model/a.bin", False), ("model/empty", True), ("model/shards/1.bin", False), ("model/z", True)],
+        )
+        self.s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix="123/abc456/artifacts/model/"
+        )
+
+    def test_empty_directory(self):
+        self._list([])
+        infos = list(self.repo._iter_artifacts_recursive("model"))
+        self.assertEqual([(info.path, info.is_dir) for info in infos], [("model", True)])
+
+    def test_download_directory(self):
+        self._list(["model/a.bin", "model/sub/b.bin"])
+        self.repo.thread_pool = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.repo.thread_pool.shutdown)
+
+        def download_file(bucket, key, path, **kwargs):
+            with open(path, "w") as f:
+                f.write(key)
+
+        self.s3_client.download_file.side_effect = download_file
+        with mock.patch.object(self.repo, "_is_directory", return_value=True):
+            with tempfile.TemporaryDirectory() as dst:
+                local_path = self.repo.download_artifacts("model", dst)
+                with open(os.path.join(local_path, "sub", "b.bin")) as f:
+                    self.assertEqual(f.read(), "123/abc456/artifacts/model/sub/b.bin")
+                self.assertEqual(sorted(os.listdir(local_path)), ["a.bin", "sub"])
+
+    def test_failed_download_leaves_no_file(self):
+        def download_file(bucket, key, path, **kwargs):
+            with open(path, "w") as f:
+                f.write("trunc")
+            raise ConnectionError("reset")
+
+        self.s3_client.download_file.side_effect = download_file
+        with tempfile.TemporaryDirectory() as dst:
+            with self.assertRaises(ConnectionError):
+                self.repo._download_file("model.bin", os.path.join(dst, "model.bin"))
+            self.assertEqual(os.listdir(dst), [])
+
+    def test_max_workers_from_env(self):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_MAX_WORKERS": "48"}):
+            self.assertEqual(self.repo.max_workers, 48)
+
+
+class TestDownloadCacheIntegration(TestCase):
+    """Downloads go through the download cache when it is enabled."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dst = tmp.name
+        self.cache = DownloadCache(os.path.join(tmp.name, "cache"))
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_DOWNLOAD_CACHE_ENABLED": "true"}):
+            with mock.patch(f"{MODULE}.get_download_cache", return_value=self.cache):
+                self.repos = [_create_repo(env_enabled=False) for _ in range(2)]
+        self.s3_client = mock.Mock()
+        self.s3_client.head_object.return_value = {"ETag": '"abc"'}
+
+        def download_file(bucket, key, path, **kwargs):
+            with open(path, "w") as f:
+                f.write(key)
+
+        self.s3_client.download_file.side_effect = download_file
+        for repo in self.repos:
+            repo._bucket_owner_params = {}
+            patcher = mock.patch.object(repo, "_get_s3_client", return_value=self.s3_client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_second_download_is_served_from_cache(self):
+        for i, repo in enumerate(self.repos):
+            repo._download_file("model.bin", os.path.join(self.dst, f"{i}.bin"))
+
+        self.s3_client.download_file.assert_called_once()
+        with open(os.path.join(self.dst, "1.bin")) as f:
+            self.assertEqual(f.read(), "123/abc456/artifacts/model.bin")
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_listed_etag_avoids_head_request(self):
+        repo = self.repos[0]
+        self.s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": "123/abc456/artifacts/model/a.bin", "Size": 1, "ETag": '"listed"'}]}
+        ]
+        list(repo._iter_artifacts_recursive("model"))
+        repo._download_file("model/a.bin", os.path.join(self.dst, "a.bin"))
+        self.s3_client.head_object.assert_not_called()
+
+    def test_missing_object_bypasses_cache(self):
+        from botocore.exceptions import ClientError
+
+        self.s3_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        self.repos[0]._download_file("model.bin", os.path.join(self.dst, "a.bin"))
+        self.assertEqual(self.cache.stats(), {"hits": 0, "misses": 0, "evictions": 0})
+        self.assertTrue(os.path.exists(os.path.join(self.dst, "a.bin")))
+
+
+class TestStreamingDownloads(TestCase):
+    """iter_download_artifacts yields files as they land, in the caller's order."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.remote = os.path.join(tmp.name, "remote")
+        self.dst = os.path.join(tmp.name, "dst")
+        os.makedirs(self.dst)
+        self.repo = _create_repo(env_enabled=False)
+        self.repo.thread_pool = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.repo.thread_pool.shutdown)
+        self.downloaded = []
+
+        def download_file(remote_file_path, local_path):
+            self.downloaded.append(remote_file_path)
+            shutil.copyfile(os.path.join(self.remote, remote_file_path), local_path)
+
+        def iter_artifacts(path):
+            for root, _, files in os.walk(os.path.join(self.remote, path)):
+                for name in sorted(files):
+                    rel = os.path.relpath(os.path.join(root, name), self.remote).replace(os.sep, "/")
+                    yield FileInfo(rel, False, 1)
+
+        for name, side_effect in (("_download_file", download_file), ("_iter_artifacts_recursive", iter_artifacts)):
+            patcher = mock.patch.object(self.repo, name, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(self.repo, "_is_directory", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_remote(self, files):
+        for path, content in files.items():
+            full_path = os.path.join(self.remote, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(content)
+
+    def test_files_follow_caller_order(self):
+        self._write_remote(
+            {"model/a-00001.safetensors": "w1", "model/config.json": "{}", "model/tokenizer.model": "t", "model/x": "x"}
+        )
+
+        paths = list(
+            self.repo.iter_download_artifacts("model", self.dst, order=["*.json", "tokenizer*", "*.safetensors"])
+        )
+
+        expected = ["model/config.json", "model/tokenizer.model", "model/a-00001.safetensors", "model/x"]
+        self.assertEqual(self.downloaded, expected)
+        self.assertEqual(paths, [os.path.join(self.dst, *path.split("/")) for path in expected])
+        with open(paths[0]) as f:
+            self.assertEqual(f.read(), "{}")
+
+    def test_packed_files_come_first(self):
+        self._write_remote({"model/weights.bin": "w", "model/small.json": "individual"})
+        sources = os.path.join(self.remote, "..", "sources")
+        os.makedirs(sources)
+        for name, content in (("config.json", "packed"), ("small.json", "stale packed copy")):
+            with open(os.path.join(sources, name), "w") as f:
+                f.write(content)
+        pack_dir = os.path.join(self.remote, "model", PACK_DIR_NAME)
+        os.makedirs(pack_dir)
+        pack_files(
+            [(os.path.join(sources, name), name) for name in ("config.json", "small.json")], pack_dir, 1024 * 1024
+        )
+
+        paths = list(self.repo.iter_download_artifacts("model", self.dst))
+
+        self.assertEqual(os.path.relpath(paths[0], self.dst), os.path.join("model", "config.json"))
+        self.assertEqual(len(paths), 3)
+        self.assertFalse(os.path.exists(os.path.join(self.dst, "model", PACK_DIR_NAME)))
+        with open(os.path.join(self.dst, "model", "small.json")) as f:
+            self.assertEqual(f.read(), "individual")
+
+    def test_callback_and_failure(self):
+        self._write_remote({"model/a.json": "a", "model/b.bin": "b"})
+        received = []
+        root = self.repo.download_artifacts_streaming("model", received.append, self.dst, order=["*.json"])
+        self.assertEqual(root, os.path.join(self.dst, "model"))
+        self.assertEqual([os.path.basename(path) for path in received], ["a.json", "b.bin"])
+
+        self.repo._download_file.side_effect = ConnectionError("reset")
+        with self.assertRaises(ConnectionError):
+            list(self.repo.iter_download_artifacts("model", self.dst))
+
+
 if __name__ == "__main__":
     unittest.main()
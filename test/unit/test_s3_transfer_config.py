@@ -0,0 +1,85 @@
+import os
+from unittest import TestCase, mock
+
+from boto3.s3.transfer import TransferConfig
+
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.s3_transfer_config import ConfiguredTransferClient, load_transfer_config
+
+MODULE = "sagemaker_mlflow.s3_transfer_config"
+
+
+class TestLoadTransferConfig(TestCase):
+    def _load(self, **env):
+        with mock.patch.dict(os.environ, env, clear=True):
+            return load_transfer_config()
+
+    def test_unset_returns_none(self):
+        self.assertIsNone(self._load())
+
+    def test_all_settings(self):
+        config = self._load(
+            SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD="64MB",
+            SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE="16MB",
+            SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY="32",
+            SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH="100MB",
+            SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT="Classic",
+        )
+        self.assertEqual(config.multipart_threshold, 64 * 1024**2)
+        self.assertEqual(config.multipart_chunksize, 16 * 1024**2)
+        self.assertEqual(config.max_concurrency, 32)
+        self.assertEqual(config.max_bandwidth, 100 * 1024**2)
+        self.assertEqual(config.preferred_transfer_client, "classic")
+
+    def test_unset_settings_keep_boto3_defaults(self):
+        config = self._load(SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY="4")
+        self.assertEqual(config.multipart_chunksize, TransferConfig().multipart_chunksize)
+
+    def test_invalid_values(self):
+        cases = [
+            {"SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD": "lots"},
+            {"SAGEMAKER_MLFLOW_S3_MULTIPART_THRESHOLD": "0"},
+            {"SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE": "1MB"},
+            {"SAGEMAKER_MLFLOW_S3_MULTIPART_CHUNKSIZE": "6GB"},
+            {"SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": "0"},
+            {"SAGEMAKER_MLFLOW_S3_MAX_CONCURRENCY": "four"},
+            {"SAGEMAKER_MLFLOW_S3_MAX_BANDWIDTH": "0"},
+            {"SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT": "fast"},
+        ]
+        for env in cases:
+            with self.assertRaises(MlflowSageMakerException, msg=env):
+                self._load(**env)
+
+    def test_crt_requires_awscrt(self):
+        with mock.patch(f"{MODULE}._crt_available", return_value=False):
+            with self.assertRaisesRegex(MlflowSageMakerException, "boto3\\[crt\\]"):
+                self._load(SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT="crt")
+        with mock.patch(f"{MODULE}._crt_available", return_value=True):
+            config = self._load(SAGEMAKER_MLFLOW_S3_TRANSFER_CLIENT="crt")
+        self.assertEqual(config.preferred_transfer_client, "crt")
+
+
+class TestConfiguredTransferClient(TestCase):
+    def test_transfers_get_config(self):
+        client = mock.Mock()
+        config = TransferConfig(max_concurrency=3)
+        proxy = ConfiguredTransferClient(client, config)
+
+        proxy.upload_file(Filename="a", Bucket="b", Key="k", ExtraArgs={})
+        proxy.download_file("b", "k", "/tmp/a")
+
+        client.upload_file.assert_called_once_with(Filename="a", Bucket="b", Key="k", ExtraArgs={}, Config=config)
+        client.download_file.assert_called_once_with("b", "k", "/tmp/a", Config=config)
+
+    def test_explicit_config_wins(self):
+        client = mock.Mock()
+        proxy = ConfiguredTransferClient(client, TransferConfig())
+        other = TransferConfig(max_concurrency=1)
+        proxy.upload_fileobj(mock.Mock(), "b", "k", Config=other)
+        self.assertIs(client.upload_fileobj.call_args.kwargs["Config"], other)
+
+    def test_other_calls_pass_through(self):
+        client = mock.Mock()
+        proxy = ConfiguredTransferClient(client, TransferConfig())
+        proxy.get_object(Bucket="b", Key="k")
+        client.get_object.assert_called_once_with(Bucket="b", Key="k")
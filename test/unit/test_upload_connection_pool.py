@@ -0,0 +1,68 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sagemaker_mlflow.upload_connection_pool import UploadConnectionPool
+
+
+class _PutHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        status = 503 if self.path == "/throttled" else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestUploadConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _PutHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.pool = UploadConnectionPool(pool_maxsize=4, timeout=5)
+        self.addCleanup(self.pool.close)
+
+    def test_sequential_requests_reuse_connection(self):
+        for i in range(5):
+            response = self.pool.request("put", f"{self.url}/file{i}", data=b"data")
+            self.assertEqual(response.status_code, 200)
+
+        stats = self.pool.stats()
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connection_reuses"], 4)
+        self.assertEqual(stats["idle_connections"], 1)
+        self.assertEqual(stats["pool_maxsize"], 4)
+
+    def test_error_status_returned_without_retry(self):
+        response = self.pool.request("put", f"{self.url}/throttled", data=b"data")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.pool.stats()["connections_opened"], 1)
+        self.assertEqual(self.pool.stats()["connection_reuses"], 0)
+
+    def test_concurrent_requests_bounded_by_pool_size(self):
+        def put(i):
+            for _ in range(5):
+                self.pool.request("put", f"{self.url}/file{i}", data=b"data")
+
+        threads = [threading.Thread(target=put, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        stats = self.pool.stats()
+        self.assertLessEqual(stats["connections_opened"], 4)
+        self.assertEqual(stats["connections_opened"] + stats["connection_reuses"], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
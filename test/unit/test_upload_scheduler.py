@@ -0,0 +1,145 @@
+import os
+import threading
+import unittest
+from unittest import mock
+
+from requests.exceptions import ConnectionError
+
+from sagemaker_mlflow import upload_scheduler
+from sagemaker_mlflow.exceptions import MlflowSageMakerException
+from sagemaker_mlflow.upload_scheduler import AdaptiveUploadScheduler
+
+MODULE = "sagemaker_mlflow.upload_scheduler"
+
+
+def _response(status_code, headers=None):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@mock.patch(f"{MODULE}.time.sleep")
+class TestAdaptiveUploadScheduler(unittest.TestCase):
+
+    def test_success_grows_limit_additively(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_concurrency=8, initial_concurrency=2)
+        for _ in range(4):
+            scheduler.send(lambda: _response(200))
+
+        self.assertEqual(scheduler.concurrency_limit, 3)
+        mock_sleep.assert_not_called()
+
+    def test_limit_capped_at_max_concurrency(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_concurrency=2, initial_concurrency=2)
+        for _ in range(10):
+            scheduler.send(lambda: _response(200))
+
+        self.assertEqual(scheduler.concurrency_limit, 2)
+
+    def test_throttle_halves_limit_and_retries(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_concurrency=16, initial_concurrency=8)
+        responses = iter([_response(503), _response(200)])
+
+        response = scheduler.send(lambda: next(responses))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(scheduler.stats()["throttle_events"], 1)
+        self.assertEqual(scheduler.stats()["retries"], 1)
+        self.assertEqual(scheduler.concurrency_limit, 4)
+        mock_sleep.assert_called_once()
+
+    def test_throttle_burst_decreases_once_per_cooldown(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_concurrency=16, initial_concurrency=8, decrease_cooldown=60)
+        responses = iter([_response(503), _response(503), _response(429), _response(200)])
+
+        scheduler.send(lambda: next(responses))
+
+        self.assertEqual(scheduler.stats()["throttle_events"], 3)
+        self.assertEqual(scheduler.concurrency_limit, 4)
+
+    def test_transient_error_retried_without_decrease(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(initial_concurrency=8)
+        responses = iter([_response(500), _response(200)])
+
+        scheduler.send(lambda: next(responses))
+
+        self.assertEqual(scheduler.stats()["throttle_events"], 0)
+        self.assertEqual(scheduler.stats()["retries"], 1)
+        self.assertGreaterEqual(scheduler.concurrency_limit, 8)
+
+    def test_non_retryable_response_returned_immediately(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler()
+        send = mock.Mock(return_value=_response(403))
+
+        response = scheduler.send(send)
+
+        self.assertEqual(response.status_code, 403)
+        send.assert_called_once()
+
+    def test_last_response_returned_when_attempts_exhausted(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_attempts=3)
+        send = mock.Mock(return_value=_response(503))
+
+        response = scheduler.send(send)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(scheduler.stats()["retries"], 2)
+
+    def test_connection_error_retried_then_raised(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_attempts=2)
+        send = mock.Mock(side_effect=ConnectionError("reset"))
+
+        with self.assertRaises(ConnectionError):
+            scheduler.send(send)
+        self.assertEqual(send.call_count, 2)
+
+    def test_retry_after_header_respected(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(base_backoff=0.01)
+        responses = iter([_response(429, {"Retry-After": "3"}), _response(200)])
+
+        scheduler.send(lambda: next(responses))
+
+        self.assertEqual(mock_sleep.call_args[0][0], 3.0)
+
+    def test_in_flight_bounded_by_limit(self, mock_sleep):
+        scheduler = AdaptiveUploadScheduler(max_concurrency=2, initial_concurrency=2)
+        peak = []
+        lock = threading.Lock()
+        active = [0]
+
+        def send():
+            with lock:
+                active[0] += 1
+                peak.append(active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+            return _response(200)
+
+        threads = [threading.Thread(target=scheduler.send, args=(send,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(peak), 2)
+        self.assertEqual(scheduler.stats()["requests"], 6)
+
+
+class TestGetUploadScheduler(unittest.TestCase):
+    def test_settings_from_env(self):
+        env = {"SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_CONCURRENCY": "4", "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS": ""}
+        with mock.patch(f"{MODULE}._scheduler", None), mock.patch.dict(os.environ, env):
+            self.assertEqual(upload_scheduler.get_upload_scheduler().max_concurrency, 4)
+
+    def test_invalid_setting_raises(self):
+        env = {"SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS": "3.5"}
+        with mock.patch(f"{MODULE}._scheduler", None), mock.patch.dict(os.environ, env):
+            with self.assertRaisesRegex(MlflowSageMakerException, "SAGEMAKER_PRESIGNED_URL_UPLOAD_MAX_ATTEMPTS"):
+                upload_scheduler.get_upload_scheduler()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import importlib
+import os
+from unittest import TestCase, mock
+
+from mlflow.utils.rest_utils import MlflowHostCreds
+
+import sagemaker_mlflow
+from sagemaker_mlflow import warmup
+from sagemaker_mlflow.mlflow_sagemaker_store import MlflowSageMakerStore
+
+ARN = "arn:aws:sagemaker:us-west-2:000000000000:mlflow-tracking-server/mw"
+HOST = "https://us-west-2.experiments.sagemaker.aws"
+
+
+class TestPrewarm(TestCase):
+    def setUp(self):
+        host_creds = MlflowHostCreds(host=HOST, auth="arn", ignore_tls_verification=True)
+        patchers = {
+            "host_creds": mock.patch("sagemaker_mlflow.host_creds.get_host_creds", return_value=host_creds),
+            "auth_provider": mock.patch("sagemaker_mlflow.auth_provider.AuthProvider"),
+            "http_request": mock.patch("mlflow.utils.rest_utils.http_request"),
+        }
+        self.mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+        self.auth = self.mocks["auth_provider"].return_value._get_auth_for_arn.return_value
+
+    def test_runs_every_phase(self):
+        timings = warmup.prewarm(ARN)
+
+        self.assertEqual(list(timings), ["arn", "credentials", "connection", "total"])
+        self.mocks["host_creds"].assert_called_once_with(ARN)
+        self.mocks["auth_provider"].return_value._get_auth_for_arn.assert_called_once_with(ARN)
+        self.auth.creds.get_frozen_credentials.assert_called_once_with()
+
+    def test_request_signed_for_arn_on_default_session(self):
+        warmup.prewarm(ARN)
+
+        args, kwargs = self.mocks["http_request"].call_args
+        # The ARN's own auth signs the request, not the plugin looked up by name.
+        self.assertIsNone(args[0].auth)
+        self.assertEqual(args[0].host, HOST)
+        self.assertTrue(args[0].ignore_tls_verification)
+        self.assertEqual(args[1:], ("/api/2.0/mlflow/experiments/search", "GET"))
+        self.assertEqual(kwargs, {"params": {"max_results": 1}, "auth": self.auth})
+
+    def test_defaults_to_tracking_uri(self):
+        with mock.patch("mlflow.get_tracking_uri", return_value=ARN):
+            warmup.prewarm()
+        self.mocks["host_creds"].assert_called_once_with(ARN)
+
+    def test_background_failure_is_logged(self):
+        self.mocks["http_request"].side_effect = ConnectionError("unreachable")
+
+        with self.assertLogs("sagemaker_mlflow.warmup", level="WARNING"):
+            future = warmup.prewarm_in_background(ARN)
+            with self.assertRaises(ConnectionError):
+                future.result(timeout=5)
+
+    def test_exported_from_package(self):
+        self.assertIs(sagemaker_mlflow.prewarm, warmup.prewarm)
+        self.assertIs(sagemaker_mlflow.prewarm_in_background, warmup.prewarm_in_background)
+
+
+class TestPrewarmFromEnv(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(warmup, "_started_from_env", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_starts_once(self, prewarm_in_background):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_PREWARM": "true"}):
+            warmup.maybe_prewarm_from_env(ARN)
+            warmup.maybe_prewarm_from_env(ARN)
+        prewarm_in_background.assert_called_once_with(ARN)
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_requires_flag(self, prewarm_in_background):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_PREWARM": ""}):
+            self.assertIsNone(warmup.maybe_prewarm_from_env(ARN))
+        prewarm_in_background.assert_not_called()
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_defaults_to_tracking_uri(self, prewarm_in_background):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_PREWARM": "true", "MLFLOW_TRACKING_URI": ARN}):
+            warmup.maybe_prewarm_from_env()
+        prewarm_in_background.assert_called_once_with(ARN)
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_skips_non_arn_tracking_uri(self, prewarm_in_background):
+        env = {"SAGEMAKER_MLFLOW_PREWARM": "true", "MLFLOW_TRACKING_URI": "http://localhost:5000"}
+        with mock.patch.dict(os.environ, env):
+            self.assertIsNone(warmup.maybe_prewarm_from_env())
+        prewarm_in_background.assert_not_called()
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_started_on_plugin_import(self, prewarm_in_background):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_PREWARM": "true", "MLFLOW_TRACKING_URI": ARN}):
+            importlib.reload(sagemaker_mlflow)
+        prewarm_in_background.assert_called_once_with(ARN)
+
+    @mock.patch.object(warmup, "prewarm_in_background")
+    def test_not_started_by_tracking_store(self, prewarm_in_background):
+        with mock.patch.dict(os.environ, {"SAGEMAKER_MLFLOW_PREWARM": "true"}):
+            MlflowSageMakerStore(ARN, None)
+        prewarm_in_background.assert_not_called()